@@ -0,0 +1,35 @@
+"""make classification_tasks.texts nullable
+
+Revision ID: 3f1c2a9d8b7e
+Revises:
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c2a9d8b7e"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_tasks_table() -> bool:
+    # The table itself is created by init_db() on backend startup
+    return sa.inspect(op.get_bind()).has_table("classification_tasks")
+
+
+def upgrade() -> None:
+    # CLAIM_CHECK_MODE=broker keeps texts in the broker message only
+    if _has_tasks_table():
+        op.alter_column("classification_tasks", "texts", existing_type=sa.JSON(), nullable=True)
+
+
+def downgrade() -> None:
+    if _has_tasks_table():
+        op.execute("UPDATE classification_tasks SET texts = '[]' WHERE texts IS NULL")
+        op.alter_column("classification_tasks", "texts", existing_type=sa.JSON(), nullable=False)
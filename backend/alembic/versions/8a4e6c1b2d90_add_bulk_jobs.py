@@ -0,0 +1,64 @@
+"""add bulk_jobs and bulk chunk columns
+
+Revision ID: 8a4e6c1b2d90
+Revises: 3f1c2a9d8b7e
+Create Date: 2026-10-17 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8a4e6c1b2d90"
+down_revision: Union[str, None] = "3f1c2a9d8b7e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+task_status = sa.Enum(
+    "PENDING", "PROCESSING", "COMPLETED", "FAILED", name="taskstatus", create_type=False
+)
+
+
+def upgrade() -> None:
+    # Tables missing here are created by init_db() on backend startup
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table("bulk_jobs"):
+        op.create_table(
+            "bulk_jobs",
+            sa.Column("job_id", sa.String(), primary_key=True),
+            sa.Column("status", task_status, nullable=False),
+            sa.Column("total_texts", sa.Integer(), nullable=False),
+            sa.Column("chunk_size", sa.Integer(), nullable=False),
+            sa.Column("total_chunks", sa.Integer(), nullable=False),
+            sa.Column("completed_chunks", sa.Integer(), nullable=False),
+            sa.Column("failed_chunks", sa.Integer(), nullable=False),
+            sa.Column("error", sa.String(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+        )
+
+    if inspector.has_table("classification_tasks"):
+        columns = {c["name"] for c in inspector.get_columns("classification_tasks")}
+        if "job_id" not in columns:
+            op.add_column(
+                "classification_tasks",
+                sa.Column("job_id", sa.String(), sa.ForeignKey("bulk_jobs.job_id"), nullable=True),
+            )
+            op.create_index(
+                "ix_classification_tasks_job_id", "classification_tasks", ["job_id"]
+            )
+        if "chunk_index" not in columns:
+            op.add_column(
+                "classification_tasks", sa.Column("chunk_index", sa.Integer(), nullable=True)
+            )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_classification_tasks_job_id", table_name="classification_tasks")
+    op.drop_column("classification_tasks", "chunk_index")
+    op.drop_column("classification_tasks", "job_id")
+    op.drop_table("bulk_jobs")
@@ -0,0 +1,136 @@
+import asyncio
+import csv
+import io
+import json
+import uuid
+from collections.abc import AsyncIterator
+
+from celery import group
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..database.core import AsyncSessionFactory
+from ..models import BulkJob, ClassificationTask, TaskStatus
+from ..tasks import classify_texts
+
+
+def parse_upload(filename: str, content: bytes) -> list[str]:
+    """Texts of an uploaded CSV ("text" column or the first one) or text file (one per line)."""
+    data = content.decode("utf-8-sig")
+    if filename.lower().endswith(".csv"):
+        rows = csv.reader(io.StringIO(data))
+        header = next(rows, [])
+        column = header.index("text") if "text" in header else 0
+        return [row[column] for row in rows if len(row) > column and row[column].strip()]
+    return [line for line in data.splitlines() if line.strip()]
+
+
+async def create_bulk_job(session: AsyncSession, texts: list[str]) -> BulkJob:
+    """
+    Store a bulk job with its chunk rows in one transaction and fan the chunks out.
+
+    Every chunk is a ClassificationTask row processed by ``classify_texts``; chunk rows
+    are written with one multi-row INSERT, and the chunk tasks are published as a Celery
+    group. Completion is tracked by counters on the job row (a chord would need a
+    result backend).
+    """
+    job_id = str(uuid.uuid4())
+    size = settings.BULK_CHUNK_SIZE
+    chunks = [texts[i : i + size] for i in range(0, len(texts), size)]
+    store_texts = settings.CLAIM_CHECK_MODE == "db"
+
+    job = BulkJob(
+        job_id=job_id,
+        status=TaskStatus.PROCESSING,
+        total_texts=len(texts),
+        chunk_size=size,
+        total_chunks=len(chunks),
+        completed_chunks=0,
+        failed_chunks=0,
+    )
+    session.add(job)
+    await session.flush()
+    await session.execute(
+        insert(ClassificationTask),
+        [
+            {
+                "task_id": f"{job_id}:{index}",
+                "status": TaskStatus.PENDING,
+                "texts": chunk if store_texts else None,
+                "job_id": job_id,
+                "chunk_index": index,
+            }
+            for index, chunk in enumerate(chunks)
+        ],
+    )
+    await session.commit()
+
+    fan_out = group(
+        classify_texts.si(*([] if store_texts else [chunk])).set(task_id=f"{job_id}:{index}")
+        for index, chunk in enumerate(chunks)
+    )
+    try:
+        # Publishing through kombu blocks, so it runs in a thread
+        await asyncio.to_thread(fan_out.apply_async)
+    except Exception as e:
+        await session.execute(
+            update(BulkJob)
+            .where(BulkJob.job_id == job_id)
+            .values(status=TaskStatus.FAILED, error=f"Failed to queue chunks: {e}")
+        )
+        await session.commit()
+        raise
+
+    return job
+
+
+def job_progress(job: BulkJob) -> dict:
+    """Job status with aggregated chunk counters."""
+    finished = job.completed_chunks + job.failed_chunks
+    return {
+        "job_id": job.job_id,
+        "status": job.status,
+        "total_texts": job.total_texts,
+        "total_chunks": job.total_chunks,
+        "completed_chunks": job.completed_chunks,
+        "failed_chunks": job.failed_chunks,
+        "progress": round(finished / job.total_chunks, 4) if job.total_chunks else 1.0,
+        "error": job.error,
+        "created_at": job.created_at,
+        "updated_at": job.updated_at,
+    }
+
+
+async def iter_bulk_results(job: BulkJob) -> AsyncIterator[bytes]:
+    """
+    Stream the assembled job results as NDJSON, one line per input text in input order.
+
+    Chunk results are read with a server-side cursor, so memory does not depend on the
+    job size. Texts of failed chunks get an ``error`` line.
+    """
+    # Own session: the request session is closed once the response starts streaming
+    async with AsyncSessionFactory() as session:
+        rows = await session.stream(
+            select(
+                ClassificationTask.chunk_index,
+                ClassificationTask.status,
+                ClassificationTask.result,
+                ClassificationTask.error,
+            )
+            .where(ClassificationTask.job_id == job.job_id)
+            .order_by(ClassificationTask.chunk_index)
+            .execution_options(yield_per=50)
+        )
+        async for row in rows:
+            offset = row.chunk_index * job.chunk_size
+            if row.status == TaskStatus.COMPLETED:
+                items = [
+                    {"index": offset + i, **prediction}
+                    for i, prediction in enumerate(row.result["predictions"])
+                ]
+            else:
+                count = min(job.chunk_size, job.total_texts - offset)
+                error = row.error or "Chunk failed"
+                items = [{"index": offset + i, "error": error} for i in range(count)]
+            yield "".join(json.dumps(item, ensure_ascii=False) + "\n" for item in items).encode()
@@ -0,0 +1,178 @@
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+
+import psycopg
+from psycopg import sql
+from sqlalchemy import select
+
+from ..config import settings
+from ..database.core import AsyncSessionFactory
+from ..models import ClassificationTask, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+FINAL_STATUSES = (TaskStatus.COMPLETED, TaskStatus.FAILED)
+# Sent to subscribers after a reconnect: notifications may have been missed
+RESYNC = object()
+
+
+class TaskEventHub:
+    """
+    Fans Postgres notifications about finished tasks out to waiting clients.
+
+    One LISTEN connection per backend process serves all subscribers, so waiting
+    clients hold no pooled DB connection. The worker issues ``pg_notify`` in the
+    transaction that marks a task COMPLETED/FAILED.
+
+    Args:
+        channel: Postgres notification channel
+    """
+
+    def __init__(self, channel: str):
+        self.channel = channel
+        self.connected = False
+        self._subscribers: dict[str, set[asyncio.Queue]] = defaultdict(set)
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @contextmanager
+    def subscribe(self, task_ids: list[str]) -> Iterator[asyncio.Queue]:
+        """Queue receiving events of the given tasks until the context exits."""
+        queue: asyncio.Queue = asyncio.Queue()
+        for task_id in task_ids:
+            self._subscribers[task_id].add(queue)
+        try:
+            yield queue
+        finally:
+            for task_id in task_ids:
+                queues = self._subscribers.get(task_id)
+                if queues is not None:
+                    queues.discard(queue)
+                    if not queues:
+                        del self._subscribers[task_id]
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                conn = await psycopg.AsyncConnection.connect(
+                    host=settings.PG_HOST,
+                    port=settings.PG_PORT,
+                    user=settings.PG_USER,
+                    password=settings.PG_PASSWORD,
+                    dbname=settings.PG_DB,
+                    autocommit=True,
+                )
+                async with conn:
+                    await conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(self.channel)))
+                    self.connected = True
+                    self._broadcast(RESYNC)
+                    async for notify in conn.notifies():
+                        self._dispatch(notify.payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Task event listener disconnected: {e}")
+            self.connected = False
+            await asyncio.sleep(1)
+
+    def _dispatch(self, payload: str) -> None:
+        try:
+            event = json.loads(payload)
+        except json.JSONDecodeError:
+            logger.warning(f"Invalid task event payload: {payload!r}")
+            return
+        for queue in self._subscribers.get(event.get("task_id"), ()):
+            queue.put_nowait(event)
+
+    def _broadcast(self, event) -> None:
+        for queue in {q for queues in self._subscribers.values() for q in queues}:
+            queue.put_nowait(event)
+
+
+task_event_hub = TaskEventHub(settings.TASK_EVENTS_CHANNEL)
+
+
+async def _final_statuses(task_ids: set[str]) -> tuple[list[dict], set[str]]:
+    """Events of tasks that are already finished, and the IDs that do not exist."""
+    async with AsyncSessionFactory() as session:
+        rows = (
+            await session.execute(
+                select(ClassificationTask.task_id, ClassificationTask.status).where(
+                    ClassificationTask.task_id.in_(task_ids)
+                )
+            )
+        ).all()
+
+    events = [
+        {"task_id": row.task_id, "status": row.status.value}
+        for row in rows
+        if row.status in FINAL_STATUSES
+    ]
+    return events, task_ids - {row.task_id for row in rows}
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def task_event_stream(task_ids: list[str], timeout: float) -> AsyncIterator[str]:
+    """
+    Server-Sent Events for a set of tasks: one ``status`` event per task once it is
+    COMPLETED or FAILED, then the stream ends.
+
+    The stream subscribes before reading the current statuses, so a task finishing in
+    between is not missed. Unknown IDs get a ``not_found`` event; a ``timeout`` event
+    lists the tasks still running when ``timeout`` expires.
+    """
+    pending = set(task_ids)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+
+    with task_event_hub.subscribe(task_ids) as queue:
+        events, missing = await _final_statuses(pending)
+        for task_id in missing:
+            pending.discard(task_id)
+            yield _sse("not_found", {"task_id": task_id})
+
+        while True:
+            for event in events:
+                if event["task_id"] in pending:
+                    pending.discard(event["task_id"])
+                    yield _sse("status", event)
+            if not pending:
+                return
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                yield _sse("timeout", {"pending": sorted(pending)})
+                return
+
+            try:
+                event = await asyncio.wait_for(
+                    queue.get(), min(settings.SSE_KEEPALIVE_SECONDS, remaining)
+                )
+            except TimeoutError:
+                # Keeps proxies from closing an idle stream
+                yield ": keep-alive\n\n"
+                events = []
+                continue
+
+            if event is RESYNC:
+                events, _ = await _final_statuses(pending)
+            else:
+                events = [event]
@@ -1,10 +1,18 @@
+import asyncio
+import csv
 import os
 import uuid
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from . import schemas
+from .bulk import create_bulk_job, iter_bulk_results, job_progress, parse_upload
+from .events import task_event_stream
 from ..tasks import classify_texts
-from ..database.core import SessionFactory
-from ..models import ClassificationTask, TaskStatus
+from ..config import settings
+from ..database.core import get_async_db
+from ..models import BulkJob, ClassificationTask, TaskStatus
 
 CLASSIFIER_URL = os.getenv("CLASSIFIER_URL", "http://classifier:8090")
 
@@ -16,54 +24,86 @@ router = APIRouter()
     summary="Submit classification task",
     description="Отправляет тексты на классификацию (асинхронно через очередь)",
 )
-def submit_classification(request: schemas.PredictRequest):
+async def submit_classification(
+    request: schemas.PredictRequest, session: AsyncSession = Depends(get_async_db)
+):
     """Producer: кладёт задачу в очередь, сразу возвращает task_id."""
     task_id = str(uuid.uuid4())
+    # Claim check: тексты идут либо через БД, либо через брокер, но не дважды
+    store_texts = settings.CLAIM_CHECK_MODE == "db"
 
-    # 1. Сохраняем запись в БД со статусом PENDING
-    session = SessionFactory()
-    try:
-        db_task = ClassificationTask(
+    # 1. Сохраняем запись в БД со статусом PENDING (один INSERT без ORM flush)
+    await session.execute(
+        insert(ClassificationTask).values(
             task_id=task_id,
             status=TaskStatus.PENDING,
-            texts=request.texts,
+            texts=request.texts if store_texts else None,
         )
-        session.add(db_task)
-        session.commit()
-    finally:
-        session.close()
+    )
+    await session.commit()
 
-    # 2. Отправляем задачу в RabbitMQ (НЕ ждём результат)
-    classify_texts.apply_async(args=[request.texts], task_id=task_id)
+    # 2. Отправляем задачу в RabbitMQ (НЕ ждём результат): в режиме "db"
+    # сообщение несёт только task_id, worker читает тексты из БД.
+    # Публикация в kombu блокирующая, поэтому уходит в поток
+    args = [] if store_texts else [request.texts]
+    await asyncio.to_thread(classify_texts.apply_async, args=args, task_id=task_id)
 
     # 3. Сразу возвращаем task_id клиенту
     return {"task_id": task_id, "status": "PENDING"}
 
 
+@router.get(
+    "/tasks/events",
+    summary="Wait for tasks to finish (SSE)",
+    description=(
+        "Server-Sent Events: одно событие status на задачу, когда она становится "
+        "COMPLETED или FAILED, вместо опроса GET /tasks/{task_id}"
+    ),
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def task_events(
+    ids: str = Query(..., description="ID задач через запятую"),
+    timeout: float = Query(
+        default=settings.SSE_TIMEOUT_SECONDS, gt=0, le=3600, description="Макс. время ожидания, с"
+    ),
+):
+    task_ids = list(dict.fromkeys(i.strip() for i in ids.split(",") if i.strip()))
+    if not task_ids:
+        raise HTTPException(status_code=400, detail="No task IDs")
+    if len(task_ids) > settings.SSE_MAX_TASKS:
+        raise HTTPException(
+            status_code=400, detail=f"At most {settings.SSE_MAX_TASKS} task IDs per stream"
+        )
+
+    return StreamingResponse(
+        task_event_stream(task_ids, timeout),
+        media_type="text/event-stream",
+        # nginx would otherwise buffer the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get(
     "/tasks/{task_id}",
     summary="Get task status",
     description="Получить статус и результат задачи по ID",
 )
-def get_task_status(task_id: str):
+async def get_task_status(task_id: str, session: AsyncSession = Depends(get_async_db)):
     """Backend спрашивает статус — не ждёт результата."""
-    session = SessionFactory()
-    try:
-        task = session.get(ClassificationTask, task_id)
-        if not task:
-            raise HTTPException(status_code=404, detail="Task not found")
-
-        return {
-            "task_id": task.task_id,
-            "status": task.status,
-            "texts": task.texts,
-            "result": task.result,
-            "error": task.error,
-            "created_at": task.created_at,
-            "updated_at": task.updated_at,
-        }
-    finally:
-        session.close()
+    task = await session.get(ClassificationTask, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    return {
+        "task_id": task.task_id,
+        "status": task.status,
+        "texts": task.texts,
+        "result": task.result,
+        "error": task.error,
+        "created_at": task.created_at,
+        "updated_at": task.updated_at,
+    }
 
 
 @router.get(
@@ -71,26 +111,94 @@ def get_task_status(task_id: str):
     summary="List all tasks",
     description="Получить список всех задач",
 )
-def list_tasks():
-    session = SessionFactory()
+async def list_tasks(session: AsyncSession = Depends(get_async_db)):
+    # Только нужные колонки: texts и result не читаются
+    rows = await session.execute(
+        select(
+            ClassificationTask.task_id,
+            ClassificationTask.status,
+            ClassificationTask.created_at,
+        )
+        .where(ClassificationTask.job_id.is_(None))
+        .order_by(ClassificationTask.created_at.desc())
+        .limit(50)
+    )
+
+    return [
+        {
+            "task_id": row.task_id,
+            "status": row.status,
+            "created_at": row.created_at,
+        }
+        for row in rows
+    ]
+
+
+@router.post(
+    "/bulk",
+    response_model=schemas.BulkJobResponse,
+    summary="Submit bulk job",
+    description="Большой набор текстов: делится на чанки и обрабатывается параллельно",
+)
+async def submit_bulk_job(
+    request: schemas.BulkRequest, session: AsyncSession = Depends(get_async_db)
+):
+    job = await create_bulk_job(session, request.texts)
+    return job_progress(job)
+
+
+@router.post(
+    "/bulk/upload",
+    response_model=schemas.BulkJobResponse,
+    summary="Submit bulk job from a file",
+    description="Файл .csv (колонка text или первая колонка) или текстовый файл (текст на строку)",
+)
+async def upload_bulk_job(
+    file: UploadFile = File(...), session: AsyncSession = Depends(get_async_db)
+):
     try:
-        tasks = (
-            session.query(ClassificationTask)
-            .order_by(ClassificationTask.created_at.desc())
-            .limit(50)
-            .all()
+        texts = parse_upload(file.filename or "", await file.read())
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid file: {e}")
+
+    if not texts:
+        raise HTTPException(status_code=400, detail="File contains no texts")
+    if len(texts) > settings.BULK_MAX_TEXTS:
+        raise HTTPException(
+            status_code=413, detail=f"File contains more than {settings.BULK_MAX_TEXTS} texts"
         )
 
-        return [
-            {
-                "task_id": t.task_id,
-                "status": t.status,
-                "created_at": t.created_at,
-            }
-            for t in tasks
-        ]
-    finally:
-        session.close()
+    job = await create_bulk_job(session, texts)
+    return job_progress(job)
+
+
+@router.get(
+    "/bulk/{job_id}",
+    response_model=schemas.BulkJobResponse,
+    summary="Get bulk job progress",
+    description="Получить статус и прогресс bulk-задачи",
+)
+async def get_bulk_job(job_id: str, session: AsyncSession = Depends(get_async_db)):
+    job = await session.get(BulkJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job_progress(job)
+
+
+@router.get(
+    "/bulk/{job_id}/results",
+    summary="Get bulk job results",
+    description="Результаты bulk-задачи в порядке текстов (NDJSON, одна строка на текст)",
+    response_class=StreamingResponse,
+)
+async def get_bulk_results(job_id: str, session: AsyncSession = Depends(get_async_db)):
+    job = await session.get(BulkJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.completed_chunks + job.failed_chunks < job.total_chunks:
+        raise HTTPException(status_code=409, detail="Job is not finished yet")
+
+    return StreamingResponse(iter_bulk_results(job), media_type="application/x-ndjson")
 
 
 @router.get(
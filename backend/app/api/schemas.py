@@ -1,5 +1,9 @@
+import datetime
+
 from pydantic import BaseModel, Field
 
+from ..config import settings
+
 
 class PredictRequest(BaseModel):
     """Request body for prediction endpoint."""
@@ -13,6 +17,32 @@ class PredictRequest(BaseModel):
     )
 
 
+class BulkRequest(BaseModel):
+    """Request body for bulk job endpoint."""
+
+    texts: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.BULK_MAX_TEXTS,
+        description=f"List of texts to classify (up to {settings.BULK_MAX_TEXTS} items)",
+    )
+
+
+class BulkJobResponse(BaseModel):
+    """Bulk job status with aggregated chunk progress."""
+
+    job_id: str = Field(..., description="Bulk job ID")
+    status: str = Field(..., description="PROCESSING, COMPLETED or FAILED")
+    total_texts: int = Field(..., description="Number of submitted texts")
+    total_chunks: int = Field(..., description="Number of chunk tasks")
+    completed_chunks: int = Field(..., description="Chunks classified successfully")
+    failed_chunks: int = Field(..., description="Chunks failed after all retries")
+    progress: float = Field(..., ge=0, le=1, description="Share of finished chunks")
+    error: str | None = Field(default=None, description="Job error")
+    created_at: datetime.datetime | None = None
+    updated_at: datetime.datetime | None = None
+
+
 class PredictionItem(BaseModel):
     """Single prediction result."""
 
@@ -44,3 +74,5 @@ class ModelsInfoResponse(BaseModel):
     model_available: bool = Field(..., description="Model is available")
     num_classes: int = Field(..., description="Number of classes")
     classes: list[ClassInfo] = Field(..., description="List of all classes")
+    backend: str | None = Field(default=None, description="Inference backend")
+    precision: str | None = Field(default=None, description="Numeric precision")
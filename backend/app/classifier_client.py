@@ -0,0 +1,289 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+
+import httpx
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+CLASSIFIER_URL = os.getenv("CLASSIFIER_URL", "http://classifier:8090")
+
+# Log client stats every N requests of a worker process
+STATS_LOG_EVERY = 1000
+
+
+class ClientStats:
+    """Request, connection and connect-time counters fed by the httpx trace extension."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._connect_started: dict[int, float] = {}
+        self.requests = 0
+        self.texts = 0
+        self.connections = 0
+        self.connect_seconds_total = 0.0
+
+    def trace(self, event_name: str, info: dict) -> None:
+        self._observe(event_name, threading.get_ident())
+
+    async def atrace(self, event_name: str, info: dict) -> None:
+        # Coroutines share the loop thread, so connects are keyed by task
+        self._observe(event_name, id(asyncio.current_task()))
+
+    def _observe(self, event_name: str, key: int) -> None:
+        # Only new connections emit connect_tcp events; reused ones skip them
+        if event_name == "connection.connect_tcp.started":
+            self._connect_started[key] = time.perf_counter()
+        elif event_name == "connection.connect_tcp.complete":
+            started = self._connect_started.pop(key, None)
+            if started is None:
+                return
+            with self._lock:
+                self.connections += 1
+                self.connect_seconds_total += time.perf_counter() - started
+
+    def record_request(self, n_texts: int) -> int:
+        with self._lock:
+            self.requests += 1
+            self.texts += n_texts
+            return self.requests
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "texts_per_request": round(self.texts / self.requests, 2) if self.requests else 0,
+            "connections": self.connections,
+            "reuse_rate": round(1 - self.connections / self.requests, 4) if self.requests else 0,
+            "connect_seconds_total": round(self.connect_seconds_total, 3),
+            "connect_ms_avg": (
+                round(self.connect_seconds_total / self.connections * 1000, 2)
+                if self.connections
+                else 0
+            ),
+        }
+
+
+def _client_options() -> dict:
+    max_connections = settings.CLASSIFIER_MAX_CONNECTIONS
+    max_keepalive = settings.CLASSIFIER_MAX_KEEPALIVE
+    if settings.WORKER_MODE == "async":
+        # Every task thread of the process may be waiting on the classifier at once
+        max_connections = max(max_connections, settings.WORKER_ASYNC_CONCURRENCY)
+        max_keepalive = max(max_keepalive, settings.WORKER_ASYNC_CONCURRENCY)
+
+    return {
+        "base_url": CLASSIFIER_URL,
+        "timeout": httpx.Timeout(
+            settings.CLASSIFIER_TIMEOUT, connect=settings.CLASSIFIER_CONNECT_TIMEOUT
+        ),
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=settings.CLASSIFIER_KEEPALIVE_EXPIRY,
+        ),
+        "http2": settings.CLASSIFIER_HTTP2,
+    }
+
+
+def _log_stats(n_texts: int) -> None:
+    if stats.record_request(n_texts) % STATS_LOG_EVERY == 0:
+        logger.info(f"Classifier HTTP client stats: {pool_stats()}")
+
+
+class PredictAggregator:
+    """
+    Merges texts of concurrently running tasks into shared /predict calls.
+
+    Runs on the worker's event loop. A merged call is sent when it reaches
+    ``max_texts`` or when its oldest task has waited ``max_wait_ms``; tasks are never
+    split, and each task gets back only the predictions of its own texts.
+
+    Args:
+        post: Coroutine function sending texts to /predict and returning the response JSON
+        max_texts: Max texts per merged call (the classifier accepts up to 100)
+        max_wait_ms: Max time the oldest task waits for others to join
+    """
+
+    def __init__(self, post, max_texts: int = 100, max_wait_ms: float = 20.0):
+        self.post = post
+        self.max_texts = max_texts
+        self.max_wait = max_wait_ms / 1000
+
+        self._pending: list[tuple[list[str], asyncio.Future]] = []
+        self._size = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._sending: set[asyncio.Task] = set()
+
+    async def predict(self, texts: list[str]) -> dict:
+        if len(texts) >= self.max_texts:
+            return await self.post(texts)
+
+        if self._size + len(texts) > self.max_texts:
+            self._flush()
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((texts, future))
+        self._size += len(texts)
+        if self._size >= self.max_texts:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending, self._size = self._pending, [], 0
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._send(batch))
+            self._sending.add(task)
+            task.add_done_callback(self._sending.discard)
+
+    async def _send(self, batch: list[tuple[list[str], asyncio.Future]]) -> None:
+        try:
+            result = await self.post([text for texts, _ in batch for text in texts])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        offset = 0
+        for texts, future in batch:
+            end = offset + len(texts)
+            if not future.done():
+                future.set_result({**result, "predictions": result["predictions"][offset:end]})
+            offset = end
+
+
+class AsyncLoopRunner:
+    """
+    Event loop on a background thread shared by all task threads of a worker process.
+
+    Task threads submit classifier calls as coroutines and block only on their own
+    result, while a single ``httpx.AsyncClient`` keeps all calls of the process in
+    flight over one connection pool. With ``AGGREGATE_ENABLED`` the calls of
+    concurrent tasks are merged into larger /predict batches.
+    """
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="classifier-loop", daemon=True
+        )
+        self._thread.start()
+        self.client = httpx.AsyncClient(**_client_options())
+        self.aggregator = None
+        if settings.AGGREGATE_ENABLED:
+            self.aggregator = PredictAggregator(
+                self._post,
+                max_texts=settings.AGGREGATE_MAX_TEXTS,
+                max_wait_ms=settings.AGGREGATE_MAX_WAIT_MS,
+            )
+
+    async def _post(self, texts: list[str]) -> dict:
+        response = await self.client.post(
+            "/predict", json={"texts": texts}, extensions={"trace": stats.atrace}
+        )
+        _log_stats(len(texts))
+        response.raise_for_status()
+        return response.json()
+
+    async def predict(self, texts: list[str]) -> dict:
+        if self.aggregator is not None:
+            return await self.aggregator.predict(texts)
+        return await self._post(texts)
+
+    def run(self, coro):
+        """Run a coroutine on the loop and wait for its result from the calling thread."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def close(self) -> None:
+        self.run(self.client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+_client: httpx.Client | None = None
+_runner: AsyncLoopRunner | None = None
+_lock = threading.Lock()
+stats = ClientStats()
+
+
+def _create_client() -> httpx.Client:
+    return httpx.Client(**_client_options())
+
+
+def get_client() -> httpx.Client:
+    """Long-lived client of this worker process (created lazily for solo/threads pools)."""
+    global _client
+    with _lock:
+        if _client is None:
+            _client = _create_client()
+    return _client
+
+
+def get_runner() -> AsyncLoopRunner:
+    """Event loop runner of this worker process (WORKER_MODE=async)."""
+    global _runner
+    with _lock:
+        if _runner is None:
+            _runner = AsyncLoopRunner()
+    return _runner
+
+
+def pool_stats() -> dict:
+    """Request/connect counters and current connections of this process's client."""
+    result = {"pid": os.getpid(), **stats.as_dict()}
+    client = _runner.client if _runner is not None else _client
+    # httpx does not expose its connection pool publicly
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    if pool is not None:
+        connections = pool.connections
+        result["open_connections"] = len(connections)
+        result["idle_connections"] = sum(1 for c in connections if c.is_idle())
+    return result
+
+
+def post_predict(texts: list[str]) -> dict:
+    """Call the classifier /predict endpoint over the pooled keep-alive client."""
+    if settings.WORKER_MODE == "async":
+        runner = get_runner()
+        return runner.run(runner.predict(texts))
+
+    response = get_client().post(
+        "/predict", json={"texts": texts}, extensions={"trace": stats.trace}
+    )
+    _log_stats(len(texts))
+    response.raise_for_status()
+    return response.json()
+
+
+@worker_process_init.connect
+def _open_client(**kwargs) -> None:
+    # Created after fork: connections must not be shared between processes
+    global _client
+    _client = _create_client()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _close_client(**kwargs) -> None:
+    global _client, _runner
+    if _client is None and _runner is None:
+        return
+    logger.info(f"Classifier HTTP client stats: {pool_stats()}")
+    if _client is not None:
+        _client.close()
+        _client = None
+    if _runner is not None:
+        _runner.close()
+        _runner = None
@@ -5,11 +5,16 @@ from pydantic import (
     BeforeValidator,
     PostgresDsn,
     computed_field,
+    field_validator,
 )
 from pydantic_core import MultiHostUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+# Max texts the classifier accepts in one /predict call
+CLASSIFIER_MAX_TEXTS = 100
+
+
 def parse_cors(v: Any) -> list[str] | str:
     if isinstance(v, str) and not v.startswith("["):
         return [i.strip() for i in v.split(",")]
@@ -55,6 +60,60 @@ class Settings(BaseSettings):
     PG_PASSWORD: str = "postgres"
     PG_DB: str = "moderation"
 
+    # Async connection pool of the API (per uvicorn worker); keep
+    # workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) below Postgres max_connections
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 10.0
+    DB_POOL_RECYCLE: int = 1800
+    # Create tables and apply migrations in the API lifespan; turn off when a one-shot
+    # step (python -m app.database.seed) runs them before the replicas start
+    DB_MIGRATE_ON_STARTUP: bool = True
+
+    # Where submitted texts travel: "db" stores them in classification_tasks and the
+    # broker message carries only the task_id; "broker" sends them as task args and
+    # does not store them
+    CLAIM_CHECK_MODE: Literal["db", "broker"] = "db"
+
+    # Classifier HTTP client of the Celery worker (one keep-alive pool per process)
+    CLASSIFIER_TIMEOUT: float = 60.0
+    CLASSIFIER_CONNECT_TIMEOUT: float = 5.0
+    CLASSIFIER_MAX_CONNECTIONS: int = 20
+    CLASSIFIER_MAX_KEEPALIVE: int = 10
+    CLASSIFIER_KEEPALIVE_EXPIRY: float = 30.0
+    CLASSIFIER_HTTP2: bool = False
+
+    # Celery worker settings. "async" runs tasks on a threads pool and sends classifier
+    # calls through one asyncio loop per process, so a process keeps
+    # WORKER_ASYNC_CONCURRENCY requests in flight instead of one
+    WORKER_MODE: Literal["prefork", "async"] = "prefork"
+    WORKER_ASYNC_CONCURRENCY: int = 200
+    CELERY_PREFETCH_MULTIPLIER: int = 4
+    CELERY_ACKS_LATE: bool = False
+
+    # Merge texts of concurrent tasks into one /predict call (WORKER_MODE=async only)
+    AGGREGATE_ENABLED: bool = False
+    AGGREGATE_MAX_TEXTS: int = 100
+    AGGREGATE_MAX_WAIT_MS: float = 20.0
+
+    # Bulk jobs: texts per chunk task (the classifier accepts up to 100 per /predict)
+    BULK_MAX_TEXTS: int = 500_000
+    BULK_CHUNK_SIZE: int = 100
+
+    @field_validator("AGGREGATE_MAX_TEXTS", "BULK_CHUNK_SIZE")
+    @classmethod
+    def check_texts_per_call(cls, v: int) -> int:
+        # Larger /predict calls would be rejected by the classifier with 422
+        if not 1 <= v <= CLASSIFIER_MAX_TEXTS:
+            raise ValueError(f"must be between 1 and {CLASSIFIER_MAX_TEXTS}")
+        return v
+
+    # Push notifications of finished tasks (Postgres LISTEN/NOTIFY -> SSE)
+    TASK_EVENTS_CHANNEL: str = "task_events"
+    SSE_MAX_TASKS: int = 1000
+    SSE_TIMEOUT_SECONDS: float = 300.0
+    SSE_KEEPALIVE_SECONDS: float = 15.0
+
     @computed_field
     @property
     def SQLALCHEMY_DATABASE_URI(self) -> PostgresDsn:
@@ -1,8 +1,13 @@
 import logging
+import time
+from pathlib import Path
 
-from sqlalchemy import create_engine
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 from ..models import Base
 from ..config import settings
@@ -12,14 +17,80 @@ logger = logging.getLogger(__name__)
 # Use settings to build the database URL
 DATABASE_URL = str(settings.SQLALCHEMY_DATABASE_URI)
 
-# Create sync engine instance
-engine = create_engine(DATABASE_URL, pool_pre_ping=True, echo=False)
+
+def _sync_pool_options() -> dict:
+    if settings.WORKER_MODE != "async":
+        return {}
+    # Task threads of an async worker share this pool. A task commits before the
+    # classifier call, so it holds a connection only briefly: the configured limits
+    # keep connections per worker bounded however many threads it runs
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+
+
+# Create sync engine instance (Celery worker, init_db)
+engine = create_engine(DATABASE_URL, pool_pre_ping=True, echo=False, **_sync_pool_options())
 
 # Create sessionmaker
 SessionFactory = sessionmaker(
     bind=engine, autocommit=False, autoflush=False, class_=Session
 )
 
+# Create async engine instance (API request path, psycopg async driver)
+async_engine = create_async_engine(
+    DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    echo=False,
+)
+
+# expire_on_commit=False: returned ORM objects stay readable after commit
+AsyncSessionFactory = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+# Counters of the async pool, updated by pool events
+_pool_counters = {"connects": 0, "checkouts": 0, "checkout_seconds_total": 0.0}
+
+
+@event.listens_for(async_engine.sync_engine, "connect")
+def _on_connect(dbapi_connection, connection_record) -> None:
+    _pool_counters["connects"] += 1
+
+
+@event.listens_for(async_engine.sync_engine, "checkout")
+def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    _pool_counters["checkouts"] += 1
+    connection_record.info["checked_out_at"] = time.perf_counter()
+
+
+@event.listens_for(async_engine.sync_engine, "checkin")
+def _on_checkin(dbapi_connection, connection_record) -> None:
+    checked_out_at = connection_record.info.pop("checked_out_at", None)
+    if checked_out_at is not None:
+        _pool_counters["checkout_seconds_total"] += time.perf_counter() - checked_out_at
+
+
+def pool_status() -> dict:
+    """Current usage and lifetime counters of the async connection pool."""
+    pool = async_engine.sync_engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "connects": _pool_counters["connects"],
+        "checkouts": _pool_counters["checkouts"],
+        "checkout_seconds_total": round(_pool_counters["checkout_seconds_total"], 3),
+    }
+
 
 # Dependency to get DB session
 def get_db() -> Generator[Session, None, None]:
@@ -33,9 +104,48 @@ def get_db() -> Generator[Session, None, None]:
         session.close()
 
 
+# Dependency to get async DB session
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionFactory() as session:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
+
+
+# backend/ root with alembic.ini and the alembic/ scripts
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+# Key of the Postgres advisory lock serializing schema setup across replicas
+MIGRATION_LOCK_ID = 0x6D6F6431
+
+
+def run_migrations() -> None:
+    """Apply pending alembic migrations (alembic upgrade head)."""
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    # Keep the application's logging config instead of the one from alembic.ini
+    config.attributes["configure_logger"] = False
+    command.upgrade(config, "head")
+
+
 def init_db() -> None:
+    """
+    Create missing tables and apply migrations.
+
+    Blocking: call it from a thread in async code. Replicas starting together wait on
+    an advisory lock, so the schema is set up by one of them at a time.
+    """
     try:
-        Base.metadata.create_all(bind=engine)
+        with engine.connect() as lock_connection:
+            lock_connection.execute(select(func.pg_advisory_lock(MIGRATION_LOCK_ID)))
+            try:
+                # create_all only creates missing tables; columns added to existing
+                # tables come from the migrations, so the schema is never behind the models
+                Base.metadata.create_all(bind=engine)
+                run_migrations()
+            finally:
+                lock_connection.execute(select(func.pg_advisory_unlock(MIGRATION_LOCK_ID)))
         logger.info("Database initialized successfully.")
     except Exception as e:
         logger.error(f"Error initializing database: {e}")
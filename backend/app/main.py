@@ -1,10 +1,12 @@
+import asyncio
 import uvicorn
 import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
-from .database.core import init_db
+from .database.core import async_engine, init_db, pool_status
+from .api.events import task_event_hub
 from .api.router import router as api_router
 from .config import settings
 
@@ -13,12 +15,17 @@ LOG_LEVEL = "debug" if settings.ENVIRONMENT == "dev" else "info"
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    init_db()
+    if settings.DB_MIGRATE_ON_STARTUP:
+        # Off the event loop: migrations can wait on another replica's lock
+        await asyncio.to_thread(init_db)
     app.state.http_client = httpx.AsyncClient(
         timeout=httpx.Timeout(60.0),
     )
+    await task_event_hub.start()
     yield
+    await task_event_hub.stop()
     await app.state.http_client.aclose()
+    await async_engine.dispose()
 
 
 # Create FastAPI app instance
@@ -61,7 +68,12 @@ async def read_root():
 @app.get("/health", tags=["Health Check"])
 async def health_check():
     """Health check endpoint."""
-    return {"status": "ok", "version": settings.PROJECT_VERSION}
+    return {
+        "status": "ok",
+        "version": settings.PROJECT_VERSION,
+        "db_pool": pool_status(),
+        "task_events_connected": task_event_hub.connected,
+    }
 
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 import datetime
-from sqlalchemy import Column, String, DateTime, JSON, Enum as SAEnum
+from sqlalchemy import Column, ForeignKey, Integer, String, DateTime, JSON, Enum as SAEnum
 from sqlalchemy.orm import declarative_base
 import enum
 
@@ -18,9 +18,34 @@ class ClassificationTask(Base):
 
     task_id = Column(String, primary_key=True)  # Celery task ID
     status = Column(SAEnum(TaskStatus), default=TaskStatus.PENDING, nullable=False)
-    texts = Column(JSON, nullable=False)
+    texts = Column(JSON, nullable=True)  # None when texts travel in the broker message
     result = Column(JSON, nullable=True)
     error = Column(String, nullable=True)
+    # Set for chunks of a bulk job
+    job_id = Column(String, ForeignKey("bulk_jobs.job_id"), nullable=True, index=True)
+    chunk_index = Column(Integer, nullable=True)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=datetime.datetime.utcnow,
+        onupdate=datetime.datetime.utcnow,
+        nullable=False,
+    )
+
+
+class BulkJob(Base):
+    """Parent record of a bulk job; its chunks are ClassificationTask rows."""
+
+    __tablename__ = "bulk_jobs"
+
+    job_id = Column(String, primary_key=True)
+    status = Column(SAEnum(TaskStatus), default=TaskStatus.PENDING, nullable=False)
+    total_texts = Column(Integer, nullable=False)
+    chunk_size = Column(Integer, nullable=False)
+    total_chunks = Column(Integer, nullable=False)
+    completed_chunks = Column(Integer, default=0, nullable=False)
+    failed_chunks = Column(Integer, default=0, nullable=False)
+    error = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
     updated_at = Column(
         DateTime,
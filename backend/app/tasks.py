@@ -1,20 +1,100 @@
+import json
+
 import httpx
-import os
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
 from .celery_app import celery_app
+from .classifier_client import post_predict
+from .config import settings
 from .database.core import SessionFactory
-from .models import ClassificationTask, TaskStatus
+from .models import BulkJob, ClassificationTask, TaskStatus
+
+RETRY_ERRORS = (httpx.RequestError, httpx.TimeoutException)
+MAX_RETRIES = 3
+
+# Load shedding of the classifier: retried after its Retry-After
+RETRY_STATUS_CODES = (429, 503)
+DEFAULT_RETRY_AFTER = 5.0
+
+
+def _retry_after(e: Exception) -> float | None:
+    """Countdown before retrying a shed /predict call, None for other errors."""
+    if not isinstance(e, httpx.HTTPStatusError):
+        return None
+    if e.response.status_code not in RETRY_STATUS_CODES:
+        return None
+    try:
+        return max(0.0, float(e.response.headers["Retry-After"]))
+    except (KeyError, ValueError):
+        return DEFAULT_RETRY_AFTER
+
+
+def _finish_chunk(
+    session: Session,
+    task: ClassificationTask,
+    status: TaskStatus,
+    result: dict | None = None,
+    error: str | None = None,
+) -> bool:
+    """
+    Move a bulk chunk to its final status and count it on its job, at most once.
 
-CLASSIFIER_URL = os.getenv("CLASSIFIER_URL", "http://classifier:8090")
+    Returns False when an earlier delivery of the chunk already finished it.
+    """
+    # The conditional UPDATE locks the chunk row, so concurrent deliveries of the same
+    # chunk cannot both pass it
+    finished = session.execute(
+        update(ClassificationTask)
+        .where(
+            ClassificationTask.task_id == task.task_id,
+            ClassificationTask.status.not_in([TaskStatus.COMPLETED, TaskStatus.FAILED]),
+        )
+        .values(status=status, result=result, error=error)
+        .returning(ClassificationTask.task_id)
+    ).first()
+    if finished is None:
+        return False
+
+    failed = status == TaskStatus.FAILED
+    counts = session.execute(
+        update(BulkJob)
+        .where(BulkJob.job_id == task.job_id)
+        .values(
+            completed_chunks=BulkJob.completed_chunks + (0 if failed else 1),
+            failed_chunks=BulkJob.failed_chunks + (1 if failed else 0),
+        )
+        .returning(BulkJob.completed_chunks, BulkJob.failed_chunks, BulkJob.total_chunks)
+    ).one()
+
+    # The UPDATE locks the job row, so exactly one chunk sees the final counts. A job
+    # already FAILED (e.g. its fan-out broke off) stays FAILED
+    if counts.completed_chunks + counts.failed_chunks == counts.total_chunks:
+        job_status = TaskStatus.FAILED if counts.failed_chunks else TaskStatus.COMPLETED
+        session.execute(
+            update(BulkJob)
+            .where(BulkJob.job_id == task.job_id, BulkJob.status != TaskStatus.FAILED)
+            .values(status=job_status)
+        )
+    return True
+
+
+def _notify_finished(session: Session, task_id: str, status: TaskStatus) -> None:
+    """Wake clients waiting on the task (delivered by Postgres when the transaction commits)."""
+    payload = json.dumps({"task_id": task_id, "status": status.value})
+    session.execute(select(func.pg_notify(settings.TASK_EVENTS_CHANNEL, payload)))
 
 
 @celery_app.task(
     bind=True,
-    autoretry_for=(httpx.RequestError, httpx.TimeoutException),
+    autoretry_for=RETRY_ERRORS,
     retry_backoff=5,
-    retry_kwargs={"max_retries": 3},
+    retry_kwargs={"max_retries": MAX_RETRIES},
 )
-def classify_texts(self, texts: list[str]):
-    """Classify texts using BERT model."""
+def classify_texts(self, texts: list[str] | None = None):
+    """Classify texts using BERT model.
+
+    Without ``texts`` (CLAIM_CHECK_MODE=db) they are read from the task row.
+    """
     task_id = self.request.id
     session = SessionFactory()
     task = None
@@ -26,30 +106,50 @@ def classify_texts(self, texts: list[str]):
 
         if task.status == TaskStatus.COMPLETED:
             return task.result
+        if task.job_id is not None and task.status == TaskStatus.FAILED:
+            # A failed chunk is final and already counted on its job
+            return None
+
+        if texts is None:
+            texts = task.texts
+        if texts is None:
+            raise ValueError(f"Task {task_id} has no texts in the message or the DB")
 
         task.status = TaskStatus.PROCESSING
         session.commit()
 
-        with httpx.Client(timeout=60.0) as client:
-            response = client.post(
-                f"{CLASSIFIER_URL}/predict",
-                json={"texts": texts},
-            )
-            response.raise_for_status()
-            result = response.json()
+        result = post_predict(texts)
 
-        task.status = TaskStatus.COMPLETED
-        task.result = result
+        if task.job_id is None:
+            task.status = TaskStatus.COMPLETED
+            task.result = result
+            _notify_finished(session, task_id, TaskStatus.COMPLETED)
+        elif _finish_chunk(session, task, TaskStatus.COMPLETED, result=result):
+            _notify_finished(session, task_id, TaskStatus.COMPLETED)
         session.commit()
 
         return result
 
     except Exception as e:
         session.rollback()
+        retry_after = _retry_after(e)
         if task:
-            task.status = TaskStatus.FAILED
-            task.error = str(e)
+            retrying = self.request.retries < MAX_RETRIES and (
+                isinstance(e, RETRY_ERRORS) or retry_after is not None
+            )
+            if retrying:
+                # Tasks stay PROCESSING between attempts: FAILED is final for SSE
+                # subscribers and marks a counted chunk
+                task.error = str(e)
+            elif task.job_id is None:
+                task.status = TaskStatus.FAILED
+                task.error = str(e)
+                _notify_finished(session, task_id, TaskStatus.FAILED)
+            elif _finish_chunk(session, task, TaskStatus.FAILED, error=str(e)):
+                _notify_finished(session, task_id, TaskStatus.FAILED)
             session.commit()
+        if retry_after is not None and self.request.retries < MAX_RETRIES:
+            raise self.retry(exc=e, countdown=retry_after, max_retries=MAX_RETRIES)
         raise
 
     finally:
@@ -1,16 +1,29 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi.responses import StreamingResponse
 
 from .schemas import (
+    CacheStatsResponse,
+    CascadeStatsResponse,
     ErrorResponse,
     ModelsInfoResponse,
+    NearDupStatsResponse,
     PredictRequest,
     PredictResponse,
+    ProfilingRequest,
+    ProfilingStatusResponse,
 )
 from .service import classifier_service
 
 router = APIRouter()
 
 
+def require_profiling_token(
+    token: str | None = Header(default=None, alias="X-Profiling-Token"),
+) -> None:
+    """Allow the profiling endpoints only to callers holding PROFILING_TOKEN."""
+    classifier_service.check_profiling_token(token)
+
+
 @router.get(
     "/models",
     response_model=ModelsInfoResponse,
@@ -30,9 +43,136 @@ def models_info():
     description="Classify texts using BERT model",
     responses={
         200: {"description": "Successful prediction"},
-        503: {"model": ErrorResponse, "description": "Model not available"},
+        429: {"model": ErrorResponse, "description": "Inference queue is full"},
+        503: {
+            "model": ErrorResponse,
+            "description": "Model not available or estimated wait exceeds the budget",
+        },
     },
 )
-def predict(request: PredictRequest):
+async def predict(
+    request: PredictRequest,
+    timeout_ms: float | None = Header(
+        default=None,
+        alias="X-Timeout-Ms",
+        description="Max acceptable queue wait; the request is rejected if it is exceeded",
+    ),
+    profile: bool = Header(
+        default=False,
+        alias="X-Profile",
+        description=(
+            "Profile this request's forward pass (ignored unless profiling is enabled "
+            "and X-Profiling-Token is valid)"
+        ),
+    ),
+    profiling_token: str | None = Header(default=None, alias="X-Profiling-Token"),
+):
     """Classify texts using BERT model."""
-    return classifier_service.predict(request.texts)
+    return await classifier_service.predict(
+        request.texts,
+        return_probabilities=request.return_probabilities,
+        top_k=request.top_k,
+        budget_ms=timeout_ms,
+        profile=profile and classifier_service.profiling_authorized(profiling_token),
+    )
+
+
+@router.post(
+    "/predict/stream",
+    summary="Classify a stream of texts",
+    description=(
+        "Classify a chunked NDJSON (one JSON string or {\"text\", \"id\"} object per line) "
+        "or CSV (header row with a \"text\" column) upload of any size. Results are streamed "
+        "back as NDJSON lines as each internal batch completes."
+    ),
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"application/x-ndjson": {}}, "description": "Prediction stream"},
+        503: {"model": ErrorResponse, "description": "Model not available"},
+    },
+)
+async def predict_stream(
+    request: Request,
+    return_probabilities: bool = Query(
+        default=False, description="Include probabilities for all classes"
+    ),
+    top_k: int | None = Query(
+        default=None, ge=1, description="Include the k most probable classes"
+    ),
+):
+    """Classify a stream of texts."""
+    content_type = request.headers.get("content-type", "")
+    input_format = "csv" if "csv" in content_type else "ndjson"
+
+    stream = classifier_service.predict_stream(
+        request.stream(),
+        input_format=input_format,
+        return_probabilities=return_probabilities,
+        top_k=top_k,
+    )
+    return StreamingResponse(stream, media_type="application/x-ndjson")
+
+
+@router.get(
+    "/cache/stats",
+    response_model=CacheStatsResponse,
+    summary="Get prediction cache stats",
+    description="Get hit/miss counters of the prediction cache",
+)
+def cache_stats():
+    """Get hit/miss counters of the prediction cache."""
+    return classifier_service.get_cache_stats()
+
+
+@router.get(
+    "/neardup/stats",
+    response_model=NearDupStatsResponse,
+    summary="Get near-duplicate pre-filter stats",
+    description="Get short-circuit counters and audit results of the near-duplicate pre-filter",
+)
+def neardup_stats():
+    """Get short-circuit counters and audit results of the near-duplicate pre-filter."""
+    return classifier_service.get_neardup_stats()
+
+
+@router.get(
+    "/cascade/stats",
+    response_model=CascadeStatsResponse,
+    summary="Get cascade stats",
+    description="Get counters of texts answered by the linear model vs escalated to BERT",
+)
+def cascade_stats():
+    """Get counters of texts answered by the linear model vs escalated to BERT."""
+    return classifier_service.get_cascade_stats()
+
+
+@router.get(
+    "/profiling",
+    response_model=ProfilingStatusResponse,
+    summary="Get profiling status",
+    description="Get profiler settings and the files of the most recent profiled forward passes",
+    dependencies=[Depends(require_profiling_token)],
+    responses={403: {"model": ErrorResponse, "description": "Invalid or missing token"}},
+)
+def profiling_status():
+    """Get profiler settings and the most recent profiles."""
+    return classifier_service.get_profiling_status()
+
+
+@router.post(
+    "/profiling",
+    response_model=ProfilingStatusResponse,
+    summary="Profile upcoming requests",
+    description=(
+        "Profile the next N forward passes with torch.profiler and tracemalloc "
+        "and/or change the random sample rate"
+    ),
+    dependencies=[Depends(require_profiling_token)],
+    responses={
+        403: {"model": ErrorResponse, "description": "Invalid or missing token"},
+        404: {"model": ErrorResponse, "description": "Profiling is disabled"},
+    },
+)
+def configure_profiling(request: ProfilingRequest):
+    """Profile the next N forward passes and/or change the sample rate."""
+    return classifier_service.configure_profiling(request.requests, request.sample_rate)
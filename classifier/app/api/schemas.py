@@ -1,3 +1,5 @@
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 
@@ -11,6 +13,20 @@ class PredictRequest(BaseModel):
         description="List of texts to classify (1-100 items)",
         examples=[["Скидка 50% на все услуги до конца месяца на фитнес"]],
     )
+    return_probabilities: bool = Field(
+        default=False, description="Include probabilities for all classes"
+    )
+    top_k: int | None = Field(
+        default=None, ge=1, description="Include the k most probable classes"
+    )
+
+
+class LabelScore(BaseModel):
+    """Class with its predicted probability."""
+
+    label: str = Field(..., description="Class label")
+    label_id: int = Field(..., description="Class ID")
+    score: float = Field(..., ge=0, le=1, description="Class probability")
 
 
 class PredictionItem(BaseModel):
@@ -23,6 +39,13 @@ class PredictionItem(BaseModel):
     probabilities: dict[str, float] | None = Field(
         default=None, description="Probabilities for all classes"
     )
+    top_k: list[LabelScore] | None = Field(
+        default=None, description="Most probable classes, in descending order"
+    )
+    source: str | None = Field(
+        default=None,
+        description="Cascade stage that produced the prediction (linear, bert, linear_fallback)",
+    )
 
 
 class PredictResponse(BaseModel):
@@ -31,11 +54,35 @@ class PredictResponse(BaseModel):
     predictions: list[PredictionItem]
 
 
+class StreamPredictionItem(BaseModel):
+    """Single line of the streaming prediction response."""
+
+    index: int = Field(..., description="Position of the record in the upload")
+    id: Any = Field(default=None, description="Record id from the upload")
+    label: str | None = Field(default=None, description="Predicted class label")
+    label_id: int | None = Field(default=None, description="Predicted class ID")
+    confidence: float | None = Field(default=None, description="Prediction confidence")
+    probabilities: dict[str, float] | None = Field(
+        default=None, description="Probabilities for all classes"
+    )
+    top_k: list[LabelScore] | None = Field(
+        default=None, description="Most probable classes, in descending order"
+    )
+    error: str | None = Field(default=None, description="Why the record was not classified")
+
+
 class ModelStatus(BaseModel):
     """Status of the model."""
 
-    available: bool = Field(..., description="Whether model is loaded and ready")
+    available: bool = Field(..., description="Whether model is loaded")
+    ready: bool | None = Field(None, description="Whether warmup has finished")
     path: str = Field(..., description="Path to model weights")
+    backend: str | None = Field(None, description="Inference backend (torch, onnx)")
+    precision: str | None = Field(None, description="Numeric precision (fp32, bf16, int8)")
+    version: str | None = Field(None, description="Model version")
+    startup_seconds: dict[str, float] | None = Field(
+        None, description="Startup time per stage (import, weights, tokenizer, warmup, ...)"
+    )
     error: str | None = Field(None, description="Error message if not available")
 
 
@@ -52,13 +99,116 @@ class ModelsInfoResponse(BaseModel):
     model_available: bool = Field(..., description="Model is available")
     num_classes: int = Field(..., description="Number of classes")
     classes: list[ClassInfo] = Field(..., description="List of all classes")
+    backend: str = Field(..., description="Inference backend (torch, onnx)")
+    precision: str = Field(..., description="Numeric precision (fp32, bf16, int8)")
+
+
+class ProcessStatus(BaseModel):
+    """Resident memory of the serving process, split into shared and private pages."""
+
+    pid: int = Field(..., description="Process ID")
+    cpus: list[int] = Field(..., description="CPU cores the process is pinned to")
+    rss_mb: float | None = Field(None, description="Resident set size, MiB")
+    pss_mb: float | None = Field(None, description="Proportional set size, MiB")
+    shared_mb: float | None = Field(None, description="Resident pages shared with other processes")
+    private_mb: float | None = Field(None, description="Resident pages private to this process")
 
 
 class HealthResponse(BaseModel):
     """Response body for health check endpoint."""
 
-    status: str = Field(..., description="API status")
+    status: str = Field(..., description="API status (healthy, warming_up, unhealthy)")
     model: ModelStatus = Field(..., description="Model status")
+    process: ProcessStatus | None = Field(None, description="Serving process memory")
+
+
+class CacheStatsResponse(BaseModel):
+    """Response body for prediction cache stats endpoint."""
+
+    enabled: bool = Field(..., description="Prediction cache is enabled")
+    size: int = Field(0, description="Number of cached predictions")
+    max_size: int = Field(0, description="Max number of cached predictions")
+    ttl_seconds: float = Field(0, description="Time to live of a cached prediction")
+    hits: int = Field(0, description="Texts answered from cache")
+    misses: int = Field(0, description="Texts sent to the model")
+    coalesced: int = Field(0, description="Texts that waited on another request's computation")
+    deduplicated: int = Field(0, description="Duplicate texts collapsed inside a request")
+    evictions: int = Field(0, description="Entries evicted by the size cap")
+    hit_rate: float = Field(0, description="Share of texts that skipped a forward pass")
+
+
+class NearDupAuditSample(BaseModel):
+    """Short-circuited text whose reused label differs from the model's."""
+
+    text: str = Field(..., description="Input text")
+    reused_label: str = Field(..., description="Label reused from a near-duplicate")
+    model_label: str = Field(..., description="Label predicted by the model")
+
+
+class NearDupStatsResponse(BaseModel):
+    """Response body for near-duplicate pre-filter stats endpoint."""
+
+    enabled: bool = Field(..., description="Near-duplicate pre-filter is enabled")
+    size: int = Field(0, description="Number of indexed signatures")
+    max_size: int = Field(0, description="Max number of indexed signatures")
+    threshold: float = Field(0, description="Min signature similarity to reuse a prediction")
+    lookups: int = Field(0, description="Texts looked up in the index")
+    short_circuited: int = Field(0, description="Texts answered from a near-duplicate")
+    short_circuit_rate: float = Field(0, description="Share of lookups that skipped the model")
+    audited: int = Field(0, description="Short-circuited texts re-checked by the model")
+    audit_agreement: float | None = Field(
+        None, description="Share of audited texts where the reused label matched the model"
+    )
+    disagreements: list[NearDupAuditSample] = Field(
+        default_factory=list, description="Recent audited texts with a different model label"
+    )
+
+
+class CascadeStatsResponse(BaseModel):
+    """Response body for cascade stats endpoint."""
+
+    enabled: bool = Field(..., description="Cascade is enabled")
+    mode: str | None = Field(None, description="Cascade mode (cascade, fallback)")
+    texts: int = Field(0, description="Texts classified through the cascade")
+    accepted: int = Field(0, description="Texts answered by the linear model")
+    escalated: int = Field(0, description="Texts answered by BERT")
+    fallback: int = Field(0, description="Texts answered by the linear model under BERT overload")
+    accept_rate: float = Field(0, description="Share of texts that skipped BERT")
+    thresholds: dict[str, float | None] = Field(
+        default_factory=dict, description="Confidence threshold per class (null = always escalate)"
+    )
+
+
+class ProfilingRequest(BaseModel):
+    """Request body for the profiling admin endpoint."""
+
+    requests: int = Field(default=1, ge=0, le=100, description="Profile the next N forward passes")
+    sample_rate: float | None = Field(
+        default=None, ge=0, le=1, description="New share of forward passes profiled at random"
+    )
+
+
+class ProfileRecord(BaseModel):
+    """Files and timings of one profiled forward pass."""
+
+    name: str = Field(..., description="Profile name")
+    texts: int = Field(..., description="Texts in the profiled forward pass")
+    elapsed_ms: float = Field(..., description="Forward pass time under the profiler")
+    peak_python_mb: float | None = Field(None, description="Peak Python allocations (tracemalloc)")
+    trace: str = Field(..., description="Chrome trace file")
+    summary: str = Field(..., description="Text summary file")
+
+
+class ProfilingStatusResponse(BaseModel):
+    """Response body for the profiling endpoints."""
+
+    enabled: bool = Field(..., description="Profiling is enabled")
+    sample_rate: float = Field(0, description="Share of forward passes profiled at random")
+    armed: int = Field(0, description="Upcoming forward passes that will be profiled")
+    profiled: int = Field(0, description="Forward passes profiled since startup")
+    skipped: int = Field(0, description="Sampled passes run unprofiled (profiler busy)")
+    output_dir: str | None = Field(None, description="Directory with trace and summary files")
+    recent: list[ProfileRecord] = Field(default_factory=list, description="Most recent profiles")
 
 
 class ErrorResponse(BaseModel):
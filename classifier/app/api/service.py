@@ -1,14 +1,42 @@
+import asyncio
+import json
+import os
+import random
+import secrets
+from collections.abc import AsyncIterator
+from functools import partial
+
+import torch
 from fastapi import HTTPException, status
+from prometheus_client import REGISTRY
 
+from ..config import settings
+from ..metrics import INFLIGHT_REQUESTS, POSTPROCESS_SECONDS, ServiceCollector
+from ..predict.batcher import MicroBatcher
+from ..predict.cache import PredictionCache
+from ..predict.cascade import CascadeNotFoundError, LinearCascade
+from ..predict.executor import InferenceExecutor, OverloadedError, configure_torch_threads
+from ..predict.neardup import NearDupIndex
 from ..predict.predictor import LabelEncoderNotFoundError, ModelNotFoundError, Predictor
+from ..predict.profiling import RequestProfiler
+from ..serve.memory import process_cpus, read_memory_usage
 from .schemas import (
+    CacheStatsResponse,
+    CascadeStatsResponse,
     ClassInfo,
     HealthResponse,
     ModelsInfoResponse,
     ModelStatus,
+    NearDupAuditSample,
+    NearDupStatsResponse,
     PredictionItem,
+    ProcessStatus,
     PredictResponse,
+    ProfileRecord,
+    ProfilingStatusResponse,
+    StreamPredictionItem,
 )
+from .streaming import StreamItem, batched, iter_csv_items, iter_lines, iter_ndjson_items
 
 
 class ClassifierService:
@@ -16,15 +44,49 @@ class ClassifierService:
 
     def __init__(self):
         self.predictor: Predictor | None = None
+        self.executor: InferenceExecutor | None = None
+        self.batcher: MicroBatcher | None = None
+        self.cache: PredictionCache | None = None
+        self.neardup: NearDupIndex | None = None
+        self.cascade: LinearCascade | None = None
+        self.profiler: RequestProfiler | None = None
         self.error: str | None = None
+        self.ready = False
+        self.startup_timings: dict[str, float] = {}
+        self._warmup_task: asyncio.Task | None = None
+        self._audit_tasks: set[asyncio.Task] = set()
+        self._audit_pending = 0
+        self._cascade_columns: torch.Tensor | None = None
+        self.cascade_counts = {"texts": 0, "accepted": 0, "escalated": 0, "fallback": 0}
+
+    def load(self, configure_threads: bool = True, build_backend: bool = True) -> None:
+        """
+        Load model on startup.
+
+        Args:
+            configure_threads: Split CPU cores between inference lanes
+            build_backend: Create the inference backend (False in the pre-fork parent)
+        """
+        if configure_threads:
+            threads = configure_torch_threads(
+                settings.INFERENCE_LANES, settings.INFERENCE_INTRA_OP_THREADS
+            )
+            print(f"Inference lanes: {settings.INFERENCE_LANES}, torch threads per lane: {threads}")
+
+        if self.predictor is not None:
+            # Weights loaded by the parent before forking (python -m app.serve); the
+            # backend is created here, after the worker is pinned to its cores
+            if self.predictor.backend is None:
+                self._build_backend()
+            return
 
-    def load(self) -> None:
-        """Load model on startup."""
         try:
             self.predictor = Predictor()
-            self.predictor.load()
+            self.predictor.load(build_backend=build_backend)
             self.error = None
             print("BERT model loaded successfully")
+            if settings.CASCADE_MODE != "off":
+                self._load_cascade()
 
         except (ModelNotFoundError, LabelEncoderNotFoundError) as e:
             self.predictor = None
@@ -36,6 +98,140 @@ class ClassifierService:
             self.error = f"Unexpected error: {e}"
             print(f"Model failed to load: {e}")
 
+    def _build_backend(self) -> None:
+        """Create the predictor's backend in this worker, marking the model unavailable on error."""
+        try:
+            self.predictor.build_backend()
+        except Exception as e:
+            self.predictor = None
+            self.error = f"Backend failed to start: {e}"
+            print(f"Backend failed to start: {e}")
+
+    def _load_cascade(self) -> None:
+        """Load the linear first stage; the service runs BERT-only if it is missing."""
+        try:
+            self.cascade = LinearCascade.load(settings.CASCADE_PATH)
+        except CascadeNotFoundError as e:
+            print(f"Cascade disabled: {e}")
+            return
+
+        unknown = set(self.cascade.classes) - set(self.predictor.label2id)
+        if unknown:
+            self.cascade = None
+            print(f"Cascade disabled: classes {sorted(unknown)} are unknown to the BERT model")
+            return
+
+        # Maps linear model columns to BERT label ids
+        self._cascade_columns = torch.tensor(
+            [self.predictor.label2id[label] for label in self.cascade.classes]
+        )
+        print(f"Cascade loaded from {settings.CASCADE_PATH} ({settings.CASCADE_MODE} mode)")
+
+    async def start(self) -> None:
+        """Start inference lanes, prediction cache and batching scheduler (needs a running loop)."""
+        if self.predictor is None:
+            return
+
+        self.executor = InferenceExecutor(
+            lanes=settings.INFERENCE_LANES,
+            max_queue=settings.INFERENCE_QUEUE_SIZE,
+            wait_budget_ms=settings.INFERENCE_WAIT_BUDGET_MS,
+        )
+
+        if settings.PREDICTION_CACHE_ENABLED:
+            self.cache = PredictionCache(
+                max_size=settings.PREDICTION_CACHE_SIZE,
+                ttl_seconds=settings.PREDICTION_CACHE_TTL_SECONDS,
+            )
+
+        if settings.NEARDUP_ENABLED:
+            self.neardup = NearDupIndex(
+                threshold=settings.NEARDUP_THRESHOLD,
+                max_size=settings.NEARDUP_INDEX_SIZE,
+                ttl_seconds=settings.NEARDUP_TTL_SECONDS,
+                bands=settings.NEARDUP_BANDS,
+                min_length=settings.NEARDUP_MIN_LENGTH,
+            )
+
+        if settings.PROFILING_ENABLED:
+            self.profiler = RequestProfiler(
+                output_dir=settings.PROFILING_OUTPUT_DIR,
+                sample_rate=settings.PROFILING_SAMPLE_RATE,
+                record_memory=settings.PROFILING_MEMORY,
+                max_files=settings.PROFILING_MAX_FILES,
+            )
+            print(
+                f"Profiling enabled (sample rate {settings.PROFILING_SAMPLE_RATE}, "
+                f"output {settings.PROFILING_OUTPUT_DIR})"
+            )
+
+        if settings.WARMUP_ENABLED:
+            # Warm up in the background: /health reports warming_up and /predict answers
+            # 503 until every compiled shape bucket is ready
+            self._warmup_task = asyncio.create_task(self._warmup())
+        else:
+            self.ready = True
+
+        if not settings.BATCHING_ENABLED:
+            return
+
+        self.batcher = MicroBatcher(
+            self._run_forward,
+            max_concurrency=settings.INFERENCE_LANES,
+            max_batch_size=settings.BATCH_MAX_SIZE,
+            max_batch_tokens=settings.BATCH_MAX_TOKENS,
+            max_wait_ms=settings.BATCH_MAX_WAIT_MS,
+            max_length=settings.MAX_LENGTH,
+        )
+        await self.batcher.start()
+        print(
+            f"Micro-batching enabled (max {settings.BATCH_MAX_SIZE} texts, "
+            f"{settings.BATCH_MAX_WAIT_MS} ms wait)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the batching scheduler and inference lanes, drop the prediction cache."""
+        if self._warmup_task is not None:
+            self._warmup_task.cancel()
+            self._warmup_task = None
+        self.ready = False
+        for task in list(self._audit_tasks):
+            task.cancel()
+        if self.batcher is not None:
+            await self.batcher.stop()
+            self.batcher = None
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        self.cache = None
+        self.neardup = None
+        self.profiler = None
+
+    async def _warmup(self) -> None:
+        """Run the predictor warmup off the event loop, then mark the service ready."""
+        try:
+            await asyncio.to_thread(self.predictor.warmup)
+        except Exception as e:
+            self.error = f"Warmup failed: {e}"
+            print(f"Model warmup failed: {e}")
+            return
+
+        for stage in ("compile", "warmup"):
+            if stage in self.predictor.startup_timings:
+                self.startup_timings[stage] = self.predictor.startup_timings[stage]
+        self.ready = True
+        print(f"Model ready: {self.startup_timings}")
+
+    def report_startup(self, import_seconds: float | None) -> None:
+        """Log the startup-time breakdown (import, weights, tokenizer, warmup, ...)."""
+        timings = {"import": import_seconds} if import_seconds is not None else {}
+        if self.predictor is not None:
+            timings.update(self.predictor.startup_timings)
+        self.startup_timings = timings
+
+        breakdown = ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in timings.items())
+        print(f"Startup breakdown: {breakdown}")
+
     def _get_predictor(self) -> Predictor:
         """Get predictor or raise HTTPException if not available."""
         if self.predictor is None:
@@ -45,38 +241,371 @@ class ClassifierService:
             )
         return self.predictor
 
-    def predict(self, texts: list[str]) -> PredictResponse:
-        """Classify texts using BERT model."""
+    def _get_ready_predictor(self) -> Predictor:
+        """Get predictor or raise HTTPException if it is not loaded or not warmed up yet."""
         predictor = self._get_predictor()
+        if not self.ready:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=self.error or "Model is warming up",
+                headers={"Retry-After": "5"},
+            )
+        return predictor
+
+    def profiling_authorized(self, token: str | None) -> bool:
+        """Whether ``token`` matches PROFILING_TOKEN (never when no token is configured)."""
+        expected = settings.PROFILING_TOKEN
+        if not expected or token is None:
+            return False
+        return secrets.compare_digest(token.encode(), expected.encode())
+
+    def check_profiling_token(self, token: str | None) -> None:
+        """Reject callers of the profiling endpoints without a valid token."""
+        if not self.profiling_authorized(token):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Invalid or missing X-Profiling-Token",
+            )
+
+    def _should_profile(self, requested: bool = False) -> bool:
+        """Decide whether a request's forward pass is profiled (always False when disabled)."""
+        return self.profiler is not None and self.profiler.should_profile(requested)
+
+    async def _run_forward(
+        self, texts: list[str], profile: bool = False, pipeline: bool | None = None
+    ) -> torch.Tensor:
+        """Run one forward pass on a dedicated inference lane, profiled if requested."""
+        fn = partial(self.predictor.predict_proba, pipeline=pipeline)
+        if profile and self.profiler is not None:
+            fn = partial(self.profiler.run, fn)
+        return await self.executor.run(fn, texts)
+
+    async def _infer(
+        self, texts: list[str], budget_ms: float | None = None, profile: bool = False
+    ) -> torch.Tensor:
+        """Admit texts to the inference queue and run them, merged when batching."""
+        with self.executor.admit(len(texts), budget_ms):
+            if self.batcher is not None:
+                return await self.batcher.submit(texts, profile)
+            return await self._run_forward(texts, profile)
+
+    async def _infer_rows(
+        self, texts: list[str], budget_ms: float | None = None, profile: bool = False
+    ) -> list[torch.Tensor]:
+        """Run texts through the model and split probabilities into per-text rows."""
+        probs = await self._infer(texts, budget_ms, profile)
+        # Clone rows so a cached row does not keep the whole batch tensor alive
+        return [row.clone() for row in probs]
+
+    async def _compute_probs(
+        self,
+        predictor: Predictor,
+        texts: list[str],
+        budget_ms: float | None = None,
+        profile: bool = False,
+    ) -> torch.Tensor:
+        """Get class probabilities from the prediction cache or the model."""
+        if self.cache is None:
+            return await self._infer(texts, budget_ms, profile)
+
+        compute = partial(self._infer_rows, budget_ms=budget_ms, profile=profile)
+        rows = await self.cache.resolve(texts, predictor.model_version, compute)
+        return torch.stack(rows)
+
+    async def _resolve_near_duplicates(
+        self,
+        predictor: Predictor,
+        texts: list[str],
+        budget_ms: float | None = None,
+        profile: bool = False,
+    ) -> torch.Tensor:
+        """
+        Reuse predictions of recently classified near-duplicates, run the rest normally.
+
+        Confident predictions of model-classified texts are added to the index, and a
+        sample of short-circuited texts is re-checked by the model in the background.
+        """
+        signatures = await asyncio.to_thread(lambda: [self.neardup.signature(t) for t in texts])
+
+        rows: list[torch.Tensor | None] = [
+            None if signature is None else self.neardup.lookup(signature)
+            for signature in signatures
+        ]
+        reused = [i for i, row in enumerate(rows) if row is not None]
+        missing = [i for i, row in enumerate(rows) if row is None]
+
+        if missing:
+            probs = await self._compute_probs(
+                predictor, [texts[i] for i in missing], budget_ms, profile
+            )
+            for i, row in zip(missing, probs, strict=True):
+                rows[i] = row
+                if signatures[i] is not None and row.max() >= settings.NEARDUP_MIN_CONFIDENCE:
+                    self.neardup.add(signatures[i], row.clone())
+
+        if reused:
+            self._schedule_audit([texts[i] for i in reused], [rows[i] for i in reused])
+
+        return torch.stack(rows)
+
+    def _schedule_audit(self, texts: list[str], rows: list[torch.Tensor]) -> None:
+        """Send a random sample of short-circuited texts to the model for comparison."""
+        sample = [
+            (text, row)
+            for text, row in zip(texts, rows, strict=True)
+            if random.random() < settings.NEARDUP_AUDIT_RATE
+        ]
+        if not sample or self._audit_pending + len(sample) > settings.NEARDUP_AUDIT_MAX_PENDING:
+            return
 
+        self._audit_pending += len(sample)
+        task = asyncio.create_task(self._audit(sample))
+        self._audit_tasks.add(task)
+        task.add_done_callback(self._audit_tasks.discard)
+
+    async def _audit(self, sample: list[tuple[str, torch.Tensor]]) -> None:
+        """Compare reused labels with the model's labels for the sampled texts."""
         try:
-            results = predictor.predict(texts)
-
-            predictions = [
-                PredictionItem(
-                    text=r["text"],
-                    label=r["label"],
-                    label_id=r["label_id"],
-                    confidence=r["confidence"],
+            # Same admission as client requests, so audits never exceed the queue bound
+            probs = await self._infer([text for text, _ in sample])
+            for (text, row), model_row in zip(sample, probs, strict=True):
+                self.neardup.record_audit(text, int(row.argmax()), int(model_row.argmax()))
+        except OverloadedError:
+            # Audits are best-effort: skip the sample rather than compete with requests
+            pass
+        except Exception as e:
+            print(f"Near-duplicate audit failed: {e}")
+        finally:
+            self._audit_pending -= len(sample)
+
+    async def _model_probs(
+        self,
+        predictor: Predictor,
+        texts: list[str],
+        budget_ms: float | None = None,
+        profile: bool = False,
+    ) -> torch.Tensor:
+        """Get BERT probabilities through the near-duplicate filter and cache when enabled."""
+        if self.neardup is not None:
+            return await self._resolve_near_duplicates(predictor, texts, budget_ms, profile)
+        return await self._compute_probs(predictor, texts, budget_ms, profile)
+
+    def _linear_probs(self, texts: list[str]) -> tuple[torch.Tensor, list[bool]]:
+        """Linear model probabilities in BERT label order and whether each text is accepted."""
+        linear = self.cascade.predict_proba(texts)
+        probs = torch.zeros(len(texts), len(self.predictor.id2label))
+        probs[:, self._cascade_columns] = torch.from_numpy(linear).float()
+        return probs, self.cascade.accept(linear).tolist()
+
+    async def _resolve_cascade(
+        self,
+        predictor: Predictor,
+        texts: list[str],
+        budget_ms: float | None = None,
+        profile: bool = False,
+    ) -> tuple[torch.Tensor, list[str]]:
+        """
+        Answer confident texts with the linear model and escalate the rest to BERT.
+
+        In fallback mode every text is escalated. In both modes the linear predictions are
+        returned instead of an error when the BERT queue rejects the escalated texts.
+
+        Returns:
+            Probabilities and the stage that produced each prediction
+        """
+        probs, accepted = await asyncio.to_thread(self._linear_probs, texts)
+        if settings.CASCADE_MODE == "fallback":
+            accepted = [False] * len(texts)
+
+        sources = ["linear" if ok else "bert" for ok in accepted]
+        escalated = [i for i, ok in enumerate(accepted) if not ok]
+        self.cascade_counts["texts"] += len(texts)
+        self.cascade_counts["accepted"] += len(texts) - len(escalated)
+
+        if escalated:
+            try:
+                model_probs = await self._model_probs(
+                    predictor, [texts[i] for i in escalated], budget_ms, profile
                 )
-                for r in results
-            ]
+            except OverloadedError:
+                # Degrade to the linear model instead of rejecting the request
+                self.cascade_counts["fallback"] += len(escalated)
+                for i in escalated:
+                    sources[i] = "linear_fallback"
+            else:
+                self.cascade_counts["escalated"] += len(escalated)
+                probs[torch.tensor(escalated)] = model_probs
+
+        return probs, sources
+
+    async def predict(
+        self,
+        texts: list[str],
+        return_probabilities: bool = False,
+        top_k: int | None = None,
+        budget_ms: float | None = None,
+        profile: bool = False,
+    ) -> PredictResponse:
+        """
+        Classify texts using BERT model, answering repeated texts from the cache.
+
+        With profiling enabled, the forward pass is profiled when ``profile`` is set or
+        the request is sampled.
+        """
+        predictor = self._get_ready_predictor()
+        profile = self._should_profile(profile)
+        INFLIGHT_REQUESTS.inc()
+
+        try:
+            sources = None
+            if self.cascade is not None:
+                probs, sources = await self._resolve_cascade(predictor, texts, budget_ms, profile)
+            else:
+                probs = await self._model_probs(predictor, texts, budget_ms, profile)
+
+            with POSTPROCESS_SECONDS.time():
+                results = predictor.format_predictions(texts, probs, return_probabilities, top_k)
+                if sources is not None:
+                    for result, source in zip(results, sources, strict=True):
+                        result["source"] = source
+                predictions = [PredictionItem(**r) for r in results]
 
             return PredictResponse(predictions=predictions)
 
+        except OverloadedError as e:
+            raise HTTPException(
+                status_code=e.status_code,
+                detail=str(e),
+                headers={"Retry-After": str(e.retry_after)},
+            ) from e
+
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Prediction failed: {e}",
             ) from e
 
+        finally:
+            INFLIGHT_REQUESTS.dec()
+
+    def predict_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        input_format: str = "ndjson",
+        return_probabilities: bool = False,
+        top_k: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Classify an upload of arbitrary size, streaming NDJSON results batch by batch.
+
+        The upload is read incrementally and split into batches of ``STREAM_BATCH_SIZE``
+        records; the next batch is read while the previous one runs on an inference lane,
+        so memory stays bounded by two batches regardless of the upload size; lines longer
+        than ``STREAM_MAX_LINE_BYTES`` are dropped and reported as errors. Streamed
+        texts bypass the prediction cache to keep bulk jobs from evicting hot entries.
+
+        Args:
+            chunks: Request body chunks
+            input_format: "ndjson" or "csv"
+            return_probabilities: Include probabilities for all classes
+            top_k: Include the k most probable classes
+
+        Returns:
+            Async iterator of NDJSON-encoded result lines
+        """
+        predictor = self._get_ready_predictor()
+
+        lines = iter_lines(chunks, settings.STREAM_MAX_LINE_BYTES)
+        if input_format == "csv":
+            items = iter_csv_items(lines, settings.STREAM_MAX_LINE_BYTES)
+        else:
+            items = iter_ndjson_items(lines)
+        batches = batched(items, settings.STREAM_BATCH_SIZE)
+
+        return self._stream_predictions(predictor, batches, return_probabilities, top_k)
+
+    async def _stream_predictions(
+        self,
+        predictor: Predictor,
+        batches: AsyncIterator[list[StreamItem]],
+        return_probabilities: bool,
+        top_k: int | None,
+    ) -> AsyncIterator[bytes]:
+        """Keep one batch in flight while reading the next one from the upload."""
+        in_flight: asyncio.Task | None = None
+        INFLIGHT_REQUESTS.inc()
+        try:
+            async for batch in batches:
+                task = asyncio.create_task(
+                    self._classify_stream_batch(predictor, batch, return_probabilities, top_k)
+                )
+                if in_flight is not None:
+                    yield await in_flight
+                in_flight = task
+
+            if in_flight is not None:
+                yield await in_flight
+                in_flight = None
+
+        except OverloadedError as e:
+            # Headers are already sent, so the failure is reported in-band
+            error = {"error": str(e), "status": e.status_code, "retry_after": e.retry_after}
+            yield (json.dumps(error) + "\n").encode()
+
+        except Exception as e:
+            yield (json.dumps({"error": f"Prediction failed: {e}"}) + "\n").encode()
+
+        finally:
+            INFLIGHT_REQUESTS.dec()
+            if in_flight is not None:
+                in_flight.cancel()
+
+    async def _classify_stream_batch(
+        self,
+        predictor: Predictor,
+        batch: list[StreamItem],
+        return_probabilities: bool,
+        top_k: int | None,
+    ) -> bytes:
+        """Classify one batch of streamed records and encode the results as NDJSON."""
+        valid = [item for item in batch if item.error is None]
+        results: dict[int, dict] = {}
+
+        texts = [item.text for item in valid]
+        probs = None
+        if valid:
+            # Admitted like /predict requests, so an upload holds at most the batches in
+            # flight and gets the same 429/503 when the inference queue is full
+            with self.executor.admit(len(texts)):
+                probs = await self._run_forward(texts, self._should_profile(), pipeline=True)
+
+        with POSTPROCESS_SECONDS.time():
+            if valid:
+                formatted = predictor.format_predictions(texts, probs, return_probabilities, top_k)
+                for item, result in zip(valid, formatted, strict=True):
+                    result.pop("text")
+                    results[item.index] = result
+
+            lines = [
+                StreamPredictionItem(
+                    index=item.index, id=item.id, **results.get(item.index, {"error": item.error})
+                ).model_dump_json(exclude_none=True)
+                for item in batch
+            ]
+        return ("\n".join(lines) + "\n").encode()
+
     def get_health_status(self) -> HealthResponse:
         """Get health status with model info."""
         if self.predictor is not None:
             model_status = ModelStatus(
                 available=True,
+                ready=self.ready,
                 path=self.predictor.get_model_path(),
-                error=None,
+                backend=self.predictor.backend_name,
+                precision=self.predictor.precision,
+                version=self.predictor.model_version,
+                startup_seconds=self.startup_timings or None,
+                error=self.error,
             )
         else:
             model_status = ModelStatus(
@@ -85,7 +614,99 @@ class ClassifierService:
                 error=self.error,
             )
 
-        return HealthResponse(status="healthy", model=model_status)
+        process = ProcessStatus(pid=os.getpid(), cpus=process_cpus(), **read_memory_usage())
+
+        if self.predictor is None or self.ready:
+            api_status = "healthy"
+        else:
+            api_status = "warming_up" if self.error is None else "unhealthy"
+
+        return HealthResponse(status=api_status, model=model_status, process=process)
+
+    def get_cache_stats(self) -> CacheStatsResponse:
+        """Get prediction cache hit/miss counters."""
+        if self.cache is None:
+            return CacheStatsResponse(enabled=False)
+
+        stats = self.cache.stats()
+        return CacheStatsResponse(enabled=True, hit_rate=round(stats.hit_rate, 4), **vars(stats))
+
+    def get_neardup_stats(self) -> NearDupStatsResponse:
+        """Get near-duplicate pre-filter counters and recent audit disagreements."""
+        if self.neardup is None or self.predictor is None:
+            return NearDupStatsResponse(enabled=False)
+
+        stats = self.neardup.stats()
+        id2label = self.predictor.id2label
+        disagreements = [
+            NearDupAuditSample(
+                text=d["text"],
+                reused_label=id2label[d["reused_label_id"]],
+                model_label=id2label[d["model_label_id"]],
+            )
+            for d in stats.disagreements
+        ]
+        return NearDupStatsResponse(
+            enabled=True,
+            size=stats.size,
+            max_size=stats.max_size,
+            threshold=stats.threshold,
+            lookups=stats.lookups,
+            short_circuited=stats.short_circuited,
+            short_circuit_rate=round(stats.short_circuit_rate, 4),
+            audited=stats.audited,
+            audit_agreement=stats.audit_agreement,
+            disagreements=disagreements,
+        )
+
+    def get_cascade_stats(self) -> CascadeStatsResponse:
+        """Get counters of texts answered by the linear model vs escalated to BERT."""
+        if self.cascade is None:
+            return CascadeStatsResponse(enabled=False)
+
+        counts = self.cascade_counts
+        thresholds = {
+            label: None if threshold == float("inf") else round(float(threshold), 4)
+            for label, threshold in zip(self.cascade.classes, self.cascade.thresholds, strict=True)
+        }
+        return CascadeStatsResponse(
+            enabled=True,
+            mode=settings.CASCADE_MODE,
+            accept_rate=round(counts["accepted"] / counts["texts"], 4) if counts["texts"] else 0,
+            thresholds=thresholds,
+            **counts,
+        )
+
+    def get_profiling_status(self) -> ProfilingStatusResponse:
+        """Get profiler settings and the most recent profiles."""
+        if self.profiler is None:
+            return ProfilingStatusResponse(enabled=False)
+
+        profiler = self.profiler
+        return ProfilingStatusResponse(
+            enabled=True,
+            sample_rate=profiler.sample_rate,
+            armed=profiler.armed,
+            profiled=profiler.profiled,
+            skipped=profiler.skipped,
+            output_dir=str(profiler.output_dir),
+            recent=[ProfileRecord(**record) for record in reversed(profiler.recent)],
+        )
+
+    def configure_profiling(
+        self, requests: int = 0, sample_rate: float | None = None
+    ) -> ProfilingStatusResponse:
+        """Profile the next ``requests`` forward passes and/or change the sample rate."""
+        if self.profiler is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Profiling is disabled (PROFILING_ENABLED=false)",
+            )
+
+        self.profiler.arm(requests)
+        if sample_rate is not None:
+            self.profiler.sample_rate = sample_rate
+        return self.get_profiling_status()
 
     def get_models_info(self) -> ModelsInfoResponse:
         """Get information about model and classes."""
@@ -97,7 +718,11 @@ class ClassifierService:
             model_available=True,
             num_classes=len(predictor.id2label),
             classes=classes,
+            backend=predictor.backend_name,
+            precision=predictor.precision,
         )
 
 
 classifier_service = ClassifierService()
+service_collector = ServiceCollector(classifier_service)
+REGISTRY.register(service_collector)
@@ -0,0 +1,190 @@
+import csv
+import json
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class StreamItem:
+    """One input record of a streaming upload."""
+
+    index: int
+    text: str | None
+    id: Any = None
+    error: str | None = None
+
+
+@dataclass
+class OversizedLine:
+    """Placeholder for a line longer than the limit; its content is dropped."""
+
+    limit: int
+    # Quotes in the dropped content, so CSV parsing keeps track of quoted fields
+    quotes: int = 0
+
+
+@dataclass
+class UndecodableLine:
+    """Placeholder for a line that is not valid UTF-8."""
+
+    reason: str
+    quotes: int = 0
+
+
+Line = str | OversizedLine | UndecodableLine
+
+
+def _decode_line(buffer: bytearray) -> str | UndecodableLine:
+    try:
+        return buffer.decode("utf-8").rstrip("\r")
+    except UnicodeDecodeError as e:
+        return UndecodableLine(reason=str(e), quotes=buffer.count(b'"'))
+
+
+async def iter_lines(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[Line]:
+    """
+    Split an incoming byte stream into decoded lines without buffering the whole body.
+
+    Only the newly received chunk is scanned for line breaks. A line longer than
+    ``max_line_bytes`` is dropped as it arrives and reported as ``OversizedLine``, so
+    memory stays bounded even for a body without line breaks. Each line is decoded on
+    its own; one that is not valid UTF-8 is reported as ``UndecodableLine``.
+    """
+    buffer = bytearray()
+    oversized: OversizedLine | None = None
+
+    async for chunk in chunks:
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            piece = chunk[start:] if end < 0 else chunk[start:end]
+            if oversized is not None:
+                oversized.quotes += piece.count(b'"')
+            else:
+                buffer += piece
+                if len(buffer) > max_line_bytes:
+                    oversized = OversizedLine(limit=max_line_bytes, quotes=buffer.count(b'"'))
+                    buffer.clear()
+            if end < 0:
+                break
+
+            if oversized is not None:
+                yield oversized
+                oversized = None
+            else:
+                yield _decode_line(buffer)
+                buffer.clear()
+            start = end + 1
+
+    if oversized is not None:
+        yield oversized
+    elif buffer:
+        yield _decode_line(buffer)
+
+
+async def iter_ndjson_items(lines: AsyncIterator[Line]) -> AsyncIterator[StreamItem]:
+    """Parse NDJSON lines: each a JSON string or an object with "text" and optional "id"."""
+    index = 0
+    async for line in lines:
+        if isinstance(line, OversizedLine):
+            yield StreamItem(index=index, text=None, error=f"Line exceeds {line.limit} bytes")
+            index += 1
+            continue
+        if isinstance(line, UndecodableLine):
+            yield StreamItem(index=index, text=None, error=f"Invalid UTF-8: {line.reason}")
+            index += 1
+            continue
+        if not line.strip():
+            continue
+
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield StreamItem(index=index, text=None, error=f"Invalid JSON: {e}")
+        else:
+            if isinstance(record, str):
+                yield StreamItem(index=index, text=record)
+            elif isinstance(record, dict) and isinstance(record.get("text"), str):
+                yield StreamItem(index=index, text=record["text"], id=record.get("id"))
+            else:
+                yield StreamItem(index=index, text=None, error='Expected a string or {"text": ...}')
+        index += 1
+
+
+async def iter_csv_items(
+    lines: AsyncIterator[Line], max_record_chars: int
+) -> AsyncIterator[StreamItem]:
+    """
+    Parse CSV lines with a header row.
+
+    Texts are taken from the "text" column (or the first column) and ids from an optional
+    "id" column. Quoted fields may span several lines; a record longer than
+    ``max_record_chars`` or with a line that is not valid UTF-8 is dropped and reported
+    as an error item.
+    """
+    header: list[str] | None = None
+    pending: list[str] = []
+    size = 0
+    quotes = 0
+    error: str | None = None
+    index = 0
+
+    async for line in lines:
+        if isinstance(line, OversizedLine):
+            quotes += line.quotes
+            error = error or f"Record exceeds {max_record_chars} characters"
+        elif isinstance(line, UndecodableLine):
+            quotes += line.quotes
+            error = error or f"Invalid UTF-8: {line.reason}"
+        else:
+            quotes += line.count('"')
+            size += len(line) + 1
+            if error is None and size > max_record_chars:
+                error = f"Record exceeds {max_record_chars} characters"
+        if error is not None:
+            pending = []
+        else:
+            pending.append(line)
+        if quotes % 2:
+            # Inside a quoted field that continues on the next line
+            continue
+
+        record = "\n".join(pending)
+        dropped = error
+        pending, size, quotes, error = [], 0, 0, None
+
+        if dropped is not None:
+            if header is None:
+                raise ValueError(f"Invalid CSV header: {dropped}")
+            yield StreamItem(index=index, text=None, error=dropped)
+            index += 1
+            continue
+        if not record.strip():
+            continue
+
+        row = next(csv.reader([record]))
+        if header is None:
+            header = row
+            text_column = header.index("text") if "text" in header else 0
+            id_column = header.index("id") if "id" in header else None
+            continue
+
+        if text_column >= len(row):
+            yield StreamItem(index=index, text=None, error="Missing text column")
+        else:
+            item_id = row[id_column] if id_column is not None and id_column < len(row) else None
+            yield StreamItem(index=index, text=row[text_column], id=item_id)
+        index += 1
+
+
+async def batched(items: AsyncIterator[StreamItem], size: int) -> AsyncIterator[list[StreamItem]]:
+    """Group stream items into lists of at most ``size``."""
+    batch: list[StreamItem] = []
+    async for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
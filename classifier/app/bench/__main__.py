@@ -0,0 +1,82 @@
+import argparse
+import sys
+
+from ..config import settings
+from .onnx import run_onnx_parity
+from .padding import run_padding_benchmark
+from .precision import PRECISIONS, run_precision_eval
+from .suite import LENGTH_PROFILES, VARIANTS, run_suite
+from .tiny import TINY_BUNDLE_DIR, build_tiny_bundle
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.bench", description="Predictor benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    padding = subparsers.add_parser("padding", help="Padded batch vs length-bucketed sub-batches")
+    padding.add_argument("--num-texts", type=int, default=2000)
+    padding.add_argument("--batch-size", type=int, default=100)
+    padding.add_argument("--output", default=None)
+
+    onnx = subparsers.add_parser("onnx", help="ONNX vs PyTorch logits parity and latency")
+    onnx.add_argument("--num-texts", type=int, default=512)
+    onnx.add_argument("--batch-size", type=int, default=32)
+    onnx.add_argument("--atol", type=float, default=1e-3)
+    onnx.add_argument("--bundle", default=None, help="Model bundle (default: configured model)")
+    onnx.add_argument("--tiny", action="store_true", help="Check the tiny random model offline")
+    onnx.add_argument("--output", default=None)
+
+    precision = subparsers.add_parser("precision", help="Accuracy vs latency/memory per precision")
+    precision.add_argument("--precisions", nargs="+", choices=PRECISIONS, default=list(PRECISIONS))
+    precision.add_argument("--batch-size", type=int, default=32)
+    precision.add_argument("--max-texts", type=int, default=None)
+    precision.add_argument("--output", default=None)
+
+    suite = subparsers.add_parser("suite", help="Offline Predictor/service sweep on CPU")
+    suite.add_argument("--bundle", default=None, help="Model bundle (default: tiny random model)")
+    suite.add_argument("--variants", nargs="+", choices=VARIANTS, default=list(VARIANTS))
+    suite.add_argument("--batch-sizes", nargs="+", type=int, default=[1, 8, 32])
+    suite.add_argument(
+        "--profiles", nargs="+", choices=list(LENGTH_PROFILES), default=list(LENGTH_PROFILES)
+    )
+    suite.add_argument("--num-texts", type=int, default=256)
+    suite.add_argument("--concurrency", type=int, default=8)
+    suite.add_argument("--no-service", action="store_true", help="Skip the service benchmark")
+    suite.add_argument("--output", default=None)
+
+    tiny = subparsers.add_parser("tiny", help="Build the tiny random-weights model bundle")
+    tiny.add_argument("--output", default=TINY_BUNDLE_DIR)
+
+    args = parser.parse_args()
+
+    if args.command == "padding":
+        run_padding_benchmark(args.num_texts, args.batch_size, args.output)
+    elif args.command == "onnx":
+        bundle_dir = args.bundle
+        if args.tiny:
+            bundle_dir = TINY_BUNDLE_DIR
+            build_tiny_bundle(bundle_dir, max_length=settings.MAX_LENGTH)
+        report = run_onnx_parity(
+            args.num_texts, args.batch_size, args.atol, args.output, bundle_dir=bundle_dir
+        )
+        if not report["passed"]:
+            sys.exit(1)
+    elif args.command == "precision":
+        run_precision_eval(tuple(args.precisions), args.batch_size, args.max_texts, args.output)
+    elif args.command == "suite":
+        run_suite(
+            bundle_dir=args.bundle,
+            variants=tuple(args.variants),
+            batch_sizes=tuple(args.batch_sizes),
+            profiles=tuple(args.profiles),
+            num_texts=args.num_texts,
+            concurrency=args.concurrency,
+            include_service=not args.no_service,
+            output=args.output,
+        )
+    elif args.command == "tiny":
+        build_tiny_bundle(args.output, max_length=settings.MAX_LENGTH)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import random
+import resource
+from pathlib import Path
+
+from ..config import settings
+from ..data.dataset import DataManagerConfig, SMSDataManager
+
+_WORDS = (
+    "скидка акция только сегодня ваш заказ доставлен код подтверждения кредит одобрен "
+    "звоните бесплатно запись к врачу на завтра в приглашаем вакансия курьер оплата "
+    "ежедневно квартира новостройке ипотека от курсы английского языка аптека рядом с "
+    "домом шины сервис промокод подробнее по ссылке мероприятие билеты юрист консультация "
+    "страховка смартфон рассрочка успейте осталось дня"
+).split()
+_TOKENS = ["{n}%", "{n} руб.", "+7 9{n}", "https://clck.ru/{n}", "{n}"]
+
+
+def onnx_export_path(bundle_dir: Path) -> Path:
+    """
+    ONNX export location for a benchmarked bundle, kept under WEIGHTS_DIR.
+
+    Exports must not land in the bundle itself, where ``write_manifest`` would checksum
+    them on the next build.
+    """
+    return settings.WEIGHTS_DIR / "onnx" / Path(bundle_dir).resolve().name / "model.onnx"
+
+
+def sample_sms_texts(num_texts: int, seed: int = 42) -> list[str]:
+    """
+    Sample texts with a realistic SMS length mix.
+
+    Uses the test split when it is available locally, otherwise generates synthetic
+    texts: mostly single-segment messages (~70 chars) with a long multipart tail.
+    """
+    try:
+        manager = SMSDataManager(DataManagerConfig(data_dir=settings.DATA_DIR))
+        manager.load_all()
+        texts, _ = manager.get_texts_and_labels("test")
+        rng = random.Random(seed)
+        return [rng.choice(texts) for _ in range(num_texts)]
+    except (ValueError, FileNotFoundError):
+        pass
+
+    return synthetic_sms_texts(num_texts, seed)
+
+
+def synthetic_sms_texts(
+    num_texts: int, seed: int = 42, mu: float = 4.3, sigma: float = 0.6
+) -> list[str]:
+    """
+    Generate SMS-like texts with a lognormal character length distribution.
+
+    The defaults give mostly single-segment messages (~70 chars) with a long multipart
+    tail; ``mu`` and ``sigma`` shift and widen the distribution.
+    """
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(num_texts):
+        target = min(1000, max(10, int(rng.lognormvariate(mu, sigma))))
+        words: list[str] = []
+        while sum(len(w) + 1 for w in words) < target:
+            if rng.random() < 0.15:
+                words.append(rng.choice(_TOKENS).format(n=rng.randint(1, 99999)))
+            else:
+                words.append(rng.choice(_WORDS))
+        texts.append(" ".join(words).capitalize())
+    return texts
+
+
+def current_rss_mb() -> float:
+    """Resident set size of this process in MiB (Linux /proc, else peak RSS)."""
+    try:
+        with open("/proc/self/status", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return peak_rss_mb()
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import torch
+
+from ..config import settings
+from ..predict.predictor import Predictor
+from ..utils.reporting import chunked, save_report, time_calls
+from .common import onnx_export_path, sample_sms_texts
+
+
+def run_onnx_parity(
+    num_texts: int = 512,
+    batch_size: int = 32,
+    atol: float = 1e-3,
+    output: Path | str | None = None,
+    bundle_dir: Path | str | None = None,
+) -> dict:
+    """
+    Check that the ONNX backend reproduces PyTorch logits and compare latency.
+
+    Labels must match except on near-ties (top-2 logit margin within ``2 * atol``), where
+    a difference below the tolerance may legitimately flip the argmax.
+
+    Args:
+        num_texts: Number of sampled SMS texts
+        batch_size: Texts per request
+        atol: Max allowed absolute logit difference
+        output: Optional path of the JSON report
+        bundle_dir: Model bundle to check (default: configured model); the ONNX export
+            is cached under WEIGHTS_DIR/onnx
+
+    Returns:
+        Report with ``passed`` set when logits and predicted labels match
+    """
+    if bundle_dir is not None:
+        settings.MODEL_BUNDLE_DIR = Path(bundle_dir)
+        settings.MODEL_OFFLINE = True
+        settings.ONNX_PATH = onnx_export_path(Path(bundle_dir))
+
+    reference = Predictor(backend="torch", precision="fp32")
+    reference.load()
+    candidate = Predictor(backend="onnx", precision="fp32")
+    candidate.load()
+
+    batches = chunked(sample_sms_texts(num_texts), batch_size)
+
+    max_diff = 0.0
+    agree = 0
+    mismatches = 0
+    for batch in batches:
+        expected = reference.predict_logits(batch).float().cpu()
+        actual = candidate.predict_logits(batch).float().cpu()
+        max_diff = max(max_diff, (expected - actual).abs().max().item())
+        same = expected.argmax(dim=1) == actual.argmax(dim=1)
+        agree += int(same.sum().item())
+        top2 = expected.topk(min(2, expected.shape[1]), dim=1).values
+        margin = top2[:, 0] - top2[:, -1]
+        mismatches += int((~same & (margin > 2 * atol)).sum().item())
+
+    for predictor in (reference, candidate):
+        predictor.predict(batches[0])  # warmup
+
+    report = {
+        "num_texts": num_texts,
+        "batch_size": batch_size,
+        "atol": atol,
+        "max_abs_logit_diff": round(max_diff, 6),
+        "label_agreement": round(agree / num_texts, 4),
+        "label_mismatches": mismatches,
+        "passed": max_diff <= atol and mismatches == 0,
+        "torch": {"threads": torch.get_num_threads(), **time_calls(reference.predict, batches)},
+        "onnx": time_calls(candidate.predict, batches),
+    }
+
+    save_report(report, output)
+    return report
@@ -0,0 +1,73 @@
+from pathlib import Path
+
+from ..config import settings
+from ..predict.bucketing import padded_tokens, plan_buckets
+from ..predict.predictor import Predictor
+from ..utils.reporting import chunked, save_report, time_calls
+from .common import sample_sms_texts
+
+
+def run_padding_benchmark(
+    num_texts: int = 2000,
+    batch_size: int = 100,
+    output: Path | str | None = None,
+) -> dict:
+    """
+    Compare one padded batch against length-bucketed sub-batches.
+
+    Texts are split into request-sized batches; for each mode the padding share of all
+    tokens fed to the model and the per-request latency are reported.
+
+    Args:
+        num_texts: Number of sampled SMS texts
+        batch_size: Texts per request
+        output: Optional path of the JSON report
+
+    Returns:
+        Benchmark report
+    """
+    # The tokenization pipeline would re-split each request into PIPELINE_CHUNK_SIZE
+    # sub-batches, so "padded" would no longer be the single batch counted below
+    settings.PIPELINE_ENABLED = False
+
+    predictor = Predictor()
+    predictor.load()
+
+    texts = sample_sms_texts(num_texts)
+    batches = chunked(texts, batch_size)
+
+    encoded = predictor.tokenizer(texts, truncation=True, max_length=settings.MAX_LENGTH)
+    lengths = [len(ids) for ids in encoded["input_ids"]]
+    real_tokens = sum(lengths)
+
+    report = {
+        "num_texts": num_texts,
+        "batch_size": batch_size,
+        "mean_tokens": round(real_tokens / num_texts, 1),
+        "max_tokens": max(lengths),
+        "modes": {},
+    }
+
+    for name, bucketing in (("padded", False), ("bucketed", True)):
+        total = 0
+        for start in range(0, num_texts, batch_size):
+            batch_lengths = lengths[start : start + batch_size]
+            if bucketing:
+                buckets = plan_buckets(
+                    batch_lengths, settings.BUCKET_MAX_TOKENS, settings.BUCKET_MAX_SIZE
+                )
+            else:
+                buckets = [list(range(len(batch_lengths)))]
+            total += padded_tokens(batch_lengths, buckets)
+
+        predictor.bucketing = bucketing
+        predictor.predict(batches[0])  # warmup
+
+        report["modes"][name] = {
+            "padded_tokens": total,
+            "padding_ratio": round(1 - real_tokens / total, 4),
+            **time_calls(predictor.predict, batches),
+        }
+
+    save_report(report, output)
+    return report
@@ -0,0 +1,86 @@
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from sklearn.metrics import accuracy_score, f1_score
+
+from ..config import settings
+from ..data.dataset import DataManagerConfig, SMSDataManager
+from ..predict.predictor import Predictor
+from ..utils.reporting import chunked, save_report, time_calls
+from .common import current_rss_mb, peak_rss_mb
+
+PRECISIONS = ("fp32", "bf16", "int8")
+
+
+def _evaluate_precision(precision: str, batch_size: int, max_texts: int | None) -> dict:
+    """Load one precision mode and evaluate it on the test split (runs in a fresh process)."""
+    manager = SMSDataManager(
+        DataManagerConfig(
+            data_dir=settings.DATA_DIR,
+            train_file=settings.TRAIN_FILE,
+            val_file=settings.VAL_FILE,
+            test_file=settings.TEST_FILE,
+        )
+    )
+    manager.load_all()
+    texts, labels = manager.get_texts_and_labels("test")
+    if max_texts is not None:
+        texts, labels = texts[:max_texts], labels[:max_texts]
+    expected = [manager.id2label[label] for label in labels]
+
+    rss_before = current_rss_mb()
+    predictor = Predictor(precision=precision)
+    predictor.load()
+    rss_loaded = current_rss_mb()
+
+    batches = chunked(texts, batch_size)
+    predicted: list[str] = []
+    for batch in batches:
+        predicted.extend(r["label"] for r in predictor.predict(batch))
+
+    return {
+        "accuracy": round(accuracy_score(expected, predicted), 4),
+        "f1_weighted": round(f1_score(expected, predicted, average="weighted"), 4),
+        "f1_macro": round(f1_score(expected, predicted, average="macro"), 4),
+        **time_calls(predictor.predict, batches),
+        "model_rss_mb": round(rss_loaded - rss_before, 1),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_precision_eval(
+    precisions: tuple[str, ...] = PRECISIONS,
+    batch_size: int = 32,
+    max_texts: int | None = None,
+    output: Path | str | None = None,
+) -> dict:
+    """
+    Compare accuracy/F1 on the test split against latency and memory per precision mode.
+
+    Every mode runs in its own spawned process so resident memory is not shared between
+    modes.
+
+    Args:
+        precisions: Modes to evaluate
+        batch_size: Texts per request
+        max_texts: Optional cap on the number of test texts
+        output: Optional path of the JSON report
+
+    Returns:
+        Report with metrics per precision mode
+    """
+    report = {
+        "backend": settings.INFERENCE_BACKEND,
+        "batch_size": batch_size,
+        "modes": {},
+    }
+
+    for precision in precisions:
+        print(f"Evaluating {precision}...")
+        with ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context("spawn")) as pool:
+            future = pool.submit(_evaluate_precision, precision, batch_size, max_texts)
+            report["modes"][precision] = future.result()
+
+    save_report(report, output)
+    return report
@@ -0,0 +1,197 @@
+import asyncio
+import multiprocessing as mp
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from ..api.service import ClassifierService
+from ..config import settings
+from ..predict.bundle import read_manifest
+from ..predict.predictor import Predictor
+from ..utils.reporting import chunked, save_report, summarize_latencies, time_calls
+from .common import current_rss_mb, onnx_export_path, peak_rss_mb, synthetic_sms_texts
+from .tiny import TINY_BUNDLE_DIR, build_tiny_bundle
+
+VARIANTS = ("torch-fp32", "torch-bf16", "torch-int8", "onnx-fp32", "onnx-int8")
+# Lognormal (mu, sigma) of text length in characters
+LENGTH_PROFILES = {"short": (3.4, 0.3), "sms": (4.3, 0.6), "long": (6.0, 0.4)}
+
+
+def _configure(bundle_dir: Path, variant: str, **overrides) -> None:
+    """Point settings at the benchmark bundle and the variant's backend/precision."""
+    backend, precision = variant.split("-")
+    settings.MODEL_BUNDLE_DIR = bundle_dir
+    settings.MODEL_OFFLINE = True
+    settings.ONNX_PATH = onnx_export_path(bundle_dir)
+    settings.INFERENCE_BACKEND = backend
+    settings.PRECISION = precision
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+
+
+def _profile_texts(profile: str, num_texts: int) -> list[str]:
+    mu, sigma = LENGTH_PROFILES[profile]
+    return synthetic_sms_texts(num_texts, seed=1, mu=mu, sigma=sigma)
+
+
+def _bench_predictor(
+    bundle_dir: Path,
+    variant: str,
+    batch_sizes: list[int],
+    profiles: list[str],
+    num_texts: int,
+) -> dict:
+    """Time ``Predictor.predict`` for one variant (runs in a fresh process)."""
+    _configure(bundle_dir, variant)
+    rss_before = current_rss_mb()
+    predictor = Predictor()
+    try:
+        predictor.load()
+    except Exception as e:
+        return {"error": str(e)}
+    rss_loaded = current_rss_mb()
+
+    results = []
+    for profile in profiles:
+        texts = _profile_texts(profile, num_texts)
+        for batch_size in batch_sizes:
+            batches = chunked(texts, batch_size)
+            predictor.predict(batches[0])  # warmup
+            results.append(
+                {
+                    "profile": profile,
+                    "batch_size": batch_size,
+                    **time_calls(predictor.predict, batches),
+                }
+            )
+
+    return {
+        "model_rss_mb": round(rss_loaded - rss_before, 1),
+        "peak_rss_mb": peak_rss_mb(),
+        "results": results,
+    }
+
+
+async def _time_service(service, batches: list[list[str]], concurrency: int) -> dict:
+    """Send batches from ``concurrency`` concurrent clients and summarize latency."""
+    latencies: list[float] = []
+
+    async def client(own: list[list[str]]) -> None:
+        for batch in own:
+            t0 = time.perf_counter()
+            await service.predict(batch)
+            latencies.append((time.perf_counter() - t0) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(batches[i::concurrency]) for i in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return summarize_latencies(latencies, sum(len(b) for b in batches), elapsed)
+
+
+def _bench_service(
+    bundle_dir: Path,
+    variant: str,
+    batch_sizes: list[int],
+    profiles: list[str],
+    num_texts: int,
+    concurrency: int,
+) -> dict:
+    """Time ``ClassifierService.predict`` for one variant (runs in a fresh process)."""
+    # The cache would answer repeated runs without the model
+    _configure(bundle_dir, variant, PREDICTION_CACHE_ENABLED=False)
+
+    async def run() -> dict:
+        service = ClassifierService()
+        service.load()
+        if service.predictor is None:
+            return {"error": service.error}
+
+        await service.start()
+        try:
+            while not service.ready:
+                if service.error is not None:
+                    return {"error": service.error}
+                await asyncio.sleep(0.05)
+
+            results = []
+            for profile in profiles:
+                texts = _profile_texts(profile, num_texts)
+                for batch_size in batch_sizes:
+                    batches = chunked(texts, batch_size)
+                    await service.predict(batches[0])  # warmup
+                    for clients in sorted({1, concurrency}):
+                        results.append(
+                            {
+                                "profile": profile,
+                                "batch_size": batch_size,
+                                "concurrency": clients,
+                                **(await _time_service(service, batches, clients)),
+                            }
+                        )
+            return {"peak_rss_mb": peak_rss_mb(), "results": results}
+        finally:
+            await service.stop()
+
+    return asyncio.run(run())
+
+
+def run_suite(
+    bundle_dir: Path | str | None = None,
+    variants: tuple[str, ...] = VARIANTS,
+    batch_sizes: tuple[int, ...] = (1, 8, 32),
+    profiles: tuple[str, ...] = tuple(LENGTH_PROFILES),
+    num_texts: int = 256,
+    concurrency: int = 8,
+    include_service: bool = True,
+    output: Path | str | None = None,
+) -> dict:
+    """
+    Benchmark ``Predictor.predict`` and ``ClassifierService.predict`` fully offline on CPU.
+
+    Without ``bundle_dir`` a tiny randomly initialized ModernBERT bundle is built
+    locally, so the suite needs no network and no trained weights. Every variant
+    (backend-precision) runs in its own spawned process so peak RSS is per variant.
+
+    Args:
+        bundle_dir: Model bundle to benchmark (default: tiny random model in bench/)
+        variants: Backend-precision pairs, e.g. "torch-fp32", "onnx-int8"
+        batch_sizes: Texts per request
+        profiles: Text length distributions (short, sms, long)
+        num_texts: Texts per profile
+        concurrency: Concurrent clients for the service benchmark
+        include_service: Also benchmark the service path (executor, batcher, ...)
+        output: Optional path of the JSON report
+
+    Returns:
+        Report with throughput, p50/p99 latency and peak RSS per variant
+    """
+    if bundle_dir is None:
+        bundle_dir = Path(TINY_BUNDLE_DIR)
+        manifest = build_tiny_bundle(bundle_dir, max_length=settings.MAX_LENGTH)
+    else:
+        manifest = read_manifest(Path(bundle_dir)) or {"version": "unknown"}
+    bundle_dir = Path(bundle_dir).resolve()
+
+    report = {
+        "model": manifest["version"],
+        "num_texts": num_texts,
+        "batch_sizes": list(batch_sizes),
+        "profiles": list(profiles),
+        "concurrency": concurrency,
+        "variants": {},
+    }
+
+    context = mp.get_context("spawn")
+    for variant in variants:
+        print(f"Benchmarking {variant}...")
+        args = (bundle_dir, variant, list(batch_sizes), list(profiles), num_texts)
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            entry = {"predictor": pool.submit(_bench_predictor, *args).result()}
+        if include_service and "error" not in entry["predictor"]:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                entry["service"] = pool.submit(_bench_service, *args, concurrency).result()
+        report["variants"][variant] = entry
+
+    save_report(report, output)
+    return report
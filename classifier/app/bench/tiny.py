@@ -0,0 +1,111 @@
+import json
+from pathlib import Path
+
+import torch
+from tokenizers import Tokenizer, models, normalizers, pre_tokenizers, processors, trainers
+from transformers import (
+    AutoModelForSequenceClassification,
+    ModernBertConfig,
+    PreTrainedTokenizerFast,
+)
+
+from ..predict.bundle import LABELS_NAME, read_manifest, write_manifest
+from .common import synthetic_sms_texts
+
+TINY_BUNDLE_DIR = "bench/tiny-model"
+SPECIAL_TOKENS = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"]
+TINY_LABELS = ["ham", "spam", "promo", "fraud", "service", "delivery", "bank", "other"]
+
+
+def build_tiny_tokenizer(vocab_size: int = 2000, max_length: int = 256) -> PreTrainedTokenizerFast:
+    """Train a small WordPiece tokenizer on synthetic SMS texts (no download)."""
+    tokenizer = Tokenizer(models.WordPiece(unk_token="[UNK]"))
+    tokenizer.normalizer = normalizers.BertNormalizer(lowercase=True)
+    tokenizer.pre_tokenizer = pre_tokenizers.BertPreTokenizer()
+    trainer = trainers.WordPieceTrainer(vocab_size=vocab_size, special_tokens=SPECIAL_TOKENS)
+    tokenizer.train_from_iterator(synthetic_sms_texts(5000, seed=0), trainer)
+
+    cls_id, sep_id = tokenizer.token_to_id("[CLS]"), tokenizer.token_to_id("[SEP]")
+    tokenizer.post_processor = processors.TemplateProcessing(
+        single="[CLS] $A [SEP]",
+        pair="[CLS] $A [SEP] $B:1 [SEP]:1",
+        special_tokens=[("[CLS]", cls_id), ("[SEP]", sep_id)],
+    )
+
+    return PreTrainedTokenizerFast(
+        tokenizer_object=tokenizer,
+        unk_token="[UNK]",
+        pad_token="[PAD]",
+        cls_token="[CLS]",
+        sep_token="[SEP]",
+        mask_token="[MASK]",
+        model_input_names=["input_ids", "attention_mask"],
+        model_max_length=max_length,
+    )
+
+
+def build_tiny_bundle(
+    output_dir: Path | str,
+    hidden_size: int = 64,
+    num_layers: int = 2,
+    num_heads: int = 2,
+    vocab_size: int = 2000,
+    max_length: int = 256,
+    seed: int = 0,
+) -> dict:
+    """
+    Build a randomly initialized ModernBERT-style classifier bundle fully offline.
+
+    The bundle has the same layout as ``python -m app.bundle build`` (weights, config,
+    tokenizer, ``id2label.json``, manifest), so ``Predictor`` loads it unchanged.
+    Reuses an existing bundle with the same shape.
+
+    Args:
+        output_dir: Bundle directory
+        hidden_size: Hidden size of the encoder
+        num_layers: Number of encoder layers
+        num_heads: Number of attention heads
+        vocab_size: Tokenizer vocabulary size
+        max_length: Max sequence length
+        seed: Weight initialization seed
+
+    Returns:
+        The bundle manifest
+    """
+    output_dir = Path(output_dir)
+    version = f"tiny-modernbert-h{hidden_size}-l{num_layers}-v{vocab_size}-s{seed}"
+    manifest = read_manifest(output_dir)
+    if manifest is not None and manifest["version"] == version:
+        return manifest
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    tokenizer = build_tiny_tokenizer(vocab_size, max_length)
+    tokenizer.save_pretrained(output_dir)
+
+    id2label = dict(enumerate(TINY_LABELS))
+    config = ModernBertConfig(
+        vocab_size=len(tokenizer),
+        hidden_size=hidden_size,
+        intermediate_size=hidden_size * 2,
+        num_hidden_layers=num_layers,
+        num_attention_heads=num_heads,
+        max_position_embeddings=max_length,
+        local_attention=64,
+        pad_token_id=tokenizer.pad_token_id,
+        cls_token_id=tokenizer.cls_token_id,
+        sep_token_id=tokenizer.sep_token_id,
+        reference_compile=False,
+        id2label=id2label,
+        label2id={label: i for i, label in id2label.items()},
+    )
+    torch.manual_seed(seed)
+    AutoModelForSequenceClassification.from_config(config).save_pretrained(output_dir)
+
+    labels = {str(k): v for k, v in id2label.items()}
+    (output_dir / LABELS_NAME).write_text(
+        json.dumps(labels, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+
+    manifest = write_manifest(output_dir, version=version, tokenizer="local-wordpiece")
+    print(f"Tiny model bundle saved to {output_dir} ({version})")
+    return manifest
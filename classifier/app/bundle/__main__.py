@@ -0,0 +1,42 @@
+import argparse
+import sys
+from pathlib import Path
+
+from ..config import settings
+from ..predict.bundle import BundleError, build_bundle, verify_bundle
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.bundle", description="Model bundle tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build = subparsers.add_parser("build", help="Download model files into a local bundle")
+    build.add_argument("--output", type=Path, default=settings.MODEL_BUNDLE_DIR)
+    build.add_argument("--repo-id", default=settings.HF_REPO_ID)
+    build.add_argument("--tokenizer", default=settings.PRETRAINED_MODEL)
+    build.add_argument("--revision", default=None)
+
+    verify = subparsers.add_parser("verify", help="Check bundle files against the manifest")
+    verify.add_argument("--path", type=Path, default=settings.MODEL_BUNDLE_DIR)
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        build_bundle(
+            args.output,
+            repo_id=args.repo_id,
+            tokenizer_name=args.tokenizer,
+            token=settings.HF_TOKEN,
+            revision=args.revision,
+        )
+    elif args.command == "verify":
+        try:
+            manifest = verify_bundle(args.path)
+        except BundleError as e:
+            print(f"Bundle invalid: {e}")
+            sys.exit(1)
+        print(f"Bundle OK: {manifest['version']} ({len(manifest['files'])} files)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+import argparse
+from pathlib import Path
+
+from ..config import settings
+from .train import run_cascade_training
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.cascade", description="Train the linear first stage of the cascade"
+    )
+    parser.add_argument("--target-accuracy", type=float, default=settings.CASCADE_TARGET_ACCURACY)
+    parser.add_argument("--output", type=Path, default=settings.CASCADE_PATH)
+    parser.add_argument("--report", default=None)
+
+    args = parser.parse_args()
+
+    run_cascade_training(args.target_accuracy, args.output, args.report)
+
+
+if __name__ == "__main__":
+    main()
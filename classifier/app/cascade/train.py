@@ -0,0 +1,84 @@
+from pathlib import Path
+
+import numpy as np
+from sklearn.metrics import accuracy_score, f1_score
+
+from ..config import settings
+from ..data.dataset import DataManagerConfig, SMSDataManager
+from ..predict.cascade import LinearCascade
+from ..utils.reporting import save_report
+
+
+def run_cascade_training(
+    target_accuracy: float | None = None,
+    output: Path | str | None = None,
+    report_path: Path | str | None = None,
+) -> dict:
+    """
+    Train the linear first stage of the cascade and calibrate its thresholds.
+
+    The model is fitted on the train split, per-class thresholds are calibrated on the
+    val split to hold ``target_accuracy`` on accepted texts, and coverage/accuracy are
+    reported on the test split.
+
+    Args:
+        target_accuracy: Min accuracy of texts the linear model answers (default from settings)
+        output: Cascade model path (default from settings)
+        report_path: Optional path of the JSON report
+
+    Returns:
+        Report with thresholds, coverage and accuracy
+    """
+    target_accuracy = target_accuracy or settings.CASCADE_TARGET_ACCURACY
+    output = Path(output or settings.CASCADE_PATH)
+
+    # Load data
+    data_config = DataManagerConfig(
+        data_dir=settings.DATA_DIR,
+        train_file=settings.TRAIN_FILE,
+        val_file=settings.VAL_FILE,
+        test_file=settings.TEST_FILE,
+    )
+    manager = SMSDataManager(data_config)
+    manager.load_all()
+
+    def split(name: str) -> tuple[list[str], list[str]]:
+        texts, labels = manager.get_texts_and_labels(name)
+        return texts, [manager.id2label[label] for label in labels]
+
+    train_texts, train_labels = split("train")
+    val_texts, val_labels = split("val")
+    test_texts, test_labels = split("test")
+
+    print(f"Training TF-IDF + logistic regression on {len(train_texts)} texts...")
+    cascade = LinearCascade.fit(train_texts, train_labels)
+
+    print(f"Calibrating thresholds for target accuracy {target_accuracy}...")
+    cascade.calibrate(val_texts, val_labels, target_accuracy, settings.CASCADE_MIN_SUPPORT)
+    cascade.save(output)
+    print(f"Cascade model saved to {output}")
+
+    # Evaluate on test
+    probs = cascade.predict_proba(test_texts)
+    predicted = [cascade.classes[i] for i in probs.argmax(axis=1)]
+    accepted = cascade.accept(probs)
+    expected = np.array(test_labels)
+
+    report = {
+        "target_accuracy": target_accuracy,
+        "thresholds": {
+            label: (None if np.isinf(t) else round(float(t), 4))
+            for label, t in zip(cascade.classes, cascade.thresholds, strict=True)
+        },
+        "linear_accuracy": round(accuracy_score(test_labels, predicted), 4),
+        "linear_f1_weighted": round(f1_score(test_labels, predicted, average="weighted"), 4),
+        "coverage": round(float(accepted.mean()), 4),
+        "accepted_accuracy": (
+            round(float((np.array(predicted)[accepted] == expected[accepted]).mean()), 4)
+            if accepted.any()
+            else None
+        ),
+    }
+
+    save_report(report, report_path)
+    return report
@@ -16,6 +16,10 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8090
     ENVIRONMENT: Literal["dev", "test", "prod"] = "dev"
+    SERVE_WORKERS: int = 1
+    # Metrics of python -m app.serve workers are aggregated through files in this dir
+    METRICS_MULTIPROC_DIR: Path = Field(default=Path("/tmp/classifier-metrics"))
+    METRICS_PUBLISH_SECONDS: float = 5.0
 
     # Data settings
     DATA_DIR: Path = Field(default=Path("data"))
@@ -29,6 +33,69 @@ class Settings(BaseSettings):
     PRETRAINED_MODEL: str = "deepvk/RuModernBERT-base"
     MAX_LENGTH: int = 256
     DROPOUT: float = 0.1
+    INFERENCE_BACKEND: Literal["torch", "onnx"] = "torch"
+    ONNX_PATH: Path = Field(default=Path("weights/model.onnx"))
+    ONNX_OPSET: int = 17
+    ONNX_NUM_THREADS: int | None = None
+    PRECISION: Literal["fp32", "bf16", "int8"] = "fp32"
+    COMPILE_MODE: Literal["none", "inductor", "trace"] = "none"
+    COMPILE_BATCH_BUCKETS: list[int] = [1, 4, 16, 64]
+    COMPILE_SEQ_BUCKETS: list[int] = [32, 64, 128, 256]
+
+    # Inference executor settings
+    INFERENCE_LANES: int = 1
+    INFERENCE_QUEUE_SIZE: int = 2000
+    INFERENCE_WAIT_BUDGET_MS: float = 10_000
+    INFERENCE_INTRA_OP_THREADS: int | None = None
+
+    # Batching settings
+    BATCHING_ENABLED: bool = True
+    BATCH_MAX_SIZE: int = 64
+    BATCH_MAX_TOKENS: int = 16384
+    BATCH_MAX_WAIT_MS: float = 5.0
+    BUCKETING_ENABLED: bool = True
+    BUCKET_MAX_TOKENS: int = 4096
+    BUCKET_MAX_SIZE: int = 64
+
+    # Tokenization pipeline settings
+    PIPELINE_ENABLED: bool = False
+    PIPELINE_CHUNK_SIZE: int = 64
+    PIPELINE_DEPTH: int = 2
+    PIPELINE_TOKENIZER_THREADS: int = 1
+
+    # Prediction cache settings
+    PREDICTION_CACHE_ENABLED: bool = True
+    PREDICTION_CACHE_SIZE: int = 50_000
+    PREDICTION_CACHE_TTL_SECONDS: float = 600.0
+
+    # Near-duplicate pre-filter settings
+    NEARDUP_ENABLED: bool = False
+    NEARDUP_THRESHOLD: float = 0.9
+    NEARDUP_INDEX_SIZE: int = 20_000
+    NEARDUP_TTL_SECONDS: float = 600.0
+    NEARDUP_BANDS: int = 8
+    NEARDUP_MIN_LENGTH: int = 20
+    NEARDUP_MIN_CONFIDENCE: float = 0.9
+    NEARDUP_AUDIT_RATE: float = 0.01
+    NEARDUP_AUDIT_MAX_PENDING: int = 64
+
+    # Cascade settings
+    CASCADE_MODE: Literal["off", "fallback", "cascade"] = "off"
+    CASCADE_PATH: Path = Field(default=Path("weights/cascade.joblib"))
+    CASCADE_TARGET_ACCURACY: float = 0.98
+    CASCADE_MIN_SUPPORT: int = 20
+
+    # Streaming settings
+    STREAM_BATCH_SIZE: int = 256
+    STREAM_MAX_LINE_BYTES: int = 1_000_000
+
+    # Profiling settings
+    PROFILING_ENABLED: bool = False
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_OUTPUT_DIR: Path = Field(default=Path("profiles"))
+    PROFILING_MEMORY: bool = True
+    PROFILING_MAX_FILES: int = 50
+    PROFILING_TOKEN: str | None = None
 
     # Training settings
     BATCH_SIZE: int = 32
@@ -36,6 +103,13 @@ class Settings(BaseSettings):
     LEARNING_RATE: float = 2e-5
     SEED: int = 42
 
+    # Distillation settings
+    DISTILL_NUM_LAYERS: int = 6
+    DISTILL_OUTPUT_DIR: Path = Field(default=Path("weights/student"))
+    DISTILL_TEMPERATURE: float = 2.0
+    DISTILL_ALPHA: float = 0.7
+    DISTILL_LEARNING_RATE: float = 5e-5
+
     # Logging settings
     MLFLOW_TRACKING_URI: str = "mlruns"
     MLFLOW_EXPERIMENT_NAME: str = "sms-classification"
@@ -45,5 +119,11 @@ class Settings(BaseSettings):
     HF_TOKEN: str | None = None
     WEIGHTS_DIR: Path = Field(default=Path("weights"))
 
+    # Model bundle settings
+    MODEL_BUNDLE_DIR: Path = Field(default=Path("weights/bundle"))
+    MODEL_BUNDLE_VERIFY: bool = False
+    MODEL_OFFLINE: bool = False
+    WARMUP_ENABLED: bool = True
+
 
 settings = Settings()
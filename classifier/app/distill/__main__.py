@@ -0,0 +1,34 @@
+import argparse
+from pathlib import Path
+
+from ..config import settings
+from .distill import run_distillation
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.distill", description="Distill the classifier into a smaller student"
+    )
+    parser.add_argument("--layers", type=int, default=settings.DISTILL_NUM_LAYERS)
+    parser.add_argument("--output", type=Path, default=settings.DISTILL_OUTPUT_DIR)
+    parser.add_argument("--temperature", type=float, default=settings.DISTILL_TEMPERATURE)
+    parser.add_argument("--alpha", type=float, default=settings.DISTILL_ALPHA)
+    parser.add_argument("--epochs", type=int, default=settings.MAX_EPOCHS)
+    parser.add_argument("--batch-size", type=int, default=32, help="Texts per timed request")
+    parser.add_argument("--report", default=None)
+
+    args = parser.parse_args()
+
+    run_distillation(
+        num_layers=args.layers,
+        output_dir=args.output,
+        temperature=args.temperature,
+        alpha=args.alpha,
+        max_epochs=args.epochs,
+        batch_size=args.batch_size,
+        report_path=args.report,
+    )
+
+
+if __name__ == "__main__":
+    main()
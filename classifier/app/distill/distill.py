@@ -0,0 +1,351 @@
+import copy
+import json
+import re
+from functools import partial
+from pathlib import Path
+
+import lightning as pl
+import torch
+from sklearn.metrics import accuracy_score, f1_score
+from torch import nn
+from transformers import AutoModelForSequenceClassification
+
+from ..config import settings
+from ..data.dataset import DataManagerConfig, SMSDataManager
+from ..models.distillation import DistillationConfig, DistillationModule
+from ..predict.bundle import LABELS_NAME, write_manifest
+from ..predict.predictor import Predictor
+from ..utils.reporting import chunked, save_report, time_calls
+
+# Matches the layer index in BERT ("encoder.layer.3.") and ModernBERT ("layers.3.") keys
+_LAYER_RE = re.compile(r"\.(layer|layers)\.(\d+)\.")
+
+
+def select_layers(
+    num_teacher_layers: int, num_student_layers: int, period: int | None = None
+) -> list[int]:
+    """
+    Evenly spaced teacher layers to copy.
+
+    Without ``period`` the first and the last layer are always kept. With ``period``
+    (ModernBERT's ``global_attn_every_n_layers``) every kept layer satisfies
+    ``teacher_idx % period == student_idx % period``, so after renumbering each layer
+    keeps its global/local attention type; the picks are the closest such layers to
+    the even spacing.
+
+    Args:
+        num_teacher_layers: Number of encoder layers of the teacher
+        num_student_layers: Number of encoder layers of the student
+        period: Attention pattern period to preserve, None for uniform layers
+
+    Returns:
+        Increasing teacher layer indices, one per student layer
+    """
+    if num_student_layers == 1:
+        return [0]
+    step = (num_teacher_layers - 1) / (num_student_layers - 1)
+    targets = [round(i * step) for i in range(num_student_layers)]
+    if not period or period == 1:
+        return targets
+
+    keep = []
+    for student_idx, target in enumerate(targets):
+        # The next layer after the previous pick always has the right residue; leave
+        # room for the remaining student layers, which can at worst be consecutive
+        low = keep[-1] + 1 if keep else 0
+        high = num_teacher_layers - (num_student_layers - student_idx)
+        candidates = range(low, high + 1, period)
+        keep.append(min(candidates, key=lambda idx: abs(idx - target)))
+    return keep
+
+
+def build_student(teacher: nn.Module, num_layers: int) -> nn.Module:
+    """
+    Create a shallower copy of the teacher initialized from a subset of its layers.
+
+    Embeddings, classifier head and the selected encoder layers are copied, so the
+    student starts close to the teacher instead of from random weights. For ModernBERT
+    the layers are chosen so that each keeps its global/local attention type, which is
+    derived from the layer index.
+
+    Args:
+        teacher: Teacher HF sequence classifier
+        num_layers: Number of encoder layers of the student
+
+    Returns:
+        Student HF sequence classifier
+    """
+    config = copy.deepcopy(teacher.config)
+    teacher_layers = config.num_hidden_layers
+    if not 0 < num_layers < teacher_layers:
+        raise ValueError(f"Student layers must be in 1..{teacher_layers - 1}")
+
+    keep = select_layers(
+        teacher_layers, num_layers, getattr(config, "global_attn_every_n_layers", None)
+    )
+    layer_map = {str(teacher_idx): str(student_idx) for student_idx, teacher_idx in enumerate(keep)}
+    config.num_hidden_layers = num_layers
+    student = AutoModelForSequenceClassification.from_config(config)
+
+    state = {}
+    for key, value in teacher.state_dict().items():
+        match = _LAYER_RE.search(key)
+        if match is None:
+            state[key] = value
+        elif match.group(2) in layer_map:
+            state[key[: match.start(2)] + layer_map[match.group(2)] + key[match.end(2) :]] = value
+    student.load_state_dict(state)
+
+    print(f"Student initialized from teacher layers {keep} (of {teacher_layers})")
+    return student
+
+
+class DistillationDataset(torch.utils.data.Dataset):
+    """
+    Texts with labels and (for training) precomputed teacher logits.
+
+    Args:
+        texts: List of input texts
+        labels: List of labels (teacher label ids)
+        teacher_logits: Optional teacher logits [n_texts, num_classes]
+    """
+
+    def __init__(
+        self,
+        texts: list[str],
+        labels: list[int],
+        teacher_logits: torch.Tensor | None = None,
+    ):
+        self.texts = texts
+        self.labels = labels
+        self.teacher_logits = teacher_logits
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __getitem__(self, idx: int):
+        if self.teacher_logits is None:
+            return self.texts[idx], self.labels[idx]
+        return self.texts[idx], self.labels[idx], self.teacher_logits[idx]
+
+
+def collate_texts(batch, tokenizer, max_length: int):
+    """Tokenize a batch of texts with dynamic padding, keeping labels and teacher logits."""
+    texts, labels, *rest = zip(*batch, strict=True)
+    encoded = tokenizer(
+        list(texts),
+        padding=True,
+        truncation=True,
+        max_length=max_length,
+        return_tensors="pt",
+    )
+    inputs = {"input_ids": encoded["input_ids"], "attention_mask": encoded["attention_mask"]}
+    targets = torch.tensor(labels, dtype=torch.long)
+
+    if rest:
+        return inputs, targets, torch.stack(rest[0])
+    return inputs, targets
+
+
+def export_student(
+    student: nn.Module,
+    teacher: Predictor,
+    output_dir: Path,
+    num_layers: int,
+) -> dict:
+    """
+    Save the student as a model bundle that ``Predictor`` loads like the teacher.
+
+    Returns:
+        The written manifest
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    student.save_pretrained(output_dir)
+    teacher.tokenizer.save_pretrained(output_dir)
+    labels = {str(k): v for k, v in teacher.id2label.items()}
+    (output_dir / LABELS_NAME).write_text(
+        json.dumps(labels, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+
+    teacher_version = teacher.model_version.rsplit("/", 1)[0]
+    manifest = write_manifest(
+        output_dir,
+        version=f"{teacher_version}/distilled-{num_layers}l",
+        teacher=teacher_version,
+        num_layers=num_layers,
+    )
+    print(f"Student bundle saved to {output_dir} ({manifest['version']})")
+    return manifest
+
+
+def _evaluate(predictor: Predictor, texts: list[str], expected: list[str], batch_size: int):
+    """Accuracy/F1 on the test split with latency and throughput of the serving path."""
+    batches = chunked(texts, batch_size)
+    predictor.predict(batches[0])  # warmup
+
+    predicted: list[str] = []
+    for batch in batches:
+        predicted.extend(r["label"] for r in predictor.predict(batch))
+
+    return {
+        "parameters": sum(p.numel() for p in predictor.model.parameters()),
+        "accuracy": round(accuracy_score(expected, predicted), 4),
+        "f1_weighted": round(f1_score(expected, predicted, average="weighted"), 4),
+        "f1_macro": round(f1_score(expected, predicted, average="macro"), 4),
+        **time_calls(predictor.predict, batches),
+    }
+
+
+def run_distillation(
+    num_layers: int | None = None,
+    output_dir: Path | str | None = None,
+    temperature: float | None = None,
+    alpha: float | None = None,
+    max_epochs: int | None = None,
+    batch_size: int = 32,
+    report_path: Path | str | None = None,
+) -> dict:
+    """
+    Distill the served classifier into a shallower student and compare the two.
+
+    The teacher is the model ``Predictor`` serves (bundle or HF repo). Its logits on the
+    train split are computed once, then the student (a layer-subset copy of the teacher)
+    is trained on them with a KL + cross-entropy loss, exported as a model bundle and
+    evaluated against the teacher on the test split.
+
+    Args:
+        num_layers: Encoder layers of the student (default from settings)
+        output_dir: Student bundle directory (default from settings)
+        temperature: Distillation temperature (default from settings)
+        alpha: Weight of the soft-target loss (default from settings)
+        max_epochs: Training epochs (default from settings)
+        batch_size: Texts per request when measuring latency
+        report_path: Report JSON path (default: distill_report.json in output_dir)
+
+    Returns:
+        Report with teacher and student metrics
+    """
+    pl.seed_everything(settings.SEED)
+    num_layers = num_layers or settings.DISTILL_NUM_LAYERS
+    output_dir = Path(output_dir or settings.DISTILL_OUTPUT_DIR)
+
+    # Load data
+    data_config = DataManagerConfig(
+        data_dir=settings.DATA_DIR,
+        train_file=settings.TRAIN_FILE,
+        val_file=settings.VAL_FILE,
+        test_file=settings.TEST_FILE,
+    )
+    manager = SMSDataManager(data_config)
+    manager.load_all()
+
+    # Teacher
+    teacher = Predictor(backend="torch", precision="fp32")
+    teacher.load()
+    num_classes = len(teacher.id2label)
+
+    def split(name: str) -> tuple[list[str], list[int]]:
+        """Texts with labels re-encoded to the teacher's label ids."""
+        texts, labels = manager.get_texts_and_labels(name)
+        return texts, [teacher.label2id[manager.id2label[label]] for label in labels]
+
+    train_texts, train_labels = split("train")
+    val_texts, val_labels = split("val")
+    test_texts, test_labels = split("test")
+
+    print(f"Computing teacher logits for {len(train_texts)} train texts...")
+    teacher_logits = teacher.predict_logits(train_texts).float().cpu()
+
+    # Student
+    student = build_student(teacher.model, num_layers)
+
+    collate = partial(collate_texts, tokenizer=teacher.tokenizer, max_length=settings.MAX_LENGTH)
+    train_loader = torch.utils.data.DataLoader(
+        DistillationDataset(train_texts, train_labels, teacher_logits),
+        batch_size=settings.BATCH_SIZE,
+        shuffle=True,
+        collate_fn=collate,
+    )
+    val_loader = torch.utils.data.DataLoader(
+        DistillationDataset(val_texts, val_labels),
+        batch_size=settings.BATCH_SIZE,
+        shuffle=False,
+        collate_fn=collate,
+    )
+
+    module = DistillationModule(
+        model=student,
+        config=DistillationConfig(
+            num_classes=num_classes,
+            learning_rate=settings.DISTILL_LEARNING_RATE,
+            temperature=temperature or settings.DISTILL_TEMPERATURE,
+            alpha=settings.DISTILL_ALPHA if alpha is None else alpha,
+        ),
+    )
+
+    # Loggers
+    mlflow_logger = pl.pytorch.loggers.MLFlowLogger(
+        experiment_name=f"{settings.MLFLOW_EXPERIMENT_NAME}-distill",
+        tracking_uri=settings.MLFLOW_TRACKING_URI,
+    )
+
+    # Callbacks
+    checkpoint = pl.pytorch.callbacks.ModelCheckpoint(
+        dirpath="checkpoints/distill",
+        filename="student-{epoch:02d}-{val_f1_weighted:.3f}",
+        monitor="val_f1_weighted",
+        mode="max",
+        save_top_k=1,
+    )
+    callbacks = [
+        pl.pytorch.callbacks.LearningRateMonitor(logging_interval="step"),
+        checkpoint,
+        pl.pytorch.callbacks.EarlyStopping(
+            monitor="val_f1_weighted",
+            mode="max",
+            patience=3,
+            min_delta=0.001,
+        ),
+    ]
+
+    # Trainer
+    trainer = pl.Trainer(
+        max_epochs=max_epochs or settings.MAX_EPOCHS,
+        accelerator="auto",
+        devices="auto",
+        logger=mlflow_logger,
+        callbacks=callbacks,
+    )
+    trainer.fit(module, train_dataloaders=train_loader, val_dataloaders=val_loader)
+
+    if checkpoint.best_model_path:
+        state = torch.load(checkpoint.best_model_path, map_location="cpu", weights_only=False)
+        module.load_state_dict(state["state_dict"])
+
+    # Export
+    student = module.model.cpu().eval()
+    export_student(student, teacher, output_dir, num_layers)
+
+    # Compare with the teacher on the test split
+    expected = [teacher.id2label[label] for label in test_labels]
+    student_predictor = Predictor(backend="torch", precision="fp32", bundle_dir=output_dir)
+    student_predictor.load()
+
+    print("Evaluating teacher and student...")
+    report = {
+        "num_layers": num_layers,
+        "batch_size": batch_size,
+        "teacher": _evaluate(teacher, test_texts, expected, batch_size),
+        "student": _evaluate(student_predictor, test_texts, expected, batch_size),
+    }
+    report["speedup"] = round(
+        report["student"]["throughput_texts_per_s"] / report["teacher"]["throughput_texts_per_s"], 2
+    )
+    report["f1_weighted_delta"] = round(
+        report["student"]["f1_weighted"] - report["teacher"]["f1_weighted"], 4
+    )
+
+    save_report(report, report_path or output_dir / "distill_report.json")
+    return report
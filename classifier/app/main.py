@@ -1,21 +1,43 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
+from prometheus_client import CONTENT_TYPE_LATEST
 
 from .api.router import router as api_router
-from .api.service import classifier_service
+from .api.service import classifier_service, service_collector
 from .config import settings
+from .metrics import ServiceMetricsPublisher, multiprocess_enabled, render_metrics
+from .serve.memory import process_age_seconds
 
 LOG_LEVEL = "debug" if settings.ENVIRONMENT == "dev" else "info"
 
 
+async def publish_service_metrics() -> None:
+    """Periodically share this worker's service metrics with the other workers."""
+    publisher = ServiceMetricsPublisher(service_collector)
+    while True:
+        publisher.publish()
+        await asyncio.sleep(settings.METRICS_PUBLISH_SECONDS)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Load ML model on startup."""
+    """Load ML model, start the batching scheduler and background warmup on startup."""
+    import_seconds = process_age_seconds()
     print("Loading classification model...")
     classifier_service.load()
+    await classifier_service.start()
+    classifier_service.report_startup(import_seconds)
+    publish_task = None
+    if multiprocess_enabled():
+        publish_task = asyncio.create_task(publish_service_metrics())
     yield
+    if publish_task is not None:
+        publish_task.cancel()
+    await classifier_service.stop()
 
 
 app = FastAPI(
@@ -42,7 +64,17 @@ async def read_root():
 
 @app.get("/health", tags=["Health Check"])
 async def health_check():
-    return classifier_service.get_health_status()
+    health = classifier_service.get_health_status()
+    if health.status != "healthy":
+        # Not ready for traffic until warmup finishes
+        return JSONResponse(status_code=503, content=health.model_dump())
+    return health
+
+
+@app.get("/metrics", tags=["Health Check"])
+def metrics():
+    """Per-stage latency histograms and service counters in Prometheus text format."""
+    return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
 
 
 if __name__ == "__main__":
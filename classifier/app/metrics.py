@@ -0,0 +1,188 @@
+import os
+
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+# Latency buckets from 0.5 ms to 10 s
+_LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)  # fmt: skip
+
+QUEUE_WAIT_SECONDS = Histogram(
+    "classifier_queue_wait_seconds",
+    "Time texts wait before their forward pass starts",
+    ["stage"],
+    buckets=_LATENCY_BUCKETS,
+)
+TOKENIZE_SECONDS = Histogram(
+    "classifier_tokenize_seconds",
+    "Tokenization time per chunk of texts",
+    buckets=_LATENCY_BUCKETS,
+)
+FORWARD_SECONDS = Histogram(
+    "classifier_forward_seconds",
+    "Model forward time per (sub-)batch",
+    buckets=_LATENCY_BUCKETS,
+)
+POSTPROCESS_SECONDS = Histogram(
+    "classifier_postprocess_seconds",
+    "Time to turn probabilities into response items",
+    buckets=_LATENCY_BUCKETS,
+)
+BATCH_SIZE = Histogram(
+    "classifier_batch_size",
+    "Texts per forward pass",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256),
+)
+PADDING_RATIO = Histogram(
+    "classifier_padding_ratio",
+    "Share of padding tokens per forward pass",
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0),
+)
+INFLIGHT_REQUESTS = Gauge(
+    "classifier_inflight_requests",
+    "Prediction requests currently being processed",
+    multiprocess_mode="livesum",
+)
+
+
+def multiprocess_enabled() -> bool:
+    """Whether metrics are shared between worker processes (python -m app.serve)."""
+    return "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+
+def render_metrics() -> bytes:
+    """Metrics of this process, or of all worker processes in multiprocess mode."""
+    if not multiprocess_enabled():
+        return generate_latest()
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
+
+
+class ServiceCollector:
+    """
+    Scrape-time metrics read from the classifier service state.
+
+    Cache, executor and startup counters already exist on the service, so they are
+    read when /metrics is scraped instead of being updated on every request.
+
+    Args:
+        service: ``ClassifierService`` instance
+    """
+
+    def __init__(self, service):
+        self.service = service
+
+    def collect(self):
+        service = self.service
+
+        load = GaugeMetricFamily(
+            "classifier_model_load_seconds", "Startup time per stage", labels=["stage"]
+        )
+        for stage, seconds in service.startup_timings.items():
+            load.add_metric([stage], seconds)
+        yield load
+
+        yield GaugeMetricFamily(
+            "classifier_model_ready", "Model loaded and warmed up", value=float(service.ready)
+        )
+
+        if service.executor is not None:
+            yield GaugeMetricFamily(
+                "classifier_queue_pending_texts",
+                "Texts admitted to the inference queue and not finished",
+                value=service.executor.pending,
+            )
+
+        if service.cache is not None:
+            stats = service.cache.stats()
+            lookups = CounterMetricFamily(
+                "classifier_cache_lookups", "Prediction cache lookups by result", labels=["result"]
+            )
+            for result in ("hits", "misses", "coalesced", "deduplicated"):
+                lookups.add_metric([result], getattr(stats, result))
+            yield lookups
+            yield GaugeMetricFamily(
+                "classifier_cache_hit_rate",
+                "Share of texts that skipped a forward pass",
+                value=stats.hit_rate,
+            )
+            yield GaugeMetricFamily("classifier_cache_size", "Cached predictions", value=stats.size)
+
+        if service.neardup is not None:
+            stats = service.neardup.stats()
+            yield CounterMetricFamily(
+                "classifier_neardup_lookups", "Near-duplicate index lookups", value=stats.lookups
+            )
+            yield CounterMetricFamily(
+                "classifier_neardup_short_circuited",
+                "Texts answered from a near-duplicate",
+                value=stats.short_circuited,
+            )
+
+        if service.cascade is not None:
+            texts = CounterMetricFamily(
+                "classifier_cascade_texts", "Cascade texts by outcome", labels=["outcome"]
+            )
+            for outcome in ("accepted", "escalated", "fallback"):
+                texts.add_metric([outcome], service.cascade_counts[outcome])
+            yield texts
+
+
+class ServiceMetricsPublisher:
+    """
+    Copies scrape-time service metrics into multiprocess metric files.
+
+    A scrape reaches only one worker, so in multiprocess mode every worker publishes its
+    ``ServiceCollector`` samples periodically. Counters are summed over workers (including
+    exited ones, so totals never go down); gauges are reported per live worker with a
+    ``pid`` label.
+
+    Args:
+        collector: ``ServiceCollector`` of this worker
+    """
+
+    def __init__(self, collector: ServiceCollector):
+        self.collector = collector
+        self._metrics: dict[str, Counter | Gauge] = {}
+        self._published: dict[tuple, float] = {}
+
+    def publish(self) -> None:
+        for family in self.collector.collect():
+            for sample in family.samples:
+                metric = self._metric(family, tuple(sample.labels))
+                child = metric.labels(**sample.labels) if sample.labels else metric
+                if family.type != "counter":
+                    child.set(sample.value)
+                    continue
+
+                # Counters only move forward: add what changed since the last publish
+                key = (sample.name, tuple(sorted(sample.labels.items())))
+                delta = sample.value - self._published.get(key, 0.0)
+                if delta > 0:
+                    child.inc(delta)
+                self._published[key] = sample.value
+
+    def _metric(self, family, labelnames: tuple[str, ...]) -> Counter | Gauge:
+        if family.name not in self._metrics:
+            # registry=None: only the multiprocess collector reads these
+            if family.type == "counter":
+                metric = Counter(family.name, family.documentation, labelnames, registry=None)
+            else:
+                metric = Gauge(
+                    family.name,
+                    family.documentation,
+                    labelnames,
+                    registry=None,
+                    multiprocess_mode="liveall",
+                )
+            self._metrics[family.name] = metric
+        return self._metrics[family.name]
@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+
+import torch
+from torch import nn
+
+from .loss import distillation_loss
+from .module import ModuleConfig, SMSClassificationModule
+
+
+@dataclass
+class DistillationConfig:
+    """Configuration for DistillationModule."""
+
+    num_classes: int = 13
+    learning_rate: float = 5e-5
+    temperature: float = 2.0
+    alpha: float = 0.7
+    scheduler_eta_min: float = 1e-7
+
+
+class DistillationModule(SMSClassificationModule):
+    """
+    Lightning module training a student classifier on the teacher's soft logits.
+
+    Training batches carry precomputed teacher logits; validation and test use the
+    plain cross-entropy metrics of ``SMSClassificationModule``.
+
+    Args:
+        model: Student HF sequence classifier
+        config: Distillation configuration
+    """
+
+    def __init__(self, model: nn.Module, config: DistillationConfig):
+        super().__init__(
+            model=model,
+            config=ModuleConfig(
+                num_classes=config.num_classes,
+                learning_rate=config.learning_rate,
+                scheduler_eta_min=config.scheduler_eta_min,
+            ),
+        )
+        self.temperature = config.temperature
+        self.alpha = config.alpha
+
+    def forward(self, inputs) -> torch.Tensor:
+        """Forward pass through the student."""
+        return self.model(**inputs).logits
+
+    def training_step(self, batch) -> torch.Tensor:
+        inputs, targets, teacher_logits = batch
+        logits = self.forward(inputs)
+        loss = distillation_loss(logits, teacher_logits, targets, self.temperature, self.alpha)
+
+        self.log("train_loss", loss, prog_bar=True, logger=True, on_step=True, on_epoch=True)
+        return loss
@@ -76,3 +76,36 @@ class FocalLoss(nn.Module):
         if self.reduction == "sum":
             return focal_loss.sum()
         return focal_loss
+
+
+def distillation_loss(
+    student_logits: torch.Tensor,
+    teacher_logits: torch.Tensor,
+    targets: torch.Tensor,
+    temperature: float = 2.0,
+    alpha: float = 0.7,
+) -> torch.Tensor:
+    """
+    Knowledge-distillation loss: KL to the teacher's softened distribution plus hard-label CE.
+
+    Args:
+        student_logits: Student logits [batch_size, num_classes]
+        teacher_logits: Teacher logits [batch_size, num_classes]
+        targets: Ground truth labels [batch_size]
+        temperature: Softmax temperature for both distributions
+        alpha: Weight of the soft (teacher) term; 1 - alpha goes to the hard labels
+
+    Returns:
+        Combined loss
+    """
+    soft_loss = tf.kl_div(
+        tf.log_softmax(student_logits / temperature, dim=1),
+        tf.log_softmax(teacher_logits / temperature, dim=1),
+        reduction="batchmean",
+        log_target=True,
+    )
+    # Scale by T^2 so soft-target gradients keep their magnitude as T grows
+    soft_loss = soft_loss * temperature**2
+    hard_loss = tf.cross_entropy(student_logits, targets)
+
+    return alpha * soft_loss + (1 - alpha) * hard_loss
@@ -0,0 +1,262 @@
+import time
+from pathlib import Path
+
+import torch
+from torch import nn
+
+
+class TorchBackend:
+    """
+    Eager PyTorch forward pass returning fp32 logits.
+
+    Args:
+        model: Loaded HF classifier (optionally dynamically quantized)
+        autocast_dtype: Run the forward under autocast with this dtype (e.g. bfloat16)
+    """
+
+    name = "torch"
+
+    def __init__(self, model: nn.Module, autocast_dtype: torch.dtype | None = None):
+        self.model = model
+        self.autocast_dtype = autocast_dtype
+
+    def __call__(self, inputs: dict[str, torch.Tensor]) -> torch.Tensor:
+        if self.autocast_dtype is None:
+            return self.model(**inputs).logits
+
+        device_type = next(iter(inputs.values())).device.type
+        with torch.autocast(device_type=device_type, dtype=self.autocast_dtype):
+            return self.model(**inputs).logits.float()
+
+
+def quantize_dynamic_int8(model: nn.Module) -> nn.Module:
+    """Quantize Linear layers to INT8 with dynamic activation quantization (CPU only)."""
+    return torch.ao.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+
+
+class _LogitsOnly(nn.Module):
+    """Wrap a HF classifier so it takes positional tensors and returns bare logits."""
+
+    def __init__(self, model: nn.Module, input_names: list[str]):
+        super().__init__()
+        self.model = model
+        self.input_names = input_names
+
+    def forward(self, *args: torch.Tensor) -> torch.Tensor:
+        return self.model(**dict(zip(self.input_names, args, strict=True))).logits
+
+
+class CompiledBackend:
+    """
+    Torch forward compiled for a fixed grid of (batch, seq_len) shape buckets.
+
+    Incoming batches are padded up to the nearest bucket, so once ``warmup()`` has run
+    every request hits an already compiled graph. Batches larger than the biggest
+    bucket fall back to the eager forward.
+
+    Args:
+        eager: Eager backend over the loaded model
+        mode: "inductor" (torch.compile) or "trace" (one torch.jit.trace per bucket)
+        input_names: Tokenizer input names (e.g. input_ids, attention_mask)
+        pad_token_id: Token id used to pad input_ids
+        batch_buckets: Batch sizes to compile
+        seq_buckets: Sequence lengths to compile
+    """
+
+    name = "torch"
+
+    def __init__(
+        self,
+        eager: TorchBackend,
+        mode: str,
+        input_names: list[str],
+        pad_token_id: int,
+        batch_buckets: list[int],
+        seq_buckets: list[int],
+    ):
+        if mode == "trace" and eager.autocast_dtype is not None:
+            raise ValueError("COMPILE_MODE=trace does not support autocast precisions")
+
+        self.eager = eager
+        self.mode = mode
+        self.input_names = input_names
+        self.pad_token_id = pad_token_id
+        self.batch_buckets = sorted(batch_buckets)
+        self.seq_buckets = sorted(seq_buckets)
+        self._wrapped = _LogitsOnly(eager.model, input_names).eval()
+        self._traced: dict[tuple[int, int], torch.jit.ScriptModule] = {}
+
+        if mode == "inductor":
+            # Every bucket is a separate static-shape graph of the same forward
+            _raise_recompile_limit(len(self.batch_buckets) * len(self.seq_buckets))
+            self._compiled = torch.compile(self._wrapped, backend="inductor", dynamic=False)
+        elif mode != "trace":
+            raise ValueError(f"Unknown compile mode: {mode}")
+
+    @property
+    def shapes(self) -> list[tuple[int, int]]:
+        """All (batch, seq_len) buckets."""
+        return [(b, s) for b in self.batch_buckets for s in self.seq_buckets]
+
+    def _bucket(self, batch: int, seq_len: int) -> tuple[int, int] | None:
+        """Smallest bucket that fits the batch, or None if it exceeds the largest one."""
+        b = next((size for size in self.batch_buckets if size >= batch), None)
+        s = next((size for size in self.seq_buckets if size >= seq_len), None)
+        return None if b is None or s is None else (b, s)
+
+    def _pad(self, inputs: dict[str, torch.Tensor], shape: tuple[int, int]) -> list[torch.Tensor]:
+        """Pad every input to the bucket shape (padded rows/positions are masked out)."""
+        padded = []
+        for name in self.input_names:
+            tensor = inputs[name]
+            value = self.pad_token_id if name == "input_ids" else 0
+            out = tensor.new_full(shape, value)
+            out[: tensor.shape[0], : tensor.shape[1]] = tensor
+            padded.append(out)
+        return padded
+
+    def _run(self, shape: tuple[int, int], args: list[torch.Tensor]) -> torch.Tensor:
+        """Run the compiled graph of a bucket (compiling it on first use)."""
+        if self.mode == "trace":
+            fn = self._traced.get(shape)
+            if fn is None:
+                fn = torch.jit.trace(self._wrapped, tuple(args), check_trace=False, strict=False)
+                self._traced[shape] = fn
+            return fn(*args)
+
+        if self.eager.autocast_dtype is None:
+            return self._compiled(*args)
+        with torch.autocast(device_type=args[0].device.type, dtype=self.eager.autocast_dtype):
+            return self._compiled(*args).float()
+
+    def __call__(self, inputs: dict[str, torch.Tensor]) -> torch.Tensor:
+        batch, seq_len = inputs["input_ids"].shape
+        shape = self._bucket(batch, seq_len)
+        if shape is None:
+            return self.eager(inputs)
+        return self._run(shape, self._pad(inputs, shape))[:batch]
+
+    @torch.no_grad()
+    def warmup(self, device: torch.device) -> None:
+        """Compile every shape bucket so no request pays compilation cost."""
+        for batch, seq_len in self.shapes:
+            args = [
+                torch.ones(batch, seq_len, dtype=torch.long, device=device)
+                for _ in self.input_names
+            ]
+            started = time.perf_counter()
+            self._run((batch, seq_len), args)
+            print(f"  Compiled shape ({batch}, {seq_len}) in {time.perf_counter() - started:.2f}s")
+
+
+def _raise_recompile_limit(limit: int) -> None:
+    """Let dynamo keep one graph per shape bucket (the default limit is 8)."""
+    config = torch._dynamo.config
+    name = "recompile_limit" if hasattr(config, "recompile_limit") else "cache_size_limit"
+    setattr(config, name, max(getattr(config, name), limit))
+
+
+def export_onnx(model: nn.Module, path: Path, input_names: list[str], opset: int = 17) -> None:
+    """
+    Export a HF sequence classifier to ONNX with dynamic batch and sequence axes.
+
+    Args:
+        model: Loaded ``AutoModelForSequenceClassification`` in eval mode
+        path: Output .onnx file
+        input_names: Tokenizer input names (e.g. input_ids, attention_mask)
+        opset: ONNX opset version
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    dummy = tuple(torch.ones(2, 16, dtype=torch.long) for _ in input_names)
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    with torch.no_grad():
+        torch.onnx.export(
+            _LogitsOnly(model, input_names).cpu().eval(),
+            dummy,
+            str(path),
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            dynamo=False,
+        )
+    print(f"Model exported to ONNX: {path}")
+
+
+def prepare_onnx(
+    model: nn.Module,
+    onnx_path: Path,
+    input_names: list[str],
+    source: str,
+    opset: int = 17,
+    quantize: bool = False,
+) -> Path:
+    """
+    Export the classifier to ONNX (and quantize it) unless a matching export is cached.
+
+    The export is redone when the source fingerprint (checksum or size/mtime of the
+    weights, opset) changes. Only files are written, so this is safe to run before forking
+    workers; sessions are created by ``OnnxBackend`` in each worker.
+
+    Args:
+        model: Loaded HF classifier used for export
+        onnx_path: Path of the cached .onnx file
+        input_names: Tokenizer input names
+        source: Fingerprint of the source weights; a different value forces a re-export
+        opset: ONNX opset version
+        quantize: Also produce a dynamically INT8-quantized copy of the export
+
+    Returns:
+        Path of the .onnx file to serve
+    """
+    source_marker = onnx_path.with_suffix(".source")
+    stale = not source_marker.exists() or source_marker.read_text() != source
+    quantized_path = onnx_path.with_suffix(".int8.onnx")
+    if not onnx_path.exists() or stale:
+        export_onnx(model, onnx_path, input_names, opset=opset)
+        quantized_path.unlink(missing_ok=True)
+        source_marker.write_text(source)
+
+    if not quantize:
+        return onnx_path
+    if not quantized_path.exists():
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        quantize_dynamic(onnx_path, quantized_path, weight_type=QuantType.QInt8)
+        print(f"ONNX model quantized to INT8: {quantized_path}")
+    return quantized_path
+
+
+class OnnxBackend:
+    """
+    onnxruntime CPU session over an exported classifier (see ``prepare_onnx``).
+
+    Args:
+        onnx_path: .onnx file to serve
+        num_threads: Intra-op threads for the session (None = onnxruntime default)
+    """
+
+    name = "onnx"
+
+    def __init__(self, onnx_path: Path, num_threads: int | None = None):
+        try:
+            import onnxruntime as ort
+        except ImportError as e:
+            raise RuntimeError("onnxruntime is required for INFERENCE_BACKEND=onnx") from e
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+
+        self.session = ort.InferenceSession(
+            str(onnx_path), options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = [i.name for i in self.session.get_inputs()]
+
+    def __call__(self, inputs: dict[str, torch.Tensor]) -> torch.Tensor:
+        feed = {name: inputs[name].cpu().numpy() for name in self.input_names}
+        (logits,) = self.session.run(["logits"], feed)
+        return torch.from_numpy(logits)
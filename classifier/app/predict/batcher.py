@@ -0,0 +1,187 @@
+import asyncio
+import contextlib
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..metrics import QUEUE_WAIT_SECONDS
+
+# Rough chars-per-token ratio for Cyrillic SMS text with a BPE tokenizer
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str, max_length: int) -> int:
+    """Cheap token count estimate used for batch budgeting (no tokenizer call)."""
+    return min(max_length, len(text) // CHARS_PER_TOKEN + 2)
+
+
+@dataclass
+class _PendingRequest:
+    """Texts of a single caller waiting to be merged into a batch."""
+
+    texts: list[str]
+    future: asyncio.Future
+    max_tokens: int
+    profile: bool = False
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class MicroBatcher:
+    """
+    Asyncio scheduler merging texts from concurrent requests into shared forward passes.
+
+    Requests are never split: a merged batch always holds whole requests, and a single
+    request larger than the limits runs on its own.
+
+    Args:
+        predict_fn: Coroutine function mapping a list of texts and a profile flag to
+            per-text results (a list or a tensor with one row per text)
+        max_concurrency: Max merged batches running at once (one per inference lane)
+        max_batch_size: Max number of texts in one merged batch
+        max_batch_tokens: Max padded tokens (texts x longest text) in one merged batch
+        max_wait_ms: Max time the oldest queued request waits for others to join
+        max_length: Tokenizer truncation length used by the token estimate
+    """
+
+    def __init__(
+        self,
+        predict_fn: Callable[[list[str]], Awaitable[Any]],
+        max_concurrency: int = 1,
+        max_batch_size: int = 64,
+        max_batch_tokens: int = 16384,
+        max_wait_ms: float = 5.0,
+        max_length: int = 256,
+    ):
+        self.predict_fn = predict_fn
+        self.max_concurrency = max_concurrency
+        self.max_batch_size = max_batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.max_wait = max_wait_ms / 1000
+        self.max_length = max_length
+
+        self._queue: asyncio.Queue[_PendingRequest] | None = None
+        self._worker: asyncio.Task | None = None
+        self._carry: _PendingRequest | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._running: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        """Start the background batching loop on the running event loop."""
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the batching loop and fail requests that are still queued."""
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+        pending = [self._carry] if self._carry else []
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for request in pending:
+            if not request.future.done():
+                request.future.set_exception(RuntimeError("Batcher stopped"))
+        self._carry = None
+        self._queue = None
+
+    async def submit(self, texts: list[str], profile: bool = False) -> Any:
+        """
+        Queue texts and wait for their slice of the merged batch results.
+
+        A merged batch is profiled when any of its requests asks for it.
+        """
+        if self._queue is None:
+            raise RuntimeError("Batcher not started. Call start() first.")
+
+        future = asyncio.get_running_loop().create_future()
+        max_tokens = max(estimate_tokens(text, self.max_length) for text in texts)
+        self._queue.put_nowait(
+            _PendingRequest(texts=texts, future=future, max_tokens=max_tokens, profile=profile)
+        )
+        return await future
+
+    def _fits(self, size: int, longest: int, request: _PendingRequest) -> bool:
+        """Check whether a request can join a batch without exceeding the limits."""
+        new_size = size + len(request.texts)
+        new_longest = max(longest, request.max_tokens)
+        return new_size <= self.max_batch_size and new_size * new_longest <= self.max_batch_tokens
+
+    async def _collect(self) -> list[_PendingRequest]:
+        """Wait for the first request, then gather more until a limit or the deadline."""
+        first = self._carry or await self._queue.get()
+        self._carry = None
+
+        batch = [first]
+        size, longest = len(first.texts), first.max_tokens
+        deadline = first.enqueued_at + self.max_wait
+
+        while size < self.max_batch_size:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                # Deadline passed: take only what is already queued
+                if self._queue.empty():
+                    break
+                request = self._queue.get_nowait()
+            else:
+                try:
+                    request = await asyncio.wait_for(self._queue.get(), timeout)
+                except TimeoutError:
+                    break
+
+            if not self._fits(size, longest, request):
+                self._carry = request
+                break
+
+            batch.append(request)
+            size += len(request.texts)
+            longest = max(longest, request.max_tokens)
+
+        return batch
+
+    async def _execute(self, batch: list[_PendingRequest]) -> None:
+        """Run one merged forward pass and scatter results to callers."""
+        dispatched_at = time.perf_counter()
+        for request in batch:
+            QUEUE_WAIT_SECONDS.labels(stage="batcher").observe(dispatched_at - request.enqueued_at)
+
+        try:
+            texts = [text for request in batch for text in request.texts]
+            profile = any(request.profile for request in batch)
+            try:
+                results = await self.predict_fn(texts, profile)
+            except Exception as e:
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+                return
+
+            offset = 0
+            for request in batch:
+                end = offset + len(request.texts)
+                if not request.future.done():
+                    request.future.set_result(results[offset:end])
+                offset = end
+        finally:
+            self._slots.release()
+
+    async def _run(self) -> None:
+        """Batching loop: wait for a free slot, collect a batch, dispatch it."""
+        while True:
+            # Collect only when a lane is free, so queued requests keep merging meanwhile
+            await self._slots.acquire()
+            batch = await self._collect()
+            batch = [request for request in batch if not request.future.done()]
+            if not batch:
+                self._slots.release()
+                continue
+
+            task = asyncio.create_task(self._execute(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
@@ -0,0 +1,45 @@
+from collections.abc import Sequence
+
+
+def plan_buckets(lengths: Sequence[int], max_tokens: int, max_size: int) -> list[list[int]]:
+    """
+    Group text indices into length-sorted sub-batches.
+
+    Indices are sorted by tokenized length, so every sub-batch is padded only to its own
+    longest text. A sub-batch is closed once adding the next text would exceed the padded
+    token budget (texts x longest length) or the size cap.
+
+    Args:
+        lengths: Tokenized length of every text
+        max_tokens: Max padded tokens per sub-batch
+        max_size: Max texts per sub-batch
+
+    Returns:
+        List of sub-batches, each a list of indices into ``lengths``
+    """
+    order = sorted(range(len(lengths)), key=lengths.__getitem__)
+
+    buckets: list[list[int]] = []
+    current: list[int] = []
+    for idx in order:
+        # Lengths are ascending, so the new text is the longest in the bucket
+        padded = (len(current) + 1) * lengths[idx]
+        if current and (padded > max_tokens or len(current) >= max_size):
+            buckets.append(current)
+            current = []
+        current.append(idx)
+
+    if current:
+        buckets.append(current)
+    return buckets
+
+
+def padded_tokens(lengths: Sequence[int], buckets: Sequence[Sequence[int]]) -> int:
+    """Count tokens fed to the model (including padding) for a sub-batch plan."""
+    return sum(len(bucket) * max(lengths[i] for i in bucket) for bucket in buckets if bucket)
+
+
+def padding_ratio(lengths: Sequence[int], buckets: Sequence[Sequence[int]]) -> float:
+    """Share of padding tokens among all tokens fed to the model."""
+    total = padded_tokens(lengths, buckets)
+    return 1 - sum(lengths) / total if total else 0.0
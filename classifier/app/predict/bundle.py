@@ -0,0 +1,144 @@
+import hashlib
+import json
+import shutil
+from datetime import UTC, datetime
+from pathlib import Path
+
+import torch
+from huggingface_hub import hf_hub_download
+from transformers import AutoTokenizer
+
+MANIFEST_NAME = "manifest.json"
+WEIGHTS_FILES = ["model.safetensors", "config.json"]
+LABELS_NAME = "id2label.json"
+
+
+class BundleError(Exception):
+    """Raised when a model bundle is missing files or fails checksum verification."""
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_manifest(bundle_dir: Path) -> dict | None:
+    """Read the bundle manifest, or return None if the directory is not a bundle."""
+    path = Path(bundle_dir) / MANIFEST_NAME
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def verify_bundle(bundle_dir: Path) -> dict:
+    """
+    Check that every file listed in the manifest exists and matches its checksum.
+
+    Returns:
+        The manifest
+
+    Raises:
+        BundleError: If the manifest is missing or a file is missing/corrupted
+    """
+    bundle_dir = Path(bundle_dir)
+    manifest = read_manifest(bundle_dir)
+    if manifest is None:
+        raise BundleError(f"No {MANIFEST_NAME} in {bundle_dir}")
+
+    for name, meta in manifest["files"].items():
+        path = bundle_dir / name
+        if not path.exists():
+            raise BundleError(f"Bundle file missing: {path}")
+        if _sha256(path) != meta["sha256"]:
+            raise BundleError(f"Checksum mismatch: {path}")
+
+    return manifest
+
+
+def write_manifest(bundle_dir: Path, version: str, **metadata) -> dict:
+    """
+    Checksum every file in a bundle directory and write its manifest.
+
+    Args:
+        bundle_dir: Directory holding the bundle files
+        version: Model version served from the bundle
+        **metadata: Extra manifest fields (repo, tokenizer, teacher, ...)
+
+    Returns:
+        The written manifest
+    """
+    bundle_dir = Path(bundle_dir)
+    files = {
+        path.name: {"sha256": _sha256(path), "size": path.stat().st_size}
+        for path in sorted(bundle_dir.iterdir())
+        if path.is_file() and path.name != MANIFEST_NAME
+    }
+    manifest = {
+        "version": version,
+        **metadata,
+        "created_at": datetime.now(UTC).isoformat(),
+        "files": files,
+    }
+    (bundle_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
+
+
+def build_bundle(
+    output_dir: Path,
+    repo_id: str,
+    tokenizer_name: str,
+    token: str | None = None,
+    revision: str | None = None,
+) -> dict:
+    """
+    Build a self-contained model bundle that loads with zero network calls.
+
+    The bundle holds the weights, model config, tokenizer files, ``id2label.json`` and a
+    manifest with the version and a sha256 checksum per file.
+
+    Args:
+        output_dir: Bundle directory (created or overwritten)
+        repo_id: HF repo with model.safetensors, config.json and id2label.pt
+        tokenizer_name: HF name of the tokenizer
+        token: HF token
+        revision: Optional repo revision
+
+    Returns:
+        The written manifest
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    commit = "unknown"
+    for filename in [*WEIGHTS_FILES, "id2label.pt"]:
+        print(f"  Downloading {filename}...")
+        cached = Path(
+            hf_hub_download(repo_id=repo_id, filename=filename, token=token, revision=revision)
+        )
+        # HF cache layout: .../snapshots/<commit>/<filename>
+        commit = cached.parent.name
+        if filename == "id2label.pt":
+            id2label = torch.load(cached, weights_only=False, map_location="cpu")
+            labels = {str(int(k)): v for k, v in id2label.items()}
+            (output_dir / LABELS_NAME).write_text(
+                json.dumps(labels, ensure_ascii=False, indent=2), encoding="utf-8"
+            )
+        else:
+            shutil.copyfile(cached, output_dir / filename)
+
+    print(f"  Saving tokenizer {tokenizer_name}...")
+    AutoTokenizer.from_pretrained(tokenizer_name, token=token).save_pretrained(output_dir)
+
+    manifest = write_manifest(
+        output_dir,
+        version=f"{repo_id}@{commit}",
+        repo_id=repo_id,
+        revision=commit,
+        tokenizer=tokenizer_name,
+    )
+
+    print(f"Model bundle saved to {output_dir} ({manifest['version']})")
+    return manifest
@@ -0,0 +1,176 @@
+import asyncio
+import hashlib
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+def normalize_text(text: str) -> str:
+    """Normalize unicode form and whitespace so trivially different copies share a key."""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+def cache_key(text: str, model_version: str) -> str:
+    """Content-addressed key: (normalized text hash, model version)."""
+    digest = hashlib.blake2b(normalize_text(text).encode("utf-8"), digest_size=16).hexdigest()
+    return f"{model_version}:{digest}"
+
+
+@dataclass
+class CacheStats:
+    """Prediction cache counters."""
+
+    size: int
+    max_size: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    coalesced: int
+    deduplicated: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses + self.coalesced + self.deduplicated
+        return (lookups - self.misses) / lookups if lookups else 0.0
+
+
+class PredictionCache:
+    """
+    Bounded per-text prediction cache with LRU eviction, TTL and in-flight coalescing.
+
+    Duplicates inside one request are computed once, and a text already being computed
+    by another request waits for that computation instead of starting its own
+    (singleflight). Must be used from a single event loop.
+
+    Args:
+        max_size: Max number of cached predictions
+        ttl_seconds: Time after which a cached prediction expires
+    """
+
+    def __init__(self, max_size: int = 50_000, ttl_seconds: float = 600.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.deduplicated = 0
+        self.evictions = 0
+
+    def _get(self, key: str) -> tuple[bool, Any]:
+        """Look up a live entry and mark it as recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return False, None
+
+        self._entries.move_to_end(key)
+        return True, value
+
+    def _put(self, key: str, value: Any) -> None:
+        """Store an entry, evicting the least recently used ones over the size cap."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _complete(self, keys: list[str], task: asyncio.Task) -> None:
+        """Store computed values and wake every request waiting on them."""
+        futures = [self._inflight.pop(key) for key in keys]
+
+        if task.cancelled():
+            error: BaseException | None = RuntimeError("Prediction cancelled")
+        else:
+            error = task.exception()
+
+        if error is not None:
+            for future in futures:
+                future.set_exception(error)
+            return
+
+        for key, future, value in zip(keys, futures, task.result(), strict=True):
+            self._put(key, value)
+            future.set_result(value)
+
+    async def resolve(
+        self,
+        texts: list[str],
+        model_version: str,
+        compute: Callable[[list[str]], Awaitable[list[Any]]],
+    ) -> list[Any]:
+        """
+        Return a prediction per text, computing only texts not cached or in flight.
+
+        Args:
+            texts: Input texts (may contain duplicates)
+            model_version: Model identifier included in the cache key
+            compute: Coroutine function predicting a list of unique texts
+
+        Returns:
+            Predictions in input order
+        """
+        keys = [cache_key(text, model_version) for text in texts]
+
+        values: dict[str, Any] = {}
+        waiting: dict[str, asyncio.Future] = {}
+        missing: dict[str, str] = {}
+
+        for key, text in zip(keys, texts, strict=True):
+            if key in values or key in waiting or key in missing:
+                self.deduplicated += 1
+                continue
+
+            found, value = self._get(key)
+            if found:
+                self.hits += 1
+                values[key] = value
+            elif key in self._inflight:
+                self.coalesced += 1
+                waiting[key] = self._inflight[key]
+            else:
+                self.misses += 1
+                missing[key] = text
+
+        if missing:
+            loop = asyncio.get_running_loop()
+            missing_keys = list(missing)
+            for key in missing_keys:
+                waiting[key] = self._inflight[key] = loop.create_future()
+
+            # Computation outlives this request, so coalesced waiters are not cancelled with it
+            task = asyncio.ensure_future(compute(list(missing.values())))
+            task.add_done_callback(lambda t: self._complete(missing_keys, t))
+
+        if waiting:
+            results = await asyncio.gather(*(asyncio.shield(f) for f in waiting.values()))
+            values.update(zip(waiting, results, strict=True))
+
+        return [values[key] for key in keys]
+
+    def clear(self) -> None:
+        """Drop all cached predictions."""
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Snapshot of cache counters."""
+        return CacheStats(
+            size=len(self._entries),
+            max_size=self.max_size,
+            ttl_seconds=self.ttl_seconds,
+            hits=self.hits,
+            misses=self.misses,
+            coalesced=self.coalesced,
+            deduplicated=self.deduplicated,
+            evictions=self.evictions,
+        )
@@ -0,0 +1,132 @@
+from pathlib import Path
+
+import joblib
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+
+
+class CascadeNotFoundError(Exception):
+    """Raised when the linear cascade model file is not found."""
+
+
+def calibrate_thresholds(
+    probs: np.ndarray,
+    labels: np.ndarray,
+    target_accuracy: float,
+    min_support: int = 20,
+) -> np.ndarray:
+    """
+    Pick the lowest confidence threshold per predicted class that holds a target accuracy.
+
+    For every class, validation texts predicted as that class are sorted by confidence;
+    the threshold is the lowest confidence at which the texts accepted so far are still
+    at least ``target_accuracy`` correct. Classes that cannot reach the target with
+    ``min_support`` accepted texts always escalate (threshold above 1).
+
+    Args:
+        probs: Predicted probabilities [n_texts, n_classes]
+        labels: True class indices [n_texts]
+        target_accuracy: Min accuracy of accepted texts per class
+        min_support: Min number of accepted validation texts for a usable threshold
+
+    Returns:
+        Threshold per class
+    """
+    preds = probs.argmax(axis=1)
+    confidences = probs.max(axis=1)
+    thresholds = np.full(probs.shape[1], np.inf)
+
+    for cls in range(probs.shape[1]):
+        mask = preds == cls
+        order = np.argsort(-confidences[mask])
+        correct = (labels[mask] == cls)[order]
+        accuracy = np.cumsum(correct) / np.arange(1, len(correct) + 1)
+        passing = np.flatnonzero(accuracy >= target_accuracy)
+        passing = passing[passing + 1 >= min_support]
+        if len(passing):
+            thresholds[cls] = confidences[mask][order][passing[-1]]
+
+    return thresholds
+
+
+class LinearCascade:
+    """
+    TF-IDF + logistic regression first stage of the classifier cascade.
+
+    Texts whose confidence clears the threshold of their predicted class are answered
+    by the linear model; the rest are escalated to BERT.
+
+    Args:
+        pipeline: Fitted sklearn pipeline (TF-IDF + classifier)
+        thresholds: Confidence threshold per class (in ``pipeline.classes_`` order)
+    """
+
+    def __init__(self, pipeline: Pipeline, thresholds: np.ndarray | None = None):
+        self.pipeline = pipeline
+        self.classes: list[str] = [str(c) for c in pipeline.classes_]
+        self.thresholds = (
+            np.full(len(self.classes), np.inf) if thresholds is None else np.asarray(thresholds)
+        )
+
+    @classmethod
+    def fit(cls, texts: list[str], labels: list[str]) -> "LinearCascade":
+        """Train the TF-IDF + logistic regression pipeline on labelled texts."""
+        pipeline = Pipeline(
+            [
+                (
+                    "tfidf",
+                    TfidfVectorizer(
+                        analyzer="char_wb",
+                        ngram_range=(2, 5),
+                        min_df=2,
+                        max_features=200_000,
+                        sublinear_tf=True,
+                    ),
+                ),
+                ("clf", LogisticRegression(C=10.0, max_iter=2000, class_weight="balanced")),
+            ]
+        )
+        pipeline.fit(texts, labels)
+        return cls(pipeline)
+
+    def calibrate(
+        self,
+        texts: list[str],
+        labels: list[str],
+        target_accuracy: float,
+        min_support: int = 20,
+    ) -> None:
+        """Calibrate per-class thresholds on a held-out split."""
+        index = {label: i for i, label in enumerate(self.classes)}
+        y = np.array([index.get(label, -1) for label in labels])
+        self.thresholds = calibrate_thresholds(
+            self.predict_proba(texts), y, target_accuracy, min_support
+        )
+
+    def predict_proba(self, texts: list[str]) -> np.ndarray:
+        """Class probabilities [n_texts, n_classes] in ``classes`` order."""
+        return self.pipeline.predict_proba(texts)
+
+    def accept(self, probs: np.ndarray) -> np.ndarray:
+        """Boolean mask of texts confident enough to skip BERT."""
+        preds = probs.argmax(axis=1)
+        return probs.max(axis=1) >= self.thresholds[preds]
+
+    def save(self, path: Path) -> None:
+        """Save pipeline and thresholds with joblib."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump({"pipeline": self.pipeline, "thresholds": self.thresholds}, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "LinearCascade":
+        """Load a cascade saved by ``save()``."""
+        path = Path(path)
+        if not path.exists():
+            raise CascadeNotFoundError(
+                f"Cascade model not found: {path}. Train it with: python -m app.cascade"
+            )
+        data = joblib.load(path)
+        return cls(data["pipeline"], data["thresholds"])
@@ -0,0 +1,137 @@
+import asyncio
+import math
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any
+
+import torch
+
+from ..metrics import QUEUE_WAIT_SECONDS
+
+
+class OverloadedError(Exception):
+    """Raised when the inference queue cannot admit a request."""
+
+    def __init__(self, message: str, retry_after: int, status_code: int = 429):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.status_code = status_code
+
+
+def available_cpus() -> int:
+    """Number of CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def configure_torch_threads(lanes: int, intra_op_threads: int | None = None) -> int:
+    """
+    Split CPU cores between inference lanes so concurrent forwards do not oversubscribe.
+
+    Must run before the first forward pass: torch only accepts the inter-op setting once.
+
+    Args:
+        lanes: Number of concurrent forward passes
+        intra_op_threads: Threads per forward (default: available CPUs / lanes)
+
+    Returns:
+        Intra-op thread count in use
+    """
+    threads = intra_op_threads or max(1, available_cpus() // lanes)
+    torch.set_num_threads(threads)
+    try:
+        # Lanes already provide request-level parallelism
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass
+    return threads
+
+
+class InferenceExecutor:
+    """
+    Dedicated thread pool for forward passes with bounded admission.
+
+    Admission counts texts that are queued or running. A request is rejected with 429
+    when the queue is full, or with 503 when its estimated wait (from a moving average of
+    per-text service time) exceeds its budget.
+
+    Args:
+        lanes: Number of forward passes that may run concurrently
+        max_queue: Max number of admitted texts (queued or running)
+        wait_budget_ms: Default max estimated queue wait of a request
+    """
+
+    def __init__(self, lanes: int = 1, max_queue: int = 2000, wait_budget_ms: float = 10_000):
+        self.lanes = lanes
+        self.max_queue = max_queue
+        self.wait_budget = wait_budget_ms / 1000
+
+        self._pool = ThreadPoolExecutor(max_workers=lanes, thread_name_prefix="inference")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._seconds_per_text = 0.0
+
+    @property
+    def pending(self) -> int:
+        """Texts admitted and not finished yet."""
+        return self._pending
+
+    def estimated_wait(self) -> float:
+        """Estimated seconds until the currently admitted texts are processed."""
+        return self._pending * self._seconds_per_text / self.lanes
+
+    @contextmanager
+    def admit(self, n_texts: int, budget_ms: float | None = None) -> Iterator[None]:
+        """Reserve queue capacity for a request, or raise OverloadedError."""
+        budget = self.wait_budget if budget_ms is None else budget_ms / 1000
+
+        with self._lock:
+            wait = self.estimated_wait()
+            retry_after = max(1, math.ceil(wait))
+            if self._pending + n_texts > self.max_queue:
+                raise OverloadedError("Inference queue is full", retry_after, status_code=429)
+            if wait > budget:
+                raise OverloadedError(
+                    f"Estimated wait {wait:.2f}s exceeds budget {budget:.2f}s",
+                    retry_after,
+                    status_code=503,
+                )
+            self._pending += n_texts
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._pending -= n_texts
+
+    def _observe(self, n_texts: int, seconds: float) -> None:
+        """Update the moving average of per-text service time."""
+        per_text = seconds / max(1, n_texts)
+        with self._lock:
+            if self._seconds_per_text == 0.0:
+                self._seconds_per_text = per_text
+            else:
+                self._seconds_per_text = 0.8 * self._seconds_per_text + 0.2 * per_text
+
+    async def run(self, fn: Callable[[list[str]], Any], texts: list[str]) -> Any:
+        """Run a blocking forward function on an inference lane."""
+        queued_at = time.perf_counter()
+
+        def timed() -> Any:
+            started = time.perf_counter()
+            QUEUE_WAIT_SECONDS.labels(stage="executor").observe(started - queued_at)
+            result = fn(texts)
+            self._observe(len(texts), time.perf_counter() - started)
+            return result
+
+        return await asyncio.get_running_loop().run_in_executor(self._pool, timed)
+
+    def shutdown(self) -> None:
+        """Stop the lanes after running forwards finish."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
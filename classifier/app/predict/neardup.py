@@ -0,0 +1,206 @@
+import hashlib
+import re
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from .cache import normalize_text
+
+SIGNATURE_BITS = 64
+
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+_URL_RE = re.compile(
+    r"(?:https?://|www\.)\S+|\b[\w-]+(?:\.[\w-]+)*\.(?:ru|рф|su|com|net|org|info|me|io|cc|ly)"
+    r"\b(?:/\S*)?",
+    re.IGNORECASE,
+)
+_PHONE_RE = re.compile(r"\+?\d[\d\s()-]{8,}\d")
+_NUMBER_RE = re.compile(r"\d+(?:[.,]\d+)*")
+_BIT_MASKS = np.uint64(1) << np.arange(SIGNATURE_BITS, dtype=np.uint64)
+
+
+def canonicalize(text: str) -> str:
+    """Mask e-mails, URLs, phone numbers and other digits so template copies look the same."""
+    text = normalize_text(text).lower()
+    text = _EMAIL_RE.sub(" <email> ", text)
+    text = _URL_RE.sub(" <url> ", text)
+    text = _PHONE_RE.sub(" <phone> ", text)
+    text = _NUMBER_RE.sub("<num>", text)
+    return " ".join(text.split())
+
+
+def simhash(text: str, shingle_size: int = 4) -> int:
+    """64-bit SimHash over character shingles: similar texts differ in few bits."""
+    if len(text) <= shingle_size:
+        shingles = [text]
+    else:
+        shingles = [text[i : i + shingle_size] for i in range(len(text) - shingle_size + 1)]
+
+    hashes = np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+            for s in shingles
+        ),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    votes = ((hashes[:, None] & _BIT_MASKS) != 0).sum(axis=0) * 2 - len(shingles)
+    return sum(1 << int(bit) for bit in np.flatnonzero(votes > 0))
+
+
+def similarity(a: int, b: int) -> float:
+    """Share of equal bits between two signatures."""
+    return 1 - (a ^ b).bit_count() / SIGNATURE_BITS
+
+
+@dataclass
+class NearDupStats:
+    """Near-duplicate pre-filter counters."""
+
+    size: int
+    max_size: int
+    threshold: float
+    lookups: int
+    short_circuited: int
+    audited: int
+    audit_agreed: int
+    disagreements: list[dict] = field(default_factory=list)
+
+    @property
+    def short_circuit_rate(self) -> float:
+        return self.short_circuited / self.lookups if self.lookups else 0.0
+
+    @property
+    def audit_agreement(self) -> float | None:
+        return self.audit_agreed / self.audited if self.audited else None
+
+
+class NearDupIndex:
+    """
+    In-memory LSH index of recently classified texts keyed by SimHash signature.
+
+    Signatures are split into ``bands`` equal parts and a text is compared only with
+    entries sharing at least one band, so any entry within ``bands - 1`` differing bits
+    is guaranteed to be a candidate. A stored prediction is reused when the signature
+    similarity clears ``threshold``. Must be used from a single event loop.
+
+    Args:
+        threshold: Min signature similarity (share of equal bits) to reuse a prediction
+        max_size: Max number of indexed signatures (LRU)
+        ttl_seconds: Time after which an indexed prediction expires
+        bands: Number of LSH bands (must divide 64)
+        min_length: Canonical texts shorter than this are not looked up
+        max_disagreements: Number of recent audit disagreements kept for inspection
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        max_size: int = 20_000,
+        ttl_seconds: float = 600.0,
+        bands: int = 8,
+        min_length: int = 20,
+        max_disagreements: int = 20,
+    ):
+        if SIGNATURE_BITS % bands:
+            raise ValueError(f"bands must divide {SIGNATURE_BITS}")
+
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.bands = bands
+        self.min_length = min_length
+        self._band_bits = SIGNATURE_BITS // bands
+        self._entries: OrderedDict[int, tuple[float, Any]] = OrderedDict()
+        self._buckets: list[dict[int, set[int]]] = [{} for _ in range(bands)]
+
+        self.lookups = 0
+        self.short_circuited = 0
+        self.audited = 0
+        self.audit_agreed = 0
+        self.disagreements: deque[dict] = deque(maxlen=max_disagreements)
+
+    def signature(self, text: str) -> int | None:
+        """SimHash of the canonical text, or None if it is too short to match safely."""
+        canonical = canonicalize(text)
+        if len(canonical) < self.min_length:
+            return None
+        return simhash(canonical)
+
+    def _band_keys(self, signature: int) -> list[int]:
+        mask = (1 << self._band_bits) - 1
+        return [(signature >> (i * self._band_bits)) & mask for i in range(self.bands)]
+
+    def _remove(self, signature: int) -> None:
+        del self._entries[signature]
+        for band, key in zip(self._buckets, self._band_keys(signature), strict=True):
+            members = band[key]
+            members.discard(signature)
+            if not members:
+                del band[key]
+
+    def lookup(self, signature: int) -> Any | None:
+        """Return the prediction of the most similar live entry above the threshold."""
+        self.lookups += 1
+        candidates: set[int] = set()
+        for band, key in zip(self._buckets, self._band_keys(signature), strict=True):
+            candidates.update(band.get(key, ()))
+
+        now = time.monotonic()
+        best, best_similarity = None, self.threshold
+        for candidate in candidates:
+            if self._entries[candidate][0] < now:
+                self._remove(candidate)
+                continue
+            score = similarity(signature, candidate)
+            if score >= best_similarity:
+                best, best_similarity = candidate, score
+
+        if best is None:
+            return None
+
+        self._entries.move_to_end(best)
+        self.short_circuited += 1
+        return self._entries[best][1]
+
+    def add(self, signature: int, value: Any) -> None:
+        """Index a prediction, evicting the least recently used entries over the size cap."""
+        if signature not in self._entries:
+            for band, key in zip(self._buckets, self._band_keys(signature), strict=True):
+                band.setdefault(key, set()).add(signature)
+        self._entries[signature] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(signature)
+
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+
+    def record_audit(self, text: str, reused_label_id: int, model_label_id: int) -> None:
+        """Record whether a short-circuited text got the label the model would give."""
+        self.audited += 1
+        if reused_label_id == model_label_id:
+            self.audit_agreed += 1
+        else:
+            self.disagreements.append(
+                {"text": text, "reused_label_id": reused_label_id, "model_label_id": model_label_id}
+            )
+
+    def clear(self) -> None:
+        """Drop all indexed predictions."""
+        self._entries.clear()
+        self._buckets = [{} for _ in range(self.bands)]
+
+    def stats(self) -> NearDupStats:
+        """Snapshot of pre-filter counters."""
+        return NearDupStats(
+            size=len(self._entries),
+            max_size=self.max_size,
+            threshold=self.threshold,
+            lookups=self.lookups,
+            short_circuited=self.short_circuited,
+            audited=self.audited,
+            audit_agreed=self.audit_agreed,
+            disagreements=list(self.disagreements),
+        )
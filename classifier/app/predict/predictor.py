@@ -1,10 +1,28 @@
+import copy
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
 import torch
 from huggingface_hub import hf_hub_download
-from transformers import AutoModelForSequenceClassification, AutoTokenizer
+from transformers import AutoModelForSequenceClassification, AutoTokenizer, BatchEncoding
 
 from ..config import settings
+from ..metrics import BATCH_SIZE, FORWARD_SECONDS, PADDING_RATIO, TOKENIZE_SECONDS
+from .backends import (
+    CompiledBackend,
+    OnnxBackend,
+    TorchBackend,
+    prepare_onnx,
+    quantize_dynamic_int8,
+)
+from .bucketing import plan_buckets
+from .bundle import LABELS_NAME, read_manifest, verify_bundle
 
 
 class ModelNotFoundError(Exception):
@@ -19,22 +37,90 @@ class Predictor:
     """
     Predictor for SMS classification using BERT.
 
-    Loads model from HuggingFace Hub.
+    Loads model from a local model bundle (zero network calls) when one exists in
+    ``MODEL_BUNDLE_DIR``, otherwise from HuggingFace Hub.
+
+    Args:
+        bucketing: Run length-sorted sub-batches instead of one padded batch
+            (default from settings)
+        backend: Inference backend, "torch" or "onnx" (default from settings)
+        precision: Numeric mode, "fp32", "bf16" or "int8" (default from settings)
+        bundle_dir: Model bundle directory (default from settings)
     """
 
-    def __init__(self):
-        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    def __init__(
+        self,
+        bucketing: bool | None = None,
+        backend: str | None = None,
+        precision: str | None = None,
+        bundle_dir: Path | None = None,
+    ):
+        self.bucketing = settings.BUCKETING_ENABLED if bucketing is None else bucketing
+        self.backend_name = backend or settings.INFERENCE_BACKEND
+        self.precision = precision or settings.PRECISION
+        self.bundle_dir = Path(bundle_dir or settings.MODEL_BUNDLE_DIR)
+        # ONNX Runtime and dynamic INT8 kernels run on CPU only
+        if self.backend_name == "onnx" or self.precision == "int8":
+            self.device = torch.device("cpu")
+        else:
+            self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         self.model = None
+        self.backend: TorchBackend | CompiledBackend | OnnxBackend | None = None
+        self._onnx_file: Path | None = None
         self.tokenizer = None
         self.id2label: dict[int, str] = {}
         self.label2id: dict[str, int] = {}
         self._hf_paths: dict[str, str] = {}
+        self.manifest: dict | None = None
+        self._tokenizer_source: str = settings.PRETRAINED_MODEL
+        self.startup_timings: dict[str, float] = {}
+        self._local = threading.local()
+        self._tokenize_pool: ThreadPoolExecutor | None = None
+        self._tokenize_pool_lock = threading.Lock()
+
+    @contextmanager
+    def _timed(self, stage: str) -> Iterator[None]:
+        """Record the duration of a startup stage in seconds."""
+        started = time.perf_counter()
+        yield
+        self.startup_timings[stage] = round(time.perf_counter() - started, 3)
 
-    def load(self) -> None:
-        """Load model and label encoder from HuggingFace."""
-        self._ensure_weights()
-        self._load_label_encoder()
+    def load(self, build_backend: bool = True) -> None:
+        """
+        Load model and label encoder from the local bundle or HuggingFace.
+
+        Args:
+            build_backend: Also create the inference backend. ``python -m app.serve`` loads
+                without it before forking and calls ``build_backend()`` in every worker,
+                since onnxruntime sessions and compiled graphs do not survive a fork.
+        """
+        with self._timed("resolve_files"):
+            if not self._use_bundle(self.bundle_dir):
+                self._ensure_weights()
+        with self._timed("label_encoder"):
+            self._load_label_encoder()
         self._load_model()
+        if build_backend:
+            self.build_backend()
+
+    def _use_bundle(self, bundle_dir: Path) -> bool:
+        """Point file resolution at a local model bundle if the directory holds one."""
+        self.manifest = read_manifest(bundle_dir)
+        if self.manifest is None:
+            if settings.MODEL_OFFLINE:
+                raise ModelNotFoundError(
+                    f"No model bundle in {bundle_dir}. Build one with: python -m app.bundle build"
+                )
+            return False
+
+        if settings.MODEL_BUNDLE_VERIFY:
+            verify_bundle(bundle_dir)
+
+        for filename in self.manifest["files"]:
+            self._hf_paths[filename] = str(bundle_dir / filename)
+        self._tokenizer_source = str(bundle_dir)
+        print(f"Using model bundle {bundle_dir} ({self.manifest['version']})")
+        return True
 
     def _resolve_file(self, filename: str) -> Path | None:
         """Find file in HF cache paths."""
@@ -57,11 +143,15 @@ class Predictor:
         print("All model files ready (from cache or downloaded).")
 
     def _load_label_encoder(self) -> None:
-        """Load label encoder from id2label.pt."""
-        id2label_path = self._resolve_file("id2label.pt")
+        """Load label encoder from id2label.json (bundle) or id2label.pt (HF repo)."""
+        json_path = self._resolve_file(LABELS_NAME)
+        id2label_path = json_path or self._resolve_file("id2label.pt")
 
         if id2label_path is not None:
-            id2label = torch.load(id2label_path, weights_only=False, map_location="cpu")
+            if json_path is not None:
+                id2label = json.loads(json_path.read_text(encoding="utf-8"))
+            else:
+                id2label = torch.load(id2label_path, weights_only=False, map_location="cpu")
             self.id2label = {int(k): v for k, v in id2label.items()}
             self.label2id = {v: k for k, v in self.id2label.items()}
             print(f"Label encoder loaded from {id2label_path} ({len(self.id2label)} classes)")
@@ -70,64 +160,293 @@ class Predictor:
         raise LabelEncoderNotFoundError("Label encoder not found. Expected id2label.pt in HF repo.")
 
     def _load_model(self) -> None:
-        """Load model from HuggingFace cache directory."""
+        """Load model from the bundle or HuggingFace cache directory."""
         config_path = self._resolve_file("config.json")
         model_dir = str(config_path.parent)
 
-        self.model = AutoModelForSequenceClassification.from_pretrained(
-            model_dir,
-            id2label=self.id2label,
-            label2id=self.label2id,
-            local_files_only=True,
+        with self._timed("weights"):
+            self.model = AutoModelForSequenceClassification.from_pretrained(
+                model_dir,
+                id2label=self.id2label,
+                label2id=self.label2id,
+                local_files_only=True,
+            )
+            self.model.to(self.device)
+            self.model.eval()
+
+        with self._timed("tokenizer"):
+            self.tokenizer = AutoTokenizer.from_pretrained(
+                self._tokenizer_source, local_files_only=self.manifest is not None
+            )
+        with self._timed("prepare_backend"):
+            self._prepare_backend()
+
+        print(
+            f"Model loaded in HuggingFace format "
+            f"({self.backend_name} backend, {self.precision} precision)."
         )
-        self.model.to(self.device)
-        self.model.eval()
 
-        self.tokenizer = AutoTokenizer.from_pretrained(settings.PRETRAINED_MODEL)
+    def _prepare_backend(self) -> None:
+        """Fork-safe backend setup: INT8 quantization of the weights or the ONNX export."""
+        self._onnx_file = None
+        if self.backend_name == "torch":
+            if self.precision == "int8":
+                self.model = quantize_dynamic_int8(self.model)
+            return
 
-        print("Model loaded in HuggingFace format.")
+        if self.backend_name == "onnx":
+            if self.precision == "bf16":
+                raise ValueError("bf16 precision is not supported by the onnx backend")
+            if settings.COMPILE_MODE != "none":
+                raise ValueError("COMPILE_MODE is only supported by the torch backend")
+            self._onnx_file = prepare_onnx(
+                self.model,
+                onnx_path=Path(settings.ONNX_PATH),
+                input_names=list(self.tokenizer.model_input_names),
+                source=self._weights_fingerprint(),
+                opset=settings.ONNX_OPSET,
+                quantize=self.precision == "int8",
+            )
+            return
 
-    @torch.no_grad()
-    def predict(self, texts: list[str]) -> list[dict]:
-        """Predict classes for input texts."""
-        if self.model is None or self.tokenizer is None:
-            raise RuntimeError("Model not loaded. Call load() first.")
+        raise ValueError(f"Unknown inference backend: {self.backend_name}")
+
+    def build_backend(self) -> None:
+        """Create the inference backend (sessions, compiled graphs) in this process."""
+        with self._timed("backend"):
+            self.backend = self._create_backend()
+
+    def _create_backend(self) -> TorchBackend | CompiledBackend | OnnxBackend:
+        """Create the configured inference backend over the loaded model."""
+        if self.backend_name == "torch":
+            autocast_dtype = torch.bfloat16 if self.precision == "bf16" else None
+            backend = TorchBackend(self.model, autocast_dtype=autocast_dtype)
+            if settings.COMPILE_MODE == "none":
+                return backend
 
-        inputs = self.tokenizer(
-            texts,
-            padding=True,
-            truncation=True,
-            max_length=settings.MAX_LENGTH,
-            return_tensors="pt",
+            return CompiledBackend(
+                backend,
+                mode=settings.COMPILE_MODE,
+                input_names=list(self.tokenizer.model_input_names),
+                pad_token_id=self.tokenizer.pad_token_id,
+                batch_buckets=settings.COMPILE_BATCH_BUCKETS,
+                seq_buckets=settings.COMPILE_SEQ_BUCKETS,
+            )
+
+        backend = OnnxBackend(
+            self._onnx_file, num_threads=settings.ONNX_NUM_THREADS or torch.get_num_threads()
         )
-        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+        # The ORT session holds its own copy of the weights
+        self.model = None
+        return backend
+
+    def _weights_fingerprint(self) -> str:
+        """Identify the exact weights served, so exports of older weights are not reused."""
+        weights = self._resolve_file("model.safetensors")
+        if self.manifest is not None and "model.safetensors" in self.manifest["files"]:
+            content = self.manifest["files"]["model.safetensors"]["sha256"]
+        elif weights is not None and weights.exists():
+            # Hashing the whole file on every start is slow; size and mtime change on rewrite
+            stat = weights.stat()
+            content = f"{stat.st_size}:{stat.st_mtime_ns}"
+        else:
+            content = "unknown"
+        return f"{weights}:{content}:opset{settings.ONNX_OPSET}"
+
+    def _thread_tokenizer(self):
+        """Per-thread tokenizer copy: fast tokenizers fail when mutated concurrently."""
+        tokenizer = getattr(self._local, "tokenizer", None)
+        if tokenizer is None:
+            tokenizer = self._local.tokenizer = copy.deepcopy(self.tokenizer)
+        return tokenizer
+
+    def _tokenize(self, texts: list[str]) -> BatchEncoding:
+        """Tokenize texts without padding (padding is applied per sub-batch)."""
+        with TOKENIZE_SECONDS.time():
+            return self._thread_tokenizer()(texts, truncation=True, max_length=settings.MAX_LENGTH)
+
+    def _forward_encoded(self, encoded: BatchEncoding) -> torch.Tensor:
+        """
+        Run tokenized texts through the model and return logits in input order.
+
+        With bucketing, texts run in length-sorted sub-batches; otherwise as one batch
+        padded to the longest text.
+        """
+        lengths = [len(ids) for ids in encoded["input_ids"]]
+        if self.bucketing:
+            buckets = plan_buckets(lengths, settings.BUCKET_MAX_TOKENS, settings.BUCKET_MAX_SIZE)
+        else:
+            buckets = [list(range(len(lengths)))]
+
+        tokenizer = self._thread_tokenizer()
+        logits = torch.empty(len(lengths), len(self.id2label), device=self.device)
+        for bucket in buckets:
+            features = [{k: encoded[k][i] for k in encoded} for i in bucket]
+            inputs = tokenizer.pad(features, padding=True, return_tensors="pt")
+            BATCH_SIZE.observe(len(bucket))
+            PADDING_RATIO.observe(1 - sum(lengths[i] for i in bucket) / inputs["input_ids"].numel())
 
-        outputs = self.model(**inputs)
-        logits = outputs.logits
+            inputs = {k: v.to(self.device) for k, v in inputs.items()}
+            with FORWARD_SECONDS.time():
+                logits[torch.tensor(bucket, device=self.device)] = self.backend(inputs)
 
-        probs = torch.softmax(logits, dim=1)
+        return logits
+
+    def _check_loaded(self) -> None:
+        """Raise if load() has not been called."""
+        if self.backend is None or self.tokenizer is None:
+            raise RuntimeError("Model not loaded. Call load() first.")
+
+    @torch.no_grad()
+    def predict_logits(self, texts: list[str], pipeline: bool | None = None) -> torch.Tensor:
+        """
+        Return raw logits [n_texts, n_classes] in input order.
+
+        Args:
+            texts: Texts to classify
+            pipeline: Overlap tokenization with the forward pass for inputs larger than
+                PIPELINE_CHUNK_SIZE; defaults to PIPELINE_ENABLED
+        """
+        self._check_loaded()
+
+        if pipeline is None:
+            pipeline = settings.PIPELINE_ENABLED
+        chunk_size = settings.PIPELINE_CHUNK_SIZE
+        if pipeline and len(texts) > chunk_size:
+            chunks = (texts[i : i + chunk_size] for i in range(0, len(texts), chunk_size))
+            return torch.cat(list(self.logits_stream(chunks)))
+
+        return self._forward_encoded(self._tokenize(texts))
+
+    def logits_stream(self, chunks: Iterable[list[str]]) -> Iterator[torch.Tensor]:
+        """
+        Yield logits per chunk, tokenizing upcoming chunks while the model runs.
+
+        Tokenization runs on a thread pool (the fast tokenizer releases the GIL) and at
+        most ``PIPELINE_DEPTH`` tokenized chunks wait for the forward stage, so memory
+        stays bounded for arbitrarily long inputs.
+
+        Args:
+            chunks: Iterable of text lists (consumed lazily)
+
+        Yields:
+            Logits [len(chunk), n_classes] for every chunk, in order
+        """
+        self._check_loaded()
+        # Inference lanes call this concurrently: create the shared pool only once
+        with self._tokenize_pool_lock:
+            if self._tokenize_pool is None:
+                self._tokenize_pool = ThreadPoolExecutor(
+                    max_workers=settings.PIPELINE_TOKENIZER_THREADS, thread_name_prefix="tokenize"
+                )
+
+        chunks = iter(chunks)
+        pending: deque[Future] = deque()
+
+        def refill() -> None:
+            while len(pending) < settings.PIPELINE_DEPTH:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    return
+                pending.append(self._tokenize_pool.submit(self._tokenize, chunk))
+
+        refill()
+        while pending:
+            encoded = pending.popleft().result()
+            refill()
+            with torch.no_grad():
+                logits = self._forward_encoded(encoded)
+            yield logits
+
+    def predict_proba(self, texts: list[str], pipeline: bool | None = None) -> torch.Tensor:
+        """Return class probabilities [n_texts, n_classes] on CPU in input order."""
+        return torch.softmax(self.predict_logits(texts, pipeline).float(), dim=1).cpu()
+
+    def format_predictions(
+        self,
+        texts: list[str],
+        probs: torch.Tensor,
+        return_probabilities: bool = False,
+        top_k: int | None = None,
+    ) -> list[dict]:
+        """
+        Turn a probability matrix into per-text result dicts.
+
+        All tensor work is done in bulk: one ``.tolist()`` per output instead of one
+        ``.item()`` per element.
+
+        Args:
+            texts: Input texts
+            probs: Probabilities [n_texts, n_classes]
+            return_probabilities: Include a label -> probability dict per text
+            top_k: Include the k most probable classes per text
+
+        Returns:
+            List of result dicts in input order
+        """
+        # Labels are picked on raw probabilities; only the returned values are rounded
         confidences, pred_ids = torch.max(probs, dim=1)
+        confidences = torch.round(confidences, decimals=4).tolist()
+        pred_ids = pred_ids.tolist()
+
+        labels = [self.id2label[j] for j in range(len(self.id2label))]
+        rows = torch.round(probs, decimals=4).tolist() if return_probabilities else None
+        if top_k:
+            top_scores, top_ids = torch.topk(probs, k=min(top_k, len(labels)), dim=1)
+            top_scores = torch.round(top_scores, decimals=4).tolist()
+            top_ids = top_ids.tolist()
 
         results = []
         for i, text in enumerate(texts):
-            pred_id = pred_ids[i].item()
-
-            probabilities = {
-                self.id2label[j]: round(probs[i, j].item(), 4) for j in range(len(self.id2label))
+            result = {
+                "text": text,
+                "label": labels[pred_ids[i]],
+                "label_id": pred_ids[i],
+                "confidence": confidences[i],
             }
-
-            results.append(
-                {
-                    "text": text,
-                    "label": self.id2label[pred_id],
-                    "label_id": pred_id,
-                    "confidence": round(confidences[i].item(), 4),
-                    "probabilities": probabilities,
-                }
-            )
+            if rows is not None:
+                result["probabilities"] = dict(zip(labels, rows[i], strict=True))
+            if top_k:
+                result["top_k"] = [
+                    {"label": labels[j], "label_id": j, "score": score}
+                    for j, score in zip(top_ids[i], top_scores[i], strict=True)
+                ]
+            results.append(result)
 
         return results
 
+    def predict(
+        self,
+        texts: list[str],
+        return_probabilities: bool = False,
+        top_k: int | None = None,
+    ) -> list[dict]:
+        """Predict classes for input texts."""
+        probs = self.predict_proba(texts)
+        return self.format_predictions(texts, probs, return_probabilities, top_k)
+
+    def warmup(self) -> None:
+        """
+        Pay one-off setup costs before serving: compile every shape bucket (compiled mode)
+        and run a small forward pass.
+        """
+        if isinstance(self.backend, CompiledBackend):
+            with self._timed("compile"):
+                self.backend.warmup(self.device)
+        with self._timed("warmup"):
+            self.predict_proba(["Прогрев модели", "Скидка 50% на все товары до конца месяца"])
+
+    @property
+    def model_version(self) -> str:
+        """Identifier of the served weights and numeric mode (used as cache namespace)."""
+        if self.manifest is not None:
+            version = self.manifest["version"]
+        else:
+            weights = self._resolve_file("model.safetensors")
+            revision = weights.parent.name if weights is not None else "unknown"
+            version = f"{settings.HF_REPO_ID}@{revision}"
+        return f"{version}/{self.backend_name}-{self.precision}"
+
     def get_model_path(self) -> str:
         """Return path to model weights."""
         return str(self._resolve_file("model.safetensors") or "unknown")
@@ -0,0 +1,152 @@
+import os
+import random
+import threading
+import time
+import tracemalloc
+from collections import deque
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import torch
+from torch.profiler import ProfilerActivity, profile, record_function
+
+
+class RequestProfiler:
+    """
+    Records sampled forward passes with torch.profiler and tracemalloc.
+
+    Every profiled pass writes a Chrome trace (``<name>.trace.json``, open it in
+    chrome://tracing or Perfetto) and a text summary with the top operators and Python
+    allocations (``<name>.summary.txt``). Both profilers are process-wide, so only one
+    pass is profiled at a time; a pass sampled while another one is being recorded runs
+    unprofiled.
+
+    Args:
+        output_dir: Directory for trace and summary files
+        sample_rate: Share of forward passes profiled without being requested
+        record_memory: Also trace Python allocations with tracemalloc
+        max_files: Number of most recent profiles kept on disk
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        sample_rate: float = 0.0,
+        record_memory: bool = True,
+        max_files: int = 50,
+    ):
+        self.output_dir = Path(output_dir)
+        self.sample_rate = sample_rate
+        self.record_memory = record_memory
+        self.max_files = max_files
+
+        self._lock = threading.Lock()
+        self.armed = 0
+        self.profiled = 0
+        self.skipped = 0
+        self.recent: deque[dict] = deque(maxlen=20)
+
+    def arm(self, count: int) -> None:
+        """Profile the next ``count`` forward passes regardless of the sample rate."""
+        self.armed += count
+
+    def should_profile(self, requested: bool = False) -> bool:
+        """Decide whether a forward pass is profiled (requested, armed or sampled)."""
+        if requested:
+            return True
+        if self.armed > 0:
+            self.armed -= 1
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def run(self, fn: Callable[[list[str]], Any], texts: list[str]) -> Any:
+        """Run ``fn(texts)`` under the profilers, or plainly if a profile is being recorded."""
+        if not self._lock.acquire(blocking=False):
+            self.skipped += 1
+            return fn(texts)
+        try:
+            return self._profile(fn, texts)
+        finally:
+            self._lock.release()
+
+    def _profile(self, fn: Callable[[list[str]], Any], texts: list[str]) -> Any:
+        activities = [ProfilerActivity.CPU]
+        if torch.cuda.is_available():
+            activities.append(ProfilerActivity.CUDA)
+
+        # Keep tracing if it was enabled for the whole process (PYTHONTRACEMALLOC)
+        start_tracemalloc = self.record_memory and not tracemalloc.is_tracing()
+        if start_tracemalloc:
+            tracemalloc.start(10)
+        if self.record_memory:
+            tracemalloc.reset_peak()
+
+        try:
+            started = time.perf_counter()
+            with profile(activities=activities, record_shapes=True, profile_memory=True) as prof:
+                with record_function("predict"):
+                    result = fn(texts)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+            snapshot, peak = None, 0
+            if self.record_memory:
+                snapshot = tracemalloc.take_snapshot()
+                peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            if start_tracemalloc:
+                tracemalloc.stop()
+
+        self._write(prof, snapshot, peak, len(texts), elapsed_ms)
+        return result
+
+    def _write(
+        self,
+        prof: profile,
+        snapshot: tracemalloc.Snapshot | None,
+        peak: int,
+        n_texts: int,
+        elapsed_ms: float,
+    ) -> None:
+        """Write the Chrome trace and the text summary, then drop the oldest profiles."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.profiled += 1
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{self.profiled}"
+        trace_path = self.output_dir / f"{name}.trace.json"
+        summary_path = self.output_dir / f"{name}.summary.txt"
+
+        prof.export_chrome_trace(str(trace_path))
+
+        sort_by = "self_cuda_time_total" if torch.cuda.is_available() else "self_cpu_time_total"
+        lines = [
+            f"texts: {n_texts}, elapsed: {elapsed_ms:.1f} ms",
+            "",
+            "== torch.profiler: top operators ==",
+            prof.key_averages().table(sort_by=sort_by, row_limit=25),
+        ]
+        if snapshot is not None:
+            lines += ["", f"== tracemalloc: peak {peak / 2**20:.2f} MB, top allocations =="]
+            lines += [str(stat) for stat in snapshot.statistics("lineno")[:25]]
+        summary_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        self.recent.append(
+            {
+                "name": name,
+                "texts": n_texts,
+                "elapsed_ms": round(elapsed_ms, 2),
+                "peak_python_mb": round(peak / 2**20, 2) if snapshot is not None else None,
+                "trace": str(trace_path),
+                "summary": str(summary_path),
+            }
+        )
+        self._prune()
+        print(f"Profiled forward pass of {n_texts} texts: {trace_path}")
+
+    def _prune(self) -> None:
+        """Keep only the ``max_files`` most recent profiles."""
+        traces = sorted(self.output_dir.glob("*.trace.json"), key=lambda p: p.stat().st_mtime)
+        for trace in traces[: max(0, len(traces) - self.max_files)]:
+            trace.unlink(missing_ok=True)
+            trace.with_name(trace.name.replace(".trace.json", ".summary.txt")).unlink(
+                missing_ok=True
+            )
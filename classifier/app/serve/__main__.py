@@ -0,0 +1,31 @@
+import argparse
+import os
+from pathlib import Path
+
+from ..config import settings
+
+
+def enable_multiprocess_metrics() -> None:
+    """Aggregate metrics over workers; must run before prometheus_client is imported."""
+    default = str(settings.METRICS_MULTIPROC_DIR)
+    path = Path(os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", default))
+    path.mkdir(parents=True, exist_ok=True)
+    # Files of a previous run would be added to the new totals
+    for stale in path.glob("*.db"):
+        stale.unlink()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="python -m app.serve", description="Multi-process classifier serving"
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    workers = parser.parse_args().workers or settings.SERVE_WORKERS
+
+    if workers > 1:
+        enable_multiprocess_metrics()
+
+    # Imported after the metrics mode is chosen: prometheus_client reads it on import
+    from .serve import run_workers
+
+    run_workers(workers)
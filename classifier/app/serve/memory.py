@@ -0,0 +1,60 @@
+import os
+
+_SMAPS_FIELDS = {
+    "Rss": "rss",
+    "Pss": "pss",
+    "Shared_Clean": "shared_clean",
+    "Shared_Dirty": "shared_dirty",
+    "Private_Clean": "private_clean",
+    "Private_Dirty": "private_dirty",
+}
+
+
+def read_memory_usage(pid: int | str = "self") -> dict[str, float]:
+    """
+    Read resident memory of a process split into shared and private pages (MiB).
+
+    PSS (proportional set size) divides shared pages between the processes mapping them,
+    so summing PSS over worker processes gives their real combined footprint.
+
+    Returns:
+        Dict with rss, pss, shared and private MiB (empty if /proc is unavailable)
+    """
+    values = dict.fromkeys(_SMAPS_FIELDS.values(), 0)
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", encoding="utf-8") as f:
+            for line in f:
+                name, _, rest = line.partition(":")
+                if name in _SMAPS_FIELDS:
+                    values[_SMAPS_FIELDS[name]] = int(rest.split()[0])
+    except OSError:
+        return {}
+
+    to_mb = 1 / 1024
+    return {
+        "rss_mb": round(values["rss"] * to_mb, 1),
+        "pss_mb": round(values["pss"] * to_mb, 1),
+        "shared_mb": round((values["shared_clean"] + values["shared_dirty"]) * to_mb, 1),
+        "private_mb": round((values["private_clean"] + values["private_dirty"]) * to_mb, 1),
+    }
+
+
+def process_cpus() -> list[int]:
+    """CPU cores this process is pinned to."""
+    try:
+        return sorted(os.sched_getaffinity(0))
+    except AttributeError:
+        return list(range(os.cpu_count() or 1))
+
+
+def process_age_seconds() -> float | None:
+    """Seconds since this process started (None if /proc is unavailable)."""
+    try:
+        with open("/proc/self/stat", encoding="utf-8") as f:
+            # Fields after the parenthesized command name; starttime is field 22
+            start_ticks = int(f.read().rpartition(")")[2].split()[19])
+        with open("/proc/uptime", encoding="utf-8") as f:
+            uptime = float(f.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return round(uptime - start_ticks / os.sysconf("SC_CLK_TCK"), 3)
@@ -0,0 +1,113 @@
+import gc
+import os
+import signal
+import socket
+import sys
+
+import torch
+import uvicorn
+from prometheus_client import multiprocess
+
+from ..api.service import classifier_service
+from ..config import settings
+from ..main import LOG_LEVEL, app
+from ..metrics import multiprocess_enabled
+from .memory import process_cpus, read_memory_usage
+
+
+def split_cores(cores: list[int], workers: int) -> list[list[int]]:
+    """Split cores into one contiguous group per worker (cores are reused if too few)."""
+    if workers >= len(cores):
+        return [[cores[i % len(cores)]] for i in range(workers)]
+
+    per_worker = len(cores) // workers
+    return [cores[i * per_worker : (i + 1) * per_worker] for i in range(workers)]
+
+
+def _bind_socket() -> socket.socket:
+    """Bind the listening socket once in the parent so all workers accept on it."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((settings.HOST, settings.PORT))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(index: int, cores: list[int], sock: socket.socket) -> None:
+    """Pin the forked worker to its cores and serve the app on the shared socket."""
+    os.sched_setaffinity(0, cores)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+    # lifespan re-runs load(): it keeps the inherited weights, resizes torch threads and
+    # builds the inference backend in this process
+    print(f"Worker {index} (pid {os.getpid()}) on cores {cores}: {read_memory_usage()}")
+    server = uvicorn.Server(uvicorn.Config(app, log_level=LOG_LEVEL))
+    server.run(sockets=[sock])
+
+
+def run_workers(workers: int | None = None) -> None:
+    """
+    Load the model once, then fork workers that share its read-only weight pages.
+
+    The parent never runs a forward pass, so weights stay untouched copy-on-write pages
+    and N workers cost roughly one model's worth of RAM. Each worker is pinned to its own
+    subset of cores with a matching torch thread count.
+
+    Args:
+        workers: Number of worker processes (default from settings)
+    """
+    workers = workers or settings.SERVE_WORKERS
+    core_groups = split_cores(process_cpus(), workers)
+    sock = _bind_socket()
+
+    # A single thread keeps OpenMP from starting a thread pool that forked children inherit
+    torch.set_num_threads(1)
+    # Weights only: onnxruntime sessions and compiled graphs are built in each worker
+    classifier_service.load(configure_threads=False, build_backend=False)
+    print(f"Model loaded in parent (pid {os.getpid()}): {read_memory_usage()}")
+
+    # Move loaded objects out of GC tracking so collections in workers do not copy pages
+    gc.collect()
+    gc.freeze()
+
+    children: dict[int, int] = {}
+    stopping = False
+
+    def spawn(index: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            try:
+                _run_worker(index, core_groups[index], sock)
+            finally:
+                os._exit(0)
+        children[pid] = index
+
+    def shutdown(signum: int, _frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            os.kill(pid, signum)
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    for index in range(workers):
+        spawn(index)
+
+    while children:
+        try:
+            pid, exit_status = os.wait()
+        except ChildProcessError:
+            break
+        index = children.pop(pid, None)
+        if multiprocess_enabled():
+            # Drop live gauges of the exited worker; its counters stay in the totals
+            multiprocess.mark_process_dead(pid)
+        if index is not None and not stopping:
+            print(f"Worker {index} (pid {pid}) exited with {exit_status}, restarting")
+            spawn(index)
+
+    sock.close()
+    sys.exit(0)
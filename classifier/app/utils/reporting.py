@@ -0,0 +1,50 @@
+import json
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0..100)."""
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(q / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def time_calls(fn: Callable[[list[str]], object], batches: list[list[str]]) -> dict:
+    """Call ``fn`` on every batch and summarize latency (ms) and throughput (texts/s)."""
+    latencies = []
+    started = time.perf_counter()
+    for batch in batches:
+        t0 = time.perf_counter()
+        fn(batch)
+        latencies.append((time.perf_counter() - t0) * 1000)
+    elapsed = time.perf_counter() - started
+
+    return summarize_latencies(latencies, sum(len(b) for b in batches), elapsed)
+
+
+def summarize_latencies(latencies: list[float], num_texts: int, elapsed: float) -> dict:
+    """Latency stats (ms) of a run and its throughput (texts/s)."""
+    return {
+        "latency_mean_ms": round(statistics.fmean(latencies), 3),
+        "latency_p50_ms": round(percentile(latencies, 50), 3),
+        "latency_p99_ms": round(percentile(latencies, 99), 3),
+        "throughput_texts_per_s": round(num_texts / elapsed, 1),
+    }
+
+
+def chunked(texts: list[str], size: int) -> list[list[str]]:
+    """Split texts into consecutive batches of ``size``."""
+    return [texts[i : i + size] for i in range(0, len(texts), size)]
+
+
+def save_report(report: dict, output: Path | str | None) -> None:
+    """Print a report and optionally save it as JSON."""
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if output is not None:
+        path = Path(output)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"Report saved to {path}")
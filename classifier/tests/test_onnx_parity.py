@@ -0,0 +1,48 @@
+import pytest
+
+pytest.importorskip("onnxruntime")
+pytest.importorskip("onnx")
+torch = pytest.importorskip("torch")
+
+from app.bench.common import synthetic_sms_texts  # noqa: E402
+from app.bench.tiny import build_tiny_bundle  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.predict.predictor import Predictor  # noqa: E402
+
+ATOL = 1e-3
+
+
+@pytest.fixture
+def tiny_bundle(tmp_path, monkeypatch):
+    """Tiny random bundle with its ONNX export outside the bundle directory."""
+    bundle_dir = tmp_path / "tiny-model"
+    build_tiny_bundle(bundle_dir, max_length=settings.MAX_LENGTH)
+    monkeypatch.setattr(settings, "MODEL_BUNDLE_DIR", bundle_dir)
+    monkeypatch.setattr(settings, "MODEL_OFFLINE", True)
+    monkeypatch.setattr(settings, "ONNX_PATH", tmp_path / "onnx" / "model.onnx")
+    monkeypatch.setattr(settings, "COMPILE_MODE", "none")
+    return bundle_dir
+
+
+def test_onnx_logits_match_torch(tiny_bundle):
+    texts = synthetic_sms_texts(48, seed=7)
+
+    reference = Predictor(backend="torch", precision="fp32")
+    reference.load()
+    candidate = Predictor(backend="onnx", precision="fp32")
+    candidate.load()
+
+    expected = reference.predict_logits(texts).float().cpu()
+    actual = candidate.predict_logits(texts).float().cpu()
+
+    assert actual.shape == expected.shape
+    torch.testing.assert_close(actual, expected, atol=ATOL, rtol=0)
+
+
+def test_onnx_export_stays_outside_bundle(tiny_bundle):
+    files_before = sorted(path.name for path in tiny_bundle.iterdir())
+
+    Predictor(backend="onnx", precision="fp32").load()
+
+    assert settings.ONNX_PATH.exists()
+    assert sorted(path.name for path in tiny_bundle.iterdir()) == files_before